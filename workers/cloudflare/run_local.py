@@ -28,6 +28,11 @@ load_dotenv()
 import httpx
 from supabase import create_client
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Configuration from environment
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_KEY")
@@ -289,12 +294,15 @@ def main():
         print("Make sure to copy .env.example to .env and fill in the values.")
         sys.exit(1)
 
+    # uvloop speeds up the socket-heavy R2/HTTP work; fall back to asyncio
+    run = uvloop.run if uvloop is not None else asyncio.run
+
     if args.list:
         list_pending_videos()
     elif args.source_id:
-        asyncio.run(process_video_local(args.source_id))
+        run(process_video_local(args.source_id))
     else:
-        asyncio.run(process_all_pending())
+        run(process_all_pending())
 
 
 if __name__ == "__main__":
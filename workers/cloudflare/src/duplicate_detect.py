@@ -16,10 +16,10 @@ from typing import Optional
 import uuid
 
 import structlog
-from openai import AsyncOpenAI
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from .models import ClipResult
+from .openai_client import get_openai_client
 
 logger = structlog.get_logger(__name__)
 
@@ -98,7 +98,7 @@ class DuplicateDetector:
         if not self.api_key:
             raise ValueError("OpenAI API key is required for duplicate detection")
 
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        self.client = get_openai_client(self.api_key)
         self.model_name = model_name
         self.duplicate_threshold = duplicate_threshold
         self.takes_threshold = takes_threshold
@@ -62,8 +62,6 @@ class LocalVideoPipeline:
         Returns:
             Audio bytes as MP3 or None if extraction fails
         """
-        import subprocess
-
         audio_path = str(Path(temp_dir) / "audio.mp3")
 
         try:
@@ -80,15 +78,27 @@ class LocalVideoPipeline:
                 audio_path,
             ]
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minute timeout
+            # Run without blocking the event loop
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
             )
-
-            if result.returncode != 0:
-                logger.warning("FFmpeg audio extraction failed", error=result.stderr)
+            try:
+                _, stderr = await asyncio.wait_for(
+                    process.communicate(),
+                    timeout=300,  # 5 minute timeout
+                )
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise
+
+            if process.returncode != 0:
+                logger.warning(
+                    "FFmpeg audio extraction failed",
+                    error=stderr.decode(errors="replace"),
+                )
                 return None
 
             # Read audio file bytes
@@ -103,7 +113,7 @@ class LocalVideoPipeline:
             logger.info("Audio extracted successfully", size_mb=round(size_mb, 2))
             return audio_data
 
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             logger.warning("Audio extraction timed out")
             return None
         except Exception as e:
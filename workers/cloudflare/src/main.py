@@ -20,9 +20,15 @@ from .models import (
     ProcessVideoRequest,
     ProcessVideoResponse,
 )
+from .openai_client import aclose_openai_clients
 from .pipeline import VideoPipeline
+from .r2_client import get_r2_client
 from .local_pipeline import LocalVideoPipeline
-from .streaming_pipeline import StreamingVideoPipeline
+from .streaming_pipeline import (
+    StreamingVideoPipeline,
+    aclose_http_client,
+    shutdown_scene_pool,
+)
 
 # Configure structured logging
 structlog.configure(
@@ -55,6 +61,10 @@ async def lifespan(app: FastAPI):
     logger.info("Starting video processing pipeline", version=__version__)
     yield
     logger.info("Shutting down video processing pipeline")
+    await get_r2_client().close()
+    await aclose_http_client()
+    await aclose_openai_clients()
+    shutdown_scene_pool()
 
 
 app = FastAPI(
@@ -133,7 +143,6 @@ async def debug_env():
 async def debug_r2_test():
     """Test R2 connectivity by listing files."""
     try:
-        from .r2_client import get_r2_client
         client = get_r2_client()
         files = await client.list_files(prefix="sources/", max_keys=3)
         return {
@@ -721,4 +730,5 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=int(os.getenv("PORT", "8080")),
         reload=os.getenv("ENVIRONMENT") == "development",
+        loop="uvloop",
     )
@@ -0,0 +1,66 @@
+"""Shared OpenAI client for transcription, tagging and embeddings."""
+
+import asyncio
+from typing import Optional
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+# Connection pool shared by Whisper, chat and embedding requests
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+KEEPALIVE_EXPIRY = 60
+
+# Callers retry with tenacity; SDK retries underneath would multiply attempts
+SDK_MAX_RETRIES = 0
+
+# One client per API key (in practice only OPENAI_API_KEY) and event loop: the
+# client's connection pool is bound to the loop it was opened on
+_openai_clients: dict[tuple[str, Optional[asyncio.AbstractEventLoop]], AsyncOpenAI] = {}
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Get the running event loop, or None outside of one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def get_openai_client(api_key: str) -> AsyncOpenAI:
+    """Get or create the shared OpenAI client for an API key.
+
+    Each event loop gets its own client, so a process that runs several
+    loops in turn (asyncio.run per CLI call) never reuses a connection from
+    a closed loop.
+    """
+    key = (api_key, _running_loop())
+    client = _openai_clients.get(key)
+    if client is None or client.is_closed():
+        # Clients of closed loops can't be closed any more; just drop them
+        stale = [k for k in _openai_clients if k[1] is not None and k[1].is_closed()]
+        for k in stale:
+            del _openai_clients[k]
+
+        client = AsyncOpenAI(
+            api_key=api_key,
+            max_retries=SDK_MAX_RETRIES,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=KEEPALIVE_EXPIRY,
+                ),
+            ),
+        )
+        _openai_clients[key] = client
+    return client
+
+
+async def aclose_openai_clients() -> None:
+    """Close the running loop's shared OpenAI clients on shutdown."""
+    loop = asyncio.get_running_loop()
+    keys = [key for key in _openai_clients if key[1] is loop or key[1] is None]
+    clients = [_openai_clients.pop(key) for key in keys]
+    for client in clients:
+        await client.close()
@@ -7,12 +7,24 @@ Provides MOS-like (Mean Opinion Score) 1-5 ratings based on:
 
 import asyncio
 import json
+import math
 import subprocess
 from dataclasses import dataclass, field
 from typing import Optional
 
 import structlog
 
+try:
+    import av
+    import numpy as np
+    import pyloudnorm
+    from scipy.signal import resample_poly  # Installed with pyloudnorm
+except ImportError:  # Optional in-process loudness fast path
+    av = None
+    np = None
+    pyloudnorm = None
+    resample_poly = None
+
 from .error_detect import ErrorAnalysis
 from .models import ClipResult, TranscriptResult, WordTimestamp
 
@@ -34,6 +46,14 @@ TARGET_LOUDNESS = -16.0  # LUFS target
 LOUDNESS_TOLERANCE = 3.0  # +/- 3 LUFS is acceptable
 NOISE_FLOOR_THRESHOLD = -50.0  # dB - below this is good
 
+# EBU Tech 3342 loudness range parameters
+SHORT_TERM_WINDOW_SECONDS = 3.0
+SHORT_TERM_HOP_SECONDS = 1.0
+LRA_ABSOLUTE_GATE = -70.0  # LUFS
+LRA_RELATIVE_GATE = -20.0  # LU below the absolute-gated mean
+# True peak oversampling (ITU-R BS.1770 Annex 2)
+TRUE_PEAK_OVERSAMPLING = 4
+
 
 @dataclass
 class SpeakingQualityMetrics:
@@ -54,6 +74,113 @@ class AudioQualityMetrics:
     clipping_detected: bool = False
 
 
+def _decode_audio(audio_path: str) -> Optional[tuple["np.ndarray", int]]:
+    """Decode the first audio track of a file to float32 PCM.
+
+    Args:
+        audio_path: Path to audio/video file
+
+    Returns:
+        Tuple of (samples shaped [n_samples, n_channels], sample rate),
+        or None if the file has no audio track
+    """
+    with av.open(audio_path) as container:
+        if not container.streams.audio:
+            return None
+
+        stream = container.streams.audio[0]
+        channels = stream.codec_context.channels or 1
+        resampler = av.AudioResampler(
+            format="flt",
+            layout=stream.codec_context.layout.name,
+            rate=stream.codec_context.sample_rate,
+        )
+
+        chunks = []
+        for frame in container.decode(audio=0):
+            for resampled in resampler.resample(frame):
+                chunks.append(resampled.to_ndarray().reshape(-1, channels))
+        for resampled in resampler.resample(None):
+            chunks.append(resampled.to_ndarray().reshape(-1, channels))
+
+    if not chunks:
+        return None
+
+    return np.concatenate(chunks).astype(np.float32, copy=False), stream.codec_context.sample_rate
+
+
+def _measure_loudness_in_process(audio_path: str) -> Optional[AudioQualityMetrics]:
+    """Measure EBU R128 loudness without spawning FFmpeg.
+
+    Integrated loudness comes from pyloudnorm's BS.1770 meter. Loudness range
+    follows EBU Tech 3342: ungated K-weighted short-term loudness over 3s
+    windows every second, absolute and relative gated, 10th to 95th
+    percentile. True peak is the sample peak after 4x oversampling. These
+    match what FFmpeg's loudnorm filter reports.
+
+    Args:
+        audio_path: Path to audio/video file
+
+    Returns:
+        Audio quality metrics, or None if the file has no decodable audio
+    """
+    decoded = _decode_audio(audio_path)
+    if decoded is None:
+        return None
+
+    samples, sample_rate = decoded
+
+    metrics = AudioQualityMetrics()
+    metrics.loudness_lufs = float(pyloudnorm.Meter(sample_rate).integrated_loudness(samples))
+    metrics.loudness_range = _loudness_range(samples, sample_rate)
+
+    oversampled = resample_poly(samples, TRUE_PEAK_OVERSAMPLING, 1, axis=0)
+    peak = float(np.max(np.abs(oversampled)))
+    metrics.true_peak_db = 20.0 * math.log10(peak) if peak > 0 else -math.inf
+
+    if metrics.true_peak_db > -0.5:
+        metrics.clipping_detected = True
+
+    return metrics
+
+
+def _loudness_range(samples: "np.ndarray", sample_rate: int) -> float:
+    """Compute the EBU Tech 3342 loudness range (LRA) in LU.
+
+    Args:
+        samples: PCM samples shaped [n_samples, n_channels]
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        Loudness range, or 0.0 for audio shorter than one short-term window
+    """
+    if len(samples) < SHORT_TERM_WINDOW_SECONDS * sample_rate:
+        return 0.0
+
+    # A meter with 3s blocks records the ungated K-weighted loudness of every
+    # block (the short-term loudness) before applying its own gating
+    short_term_meter = pyloudnorm.Meter(
+        sample_rate,
+        block_size=SHORT_TERM_WINDOW_SECONDS,
+        overlap=1.0 - SHORT_TERM_HOP_SECONDS / SHORT_TERM_WINDOW_SECONDS,
+    )
+    short_term_meter.integrated_loudness(samples)
+    short_term = np.asarray(short_term_meter.blockwise_loudness, dtype=np.float64)
+
+    short_term = short_term[short_term > LRA_ABSOLUTE_GATE]
+    if not short_term.size:
+        return 0.0
+
+    mean_power = np.mean(np.power(10.0, short_term / 10.0))
+    relative_gate = 10.0 * np.log10(mean_power) + LRA_RELATIVE_GATE
+    short_term = short_term[short_term > relative_gate]
+    if not short_term.size:
+        return 0.0
+
+    low, high = np.percentile(short_term, [10, 95])
+    return float(high - low)
+
+
 @dataclass
 class QualityRating:
     """Complete quality rating for a clip."""
@@ -91,7 +218,10 @@ class QualityRater:
         self,
         audio_path: str,
     ) -> AudioQualityMetrics:
-        """Analyze audio quality using FFmpeg loudnorm filter.
+        """Analyze audio quality.
+
+        Measures loudness in-process when PyAV and pyloudnorm are installed,
+        otherwise falls back to the FFmpeg loudnorm filter.
 
         Args:
             audio_path: Path to audio/video file
@@ -101,6 +231,17 @@ class QualityRater:
         """
         logger.debug("Analyzing audio quality", audio_path=audio_path)
 
+        if pyloudnorm is not None:
+            try:
+                metrics = await asyncio.to_thread(_measure_loudness_in_process, audio_path)
+                if metrics is not None:
+                    return metrics
+            except Exception as e:
+                logger.debug(
+                    "In-process loudness analysis failed, falling back to FFmpeg",
+                    error=str(e),
+                )
+
         # First pass: get loudness stats
         cmd = [
             "ffmpeg",
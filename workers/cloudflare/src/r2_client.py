@@ -3,27 +3,79 @@
 This module provides async operations for:
 - File upload/download (with retry logic)
 - Streaming uploads for large files
-- Multipart upload for files >5MB
+- Direct uploads of in-memory data
+- Uploads of streamed data (e.g. piped FFmpeg output)
+- Multipart upload for files >64MB (single PUT below)
 - Presigned URL generation
 """
 
 import asyncio
 import os
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import AsyncIterator, Optional
 
 import aioboto3
+import boto3
 import structlog
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+try:
+    import awscrt  # noqa: F401 - botocore needs the CRT for CRC32C checksums
+    UPLOAD_CHECKSUM_ALGORITHM = "CRC32C"
+except ImportError:
+    UPLOAD_CHECKSUM_ALGORITHM = "CRC32"
+
 logger = structlog.get_logger(__name__)
 
-# Multipart upload threshold (5MB)
-MULTIPART_THRESHOLD = 5 * 1024 * 1024
+# Multipart upload threshold for upload_file_streaming (64MB); smaller files
+# go up as one PUT, saving the create/complete round trips
+MULTIPART_THRESHOLD = 64 * 1024 * 1024
 # Multipart chunk size (10MB)
 MULTIPART_CHUNK_SIZE = 10 * 1024 * 1024
 
+# Maximum keys per DeleteObjects request (S3 API limit)
+DELETE_BATCH_SIZE = 1000
+
+# Content types auto-detected from file suffix
+CONTENT_TYPES = MappingProxyType({
+    ".mp4": "video/mp4",
+    ".m4v": "video/x-m4v",
+    ".webm": "video/webm",
+    ".mov": "video/quicktime",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+    ".avif": "image/avif",
+    ".gif": "image/gif",
+    ".mp3": "audio/mpeg",
+    ".ogg": "audio/ogg",
+})
+
+# Known-existing key cache used by file_exists and files_exist
+EXISTS_CACHE_MAXSIZE = 10000
+EXISTS_CACHE_TTL = 60.0  # seconds
+# files_exist lists a prefix instead of sending a HEAD per key once this
+# many unknown keys share it
+EXISTS_PREFETCH_MIN_KEYS = 4
+
+# Connection pool size of the shared S3 client; sized for parallel
+# uploads/downloads across many files at once
+MAX_POOL_CONNECTIONS = 256
+
+# Read size when streaming object bodies to disk (1MB)
+DOWNLOAD_READ_SIZE = 1024 * 1024
+
+# Transfer settings for uploads and ranged downloads
+TRANSFER_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+TRANSFER_CHUNK_SIZE = 16 * 1024 * 1024
+TRANSFER_MAX_CONCURRENCY = 16
+
 
 class R2Client:
     """Async client for Cloudflare R2 storage operations."""
@@ -34,6 +86,8 @@ class R2Client:
         secret_access_key: Optional[str] = None,
         endpoint_url: Optional[str] = None,
         bucket_name: Optional[str] = None,
+        multipart_chunksize: int = TRANSFER_CHUNK_SIZE,
+        max_concurrency: int = TRANSFER_MAX_CONCURRENCY,
     ):
         """Initialize R2 client with credentials.
 
@@ -42,6 +96,8 @@ class R2Client:
             secret_access_key: R2 secret access key (or from env R2_SECRET_ACCESS_KEY)
             endpoint_url: R2 endpoint URL (or from env R2_ENDPOINT_URL)
             bucket_name: Default bucket name (or from env R2_BUCKET_NAME)
+            multipart_chunksize: Part size for parallel uploads and ranged downloads
+            max_concurrency: Parallel parts per upload or download
         """
         self.access_key_id = access_key_id or os.getenv("R2_ACCESS_KEY_ID")
         self.secret_access_key = secret_access_key or os.getenv("R2_SECRET_ACCESS_KEY")
@@ -53,11 +109,38 @@ class R2Client:
 
         self.session = aioboto3.Session()
         self.config = Config(
-            retries={"max_attempts": 3, "mode": "adaptive"},
+            retries={"max_attempts": 5, "mode": "adaptive"},
             connect_timeout=30,
             read_timeout=300,  # 5 minutes for large files
+            max_pool_connections=MAX_POOL_CONNECTIONS,
+            tcp_keepalive=True,
+        )
+        self.multipart_chunksize = multipart_chunksize
+        self.max_concurrency = max_concurrency
+        self.transfer_config = TransferConfig(
+            multipart_threshold=TRANSFER_MULTIPART_THRESHOLD,
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=max_concurrency,
+            use_threads=True,
+        )
+        # Single PUT for everything upload_file_streaming doesn't split itself
+        self.single_put_config = TransferConfig(
+            multipart_threshold=MULTIPART_THRESHOLD + 1,
+            use_threads=True,
         )
 
+        # Long-lived S3 client, opened on first use and shared by all calls
+        self._client = None
+        self._client_cm = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client_lock: Optional[asyncio.Lock] = None
+
+        # Synchronous client used only for local presigned-URL signing
+        self._signer = None
+
+        # (bucket, key) -> expiry time for keys known to exist
+        self._exists_cache: OrderedDict[tuple[str, str], float] = OrderedDict()
+
     def _get_client_context(self):
         """Get async context manager for S3 client."""
         return self.session.client(
@@ -68,6 +151,60 @@ class R2Client:
             config=self.config,
         )
 
+    async def _get_client(self):
+        """Get the shared S3 client, opening it on first use.
+
+        The client (and its connection pool) is bound to the event loop it was
+        opened on, so a new one is opened if called from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is loop:
+            return self._client
+
+        if self._client_lock is None or self._client_loop is not loop:
+            self._client_lock = asyncio.Lock()
+            self._client = None
+            self._client_cm = None
+            self._client_loop = loop
+
+        async with self._client_lock:
+            if self._client is None:
+                client_cm = self._get_client_context()
+                self._client = await client_cm.__aenter__()
+                self._client_cm = client_cm
+
+        return self._client
+
+    def _remember_exists(self, bucket: str, key: str) -> None:
+        """Record that a key exists, evicting the oldest entries past the limit."""
+        self._exists_cache[(bucket, key)] = time.monotonic() + EXISTS_CACHE_TTL
+        self._exists_cache.move_to_end((bucket, key))
+        while len(self._exists_cache) > EXISTS_CACHE_MAXSIZE:
+            self._exists_cache.popitem(last=False)
+
+    def _known_to_exist(self, bucket: str, key: str) -> bool:
+        """Check the existence cache, dropping the entry if it has expired."""
+        expires_at = self._exists_cache.get((bucket, key))
+        if expires_at is None:
+            return False
+        if expires_at < time.monotonic():
+            del self._exists_cache[(bucket, key)]
+            return False
+        return True
+
+    async def close(self) -> None:
+        """Close the shared S3 client and release its connections."""
+        client_cm = self._client_cm
+        self._client = None
+        self._client_cm = None
+        self._client_loop = None
+        self._client_lock = None
+
+        if client_cm is not None:
+            await client_cm.__aexit__(None, None, None)
+
+    # botocore retries the requests themselves, but not errors raised while
+    # streaming the response body, so the whole download is retried here
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
@@ -80,6 +217,10 @@ class R2Client:
     ) -> str:
         """Download a file from R2 to local path.
 
+        Streams the object body straight to disk on the event loop. Objects
+        above the multipart threshold are fetched as concurrent ranged GETs,
+        each writing at its own file offset.
+
         Args:
             key: Object key in R2
             local_path: Local path to save the file
@@ -94,16 +235,72 @@ class R2Client:
 
         logger.info("Downloading file from R2", key=key, bucket=bucket, local_path=str(local_path))
 
-        async with self._get_client_context() as client:
-            await client.download_file(bucket, key, str(local_path))
+        client = await self._get_client()
+        head = await client.head_object(Bucket=bucket, Key=key)
+        file_size = head["ContentLength"]
 
-        logger.info("File downloaded successfully", key=key, size=local_path.stat().st_size)
+        fd = os.open(local_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if file_size > TRANSFER_MULTIPART_THRESHOLD:
+                semaphore = asyncio.Semaphore(self.max_concurrency)
+
+                async def download_range_with_semaphore(start: int) -> None:
+                    end = min(start + self.multipart_chunksize, file_size) - 1
+                    async with semaphore:
+                        await self._download_range(client, bucket, key, fd, start, end)
+
+                tasks = [
+                    asyncio.create_task(download_range_with_semaphore(start))
+                    for start in range(0, file_size, self.multipart_chunksize)
+                ]
+                try:
+                    await asyncio.gather(*tasks)
+                except BaseException:
+                    # Stop the other ranges before their fd is closed
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    raise
+            else:
+                await self._download_range(client, bucket, key, fd)
+        finally:
+            os.close(fd)
+
+        self._remember_exists(bucket, key)
+        logger.info("File downloaded successfully", key=key, size=file_size)
         return str(local_path)
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-    )
+    async def _download_range(
+        self,
+        client,
+        bucket: str,
+        key: str,
+        fd: int,
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> None:
+        """Stream an object (or a byte range of it) to an open file descriptor.
+
+        Args:
+            client: S3 client
+            bucket: Bucket name
+            key: Object key in R2
+            fd: File descriptor opened for writing
+            start: First byte of the range (also the file offset to write at)
+            end: Last byte of the range, inclusive (None for the whole object)
+        """
+        params = {"Bucket": bucket, "Key": key}
+        if end is not None:
+            params["Range"] = f"bytes={start}-{end}"
+
+        response = await client.get_object(**params)
+
+        offset = start
+        async with response["Body"] as body:
+            async for chunk in body.iter_chunks(DOWNLOAD_READ_SIZE):
+                os.pwrite(fd, chunk, offset)
+                offset += len(chunk)
+
     async def upload_file(
         self,
         local_path: str,
@@ -125,50 +322,90 @@ class R2Client:
         bucket = bucket or self.bucket_name
         local_path = Path(local_path)
 
-        if not local_path.exists():
+        try:
+            file_size = local_path.stat().st_size
+        except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {local_path}")
 
-        extra_args = {}
+        extra_args = {"ChecksumAlgorithm": UPLOAD_CHECKSUM_ALGORITHM}
+        content_type = content_type or CONTENT_TYPES.get(local_path.suffix.lower())
         if content_type:
             extra_args["ContentType"] = content_type
-        else:
-            # Auto-detect content type
-            suffix = local_path.suffix.lower()
-            content_types = {
-                ".mp4": "video/mp4",
-                ".webm": "video/webm",
-                ".mov": "video/quicktime",
-                ".jpg": "image/jpeg",
-                ".jpeg": "image/jpeg",
-                ".png": "image/png",
-                ".webp": "image/webp",
-            }
-            if suffix in content_types:
-                extra_args["ContentType"] = content_types[suffix]
 
         logger.info(
             "Uploading file to R2",
             key=key,
             bucket=bucket,
-            size=local_path.stat().st_size,
+            size=file_size,
         )
 
-        async with self._get_client_context() as client:
-            await client.upload_file(
-                str(local_path),
-                bucket,
-                key,
-                ExtraArgs=extra_args if extra_args else None,
-            )
+        client = await self._get_client()
+        await client.upload_file(
+            str(local_path),
+            bucket,
+            key,
+            ExtraArgs=extra_args,
+            Config=self.transfer_config,
+        )
 
+        self._remember_exists(bucket, key)
         url = f"{self.endpoint_url}/{bucket}/{key}"
         logger.info("File uploaded successfully", key=key, url=url)
         return url
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-    )
+    async def upload_bytes(
+        self,
+        data: bytes,
+        key: str,
+        bucket: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> str:
+        """Upload in-memory data to R2 with a single PUT.
+
+        Use for artifacts produced in memory (e.g. piped FFmpeg output) so
+        they don't have to be written to disk and read back first.
+
+        Args:
+            data: Object contents
+            key: Object key in R2
+            bucket: Bucket name (uses default if not provided)
+            content_type: MIME type (auto-detected from key suffix if not provided)
+
+        Returns:
+            R2 key of uploaded object
+        """
+        bucket = bucket or self.bucket_name
+        content_type = content_type or CONTENT_TYPES.get(
+            Path(key).suffix.lower(), "application/octet-stream"
+        )
+
+        logger.info("Uploading bytes to R2", key=key, bucket=bucket, size=len(data))
+
+        client = await self._get_client()
+        await client.put_object(
+            Bucket=bucket,
+            Key=key,
+            Body=data,
+            ContentType=content_type,
+            ChecksumAlgorithm=UPLOAD_CHECKSUM_ALGORITHM,
+        )
+
+        self._remember_exists(bucket, key)
+        logger.info("Bytes uploaded successfully", key=key)
+        return key
+
+    def _get_signer(self):
+        """Get the cached boto3 client used for presigning URLs."""
+        if self._signer is None:
+            self._signer = boto3.client(
+                "s3",
+                endpoint_url=self.endpoint_url,
+                aws_access_key_id=self.access_key_id,
+                aws_secret_access_key=self.secret_access_key,
+                config=Config(signature_version="s3v4"),
+            )
+        return self._signer
+
     async def get_presigned_url(
         self,
         key: str,
@@ -177,6 +414,8 @@ class R2Client:
     ) -> str:
         """Generate a presigned URL for accessing an object.
 
+        Signing is a local HMAC computation, so no network call is made.
+
         Args:
             key: Object key in R2
             bucket: Bucket name (uses default if not provided)
@@ -187,19 +426,12 @@ class R2Client:
         """
         bucket = bucket or self.bucket_name
 
-        async with self._get_client_context() as client:
-            url = await client.generate_presigned_url(
-                "get_object",
-                Params={"Bucket": bucket, "Key": key},
-                ExpiresIn=expires_in,
-            )
-
-        return url
+        return self._get_signer().generate_presigned_url(
+            "get_object",
+            Params={"Bucket": bucket, "Key": key},
+            ExpiresIn=expires_in,
+        )
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-    )
     async def delete_file(
         self,
         key: str,
@@ -215,8 +447,9 @@ class R2Client:
 
         logger.info("Deleting file from R2", key=key, bucket=bucket)
 
-        async with self._get_client_context() as client:
-            await client.delete_object(Bucket=bucket, Key=key)
+        client = await self._get_client()
+        await client.delete_object(Bucket=bucket, Key=key)
+        self._exists_cache.pop((bucket, key), None)
 
         logger.info("File deleted successfully", key=key)
 
@@ -239,25 +472,89 @@ class R2Client:
         bucket = bucket or self.bucket_name
         files = []
 
-        async with self._get_client_context() as client:
-            paginator = client.get_paginator("list_objects_v2")
-            async for page in paginator.paginate(
-                Bucket=bucket,
-                Prefix=prefix,
-                PaginationConfig={"MaxItems": max_keys},
-            ):
-                for obj in page.get("Contents", []):
-                    files.append(
-                        {
-                            "key": obj["Key"],
-                            "size": obj["Size"],
-                            "last_modified": obj["LastModified"],
-                            "etag": obj["ETag"],
-                        }
-                    )
+        client = await self._get_client()
+        paginator = client.get_paginator("list_objects_v2")
+        async for page in paginator.paginate(
+            Bucket=bucket,
+            Prefix=prefix,
+            PaginationConfig={"MaxItems": max_keys},
+        ):
+            for obj in page.get("Contents", []):
+                self._remember_exists(bucket, obj["Key"])
+                files.append(
+                    {
+                        "key": obj["Key"],
+                        "size": obj["Size"],
+                        "last_modified": obj["LastModified"],
+                        "etag": obj["ETag"],
+                    }
+                )
 
         return files
 
+    async def list_files_sharded(
+        self,
+        prefix: str = "",
+        bucket: Optional[str] = None,
+        max_keys_per_prefix: int = 100000,
+        max_concurrent: int = 16,
+    ) -> list[dict]:
+        """List files under a prefix by listing its sub-prefixes concurrently.
+
+        A delimiter listing first discovers the child "directories" of the
+        prefix (e.g. clips/<source_id>/), then each is paginated in parallel,
+        instead of one sequential pagination over every key.
+
+        Args:
+            prefix: Key prefix to list (should end with "/")
+            bucket: Bucket name (uses default if not provided)
+            max_keys_per_prefix: Maximum number of keys per sub-prefix
+            max_concurrent: Maximum concurrent sub-prefix listings
+
+        Returns:
+            List of file metadata dictionaries
+        """
+        bucket = bucket or self.bucket_name
+        files = []
+        child_prefixes = []
+
+        client = await self._get_client()
+        paginator = client.get_paginator("list_objects_v2")
+        async for page in paginator.paginate(
+            Bucket=bucket,
+            Prefix=prefix,
+            Delimiter="/",
+        ):
+            child_prefixes.extend(p["Prefix"] for p in page.get("CommonPrefixes", []))
+            for obj in page.get("Contents", []):
+                self._remember_exists(bucket, obj["Key"])
+                files.append(
+                    {
+                        "key": obj["Key"],
+                        "size": obj["Size"],
+                        "last_modified": obj["LastModified"],
+                        "etag": obj["ETag"],
+                    }
+                )
+
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def list_with_semaphore(child_prefix: str) -> list[dict]:
+            async with semaphore:
+                return await self.list_files(child_prefix, bucket, max_keys_per_prefix)
+
+        shards = await asyncio.gather(*[list_with_semaphore(p) for p in child_prefixes])
+        for shard in shards:
+            files.extend(shard)
+
+        logger.debug(
+            "Sharded listing completed",
+            prefix=prefix,
+            shards=len(child_prefixes),
+            files=len(files),
+        )
+        return files
+
     async def file_exists(
         self,
         key: str,
@@ -265,6 +562,10 @@ class R2Client:
     ) -> bool:
         """Check if a file exists in R2.
 
+        Keys seen by recent uploads, downloads and listings are answered from
+        an in-memory cache; otherwise a single HEAD is sent. Use files_exist
+        to check many keys at once.
+
         Args:
             key: Object key in R2
             bucket: Bucket name (uses default if not provided)
@@ -274,13 +575,82 @@ class R2Client:
         """
         bucket = bucket or self.bucket_name
 
-        try:
-            async with self._get_client_context() as client:
-                await client.head_object(Bucket=bucket, Key=key)
+        if self._known_to_exist(bucket, key):
             return True
+
+        try:
+            client = await self._get_client()
+            await client.head_object(Bucket=bucket, Key=key)
         except Exception:
             return False
 
+        self._remember_exists(bucket, key)
+        return True
+
+    async def files_exist(
+        self,
+        keys: list[str],
+        bucket: Optional[str] = None,
+        max_concurrent: int = 32,
+    ) -> dict[str, bool]:
+        """Check which of many files exist in R2.
+
+        Keys missing from the existence cache are grouped by parent prefix.
+        A prefix with at least EXISTS_PREFETCH_MIN_KEYS of them is listed
+        once instead of sending a HEAD per key; keys past a truncated listing
+        and keys of smaller groups are checked with HEAD.
+
+        Args:
+            keys: Object keys in R2
+            bucket: Bucket name (uses default if not provided)
+            max_concurrent: Maximum concurrent HEAD requests
+
+        Returns:
+            Mapping of each key to whether it exists
+        """
+        bucket = bucket or self.bucket_name
+        found = {key for key in keys if self._known_to_exist(bucket, key)}
+
+        by_prefix: dict[str, list[str]] = {}
+        for key in keys:
+            if key not in found:
+                prefix = key.rsplit("/", 1)[0] + "/" if "/" in key else ""
+                by_prefix.setdefault(prefix, []).append(key)
+
+        to_head = []
+        for prefix, prefix_keys in by_prefix.items():
+            if len(prefix_keys) < EXISTS_PREFETCH_MIN_KEYS:
+                to_head.extend(prefix_keys)
+                continue
+
+            try:
+                client = await self._get_client()
+                response = await client.list_objects_v2(Bucket=bucket, Prefix=prefix)
+            except Exception as e:
+                logger.warning("Failed to list prefix", prefix=prefix, error=str(e))
+                to_head.extend(prefix_keys)
+                continue
+
+            listed = set()
+            for obj in response.get("Contents", []):
+                self._remember_exists(bucket, obj["Key"])
+                listed.add(obj["Key"])
+            found.update(key for key in prefix_keys if key in listed)
+            if response.get("IsTruncated"):
+                # Only the first page was listed; later keys may still exist
+                to_head.extend(key for key in prefix_keys if key not in listed)
+
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def exists_with_semaphore(key: str) -> bool:
+            async with semaphore:
+                return await self.file_exists(key, bucket)
+
+        results = await asyncio.gather(*[exists_with_semaphore(key) for key in to_head])
+        found.update(key for key, exists in zip(to_head, results) if exists)
+
+        return {key: key in found for key in keys}
+
     async def upload_file_streaming(
         self,
         local_path: str,
@@ -290,8 +660,9 @@ class R2Client:
     ) -> str:
         """Upload file to R2 with streaming - never loads entire file to memory.
 
-        Uses multipart upload for files >5MB for better reliability and
-        memory efficiency with large files.
+        Uses multipart upload for files >64MB for better reliability and
+        memory efficiency with large files; smaller files are sent as a
+        single PUT streamed from disk.
 
         Args:
             local_path: Local path of file to upload
@@ -305,27 +676,16 @@ class R2Client:
         bucket = bucket or self.bucket_name
         local_path = Path(local_path)
 
-        if not local_path.exists():
+        try:
+            file_size = local_path.stat().st_size
+        except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {local_path}")
 
-        file_size = local_path.stat().st_size
-
         # Auto-detect content type if not provided
         if not content_type:
-            suffix = local_path.suffix.lower()
-            content_types = {
-                ".mp4": "video/mp4",
-                ".webm": "video/webm",
-                ".mov": "video/quicktime",
-                ".jpg": "image/jpeg",
-                ".jpeg": "image/jpeg",
-                ".png": "image/png",
-                ".webp": "image/webp",
-                ".mp3": "audio/mpeg",
-            }
-            content_type = content_types.get(suffix, "application/octet-stream")
-
-        # Use multipart for large files (>5MB)
+            content_type = CONTENT_TYPES.get(local_path.suffix.lower(), "application/octet-stream")
+
+        # Use multipart for large files (>64MB)
         if file_size > MULTIPART_THRESHOLD:
             logger.info(
                 "Using multipart upload for large file",
@@ -343,16 +703,21 @@ class R2Client:
             size=file_size,
         )
 
-        extra_args = {"ContentType": content_type} if content_type else {}
-
-        async with self._get_client_context() as client:
-            await client.upload_file(
-                str(local_path),
-                bucket,
-                key,
-                ExtraArgs=extra_args if extra_args else None,
-            )
+        extra_args = {
+            "ContentType": content_type,
+            "ChecksumAlgorithm": UPLOAD_CHECKSUM_ALGORITHM,
+        }
+
+        client = await self._get_client()
+        await client.upload_file(
+            str(local_path),
+            bucket,
+            key,
+            ExtraArgs=extra_args,
+            Config=self.single_put_config,
+        )
 
+        self._remember_exists(bucket, key)
         logger.info("File uploaded successfully", key=key)
         return key
 
@@ -379,72 +744,188 @@ class R2Client:
         Returns:
             R2 key of uploaded file
         """
-        async with self._get_client_context() as client:
-            # Initiate multipart upload
-            response = await client.create_multipart_upload(
+        client = await self._get_client()
+
+        # Initiate multipart upload
+        response = await client.create_multipart_upload(
+            Bucket=bucket,
+            Key=key,
+            ContentType=content_type,
+            ChecksumAlgorithm=UPLOAD_CHECKSUM_ALGORITHM,
+        )
+        upload_id = response["UploadId"]
+
+        try:
+            parts = []
+            part_number = 1
+
+            with open(local_path, "rb") as f:
+                while True:
+                    chunk = f.read(MULTIPART_CHUNK_SIZE)
+                    if not chunk:
+                        break
+
+                    # Upload part
+                    parts.append(
+                        await self._upload_part(
+                            client, bucket, key, upload_id, part_number, chunk
+                        )
+                    )
+                    part_number += 1
+
+            # Complete multipart upload
+            await client.complete_multipart_upload(
                 Bucket=bucket,
                 Key=key,
-                ContentType=content_type,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
             )
-            upload_id = response["UploadId"]
+            self._remember_exists(bucket, key)
 
-            try:
-                parts = []
-                part_number = 1
-
-                with open(local_path, "rb") as f:
-                    while True:
-                        chunk = f.read(MULTIPART_CHUNK_SIZE)
-                        if not chunk:
-                            break
-
-                        # Upload part
-                        part_response = await client.upload_part(
-                            Bucket=bucket,
-                            Key=key,
-                            UploadId=upload_id,
-                            PartNumber=part_number,
-                            Body=chunk,
-                        )
+            logger.info(
+                "Multipart upload completed",
+                key=key,
+                parts=len(parts),
+                size_mb=round(file_size / (1024 * 1024), 2),
+            )
+            return key
 
-                        parts.append({
-                            "PartNumber": part_number,
-                            "ETag": part_response["ETag"],
-                        })
+        except Exception as e:
+            # Abort multipart upload on error
+            logger.error("Multipart upload failed, aborting", key=key, error=str(e))
+            await client.abort_multipart_upload(
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+            )
+            raise
 
-                        logger.debug(
-                            "Uploaded part",
-                            key=key,
-                            part=part_number,
-                            size=len(chunk),
-                        )
-                        part_number += 1
+    async def _upload_part(
+        self,
+        client,
+        bucket: str,
+        key: str,
+        upload_id: str,
+        part_number: int,
+        data: bytes,
+    ) -> dict:
+        """Upload one multipart part and return its completion entry."""
+        part_response = await client.upload_part(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data,
+            ChecksumAlgorithm=UPLOAD_CHECKSUM_ALGORITHM,
+        )
 
-                # Complete multipart upload
-                await client.complete_multipart_upload(
-                    Bucket=bucket,
-                    Key=key,
-                    UploadId=upload_id,
-                    MultipartUpload={"Parts": parts},
-                )
+        logger.debug("Uploaded part", key=key, part=part_number, size=len(data))
+
+        checksum_field = f"Checksum{UPLOAD_CHECKSUM_ALGORITHM}"
+        return {
+            "PartNumber": part_number,
+            "ETag": part_response["ETag"],
+            checksum_field: part_response[checksum_field],
+        }
+
+    async def upload_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        key: str,
+        bucket: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> str:
+        """Upload data of unknown length from an async iterator.
 
-                logger.info(
-                    "Multipart upload completed",
-                    key=key,
-                    parts=len(parts),
-                    size_mb=round(file_size / (1024 * 1024), 2),
+        Chunks are buffered into MULTIPART_CHUNK_SIZE parts; each part uploads
+        while the next one is being filled. Output smaller than one part is
+        sent with a single PUT.
+
+        Args:
+            chunks: Async iterator of object data (e.g. piped FFmpeg output)
+            key: Object key in R2
+            bucket: Bucket name (uses default if not provided)
+            content_type: MIME type (auto-detected from key suffix if not provided)
+
+        Returns:
+            R2 key of uploaded object
+        """
+        bucket = bucket or self.bucket_name
+        content_type = content_type or CONTENT_TYPES.get(
+            Path(key).suffix.lower(), "application/octet-stream"
+        )
+
+        client = None
+        upload_id = None
+        parts: list[dict] = []
+        pending: Optional[asyncio.Task] = None
+        buffer = bytearray()
+        size = 0
+
+        async def start_part(data: bytes) -> asyncio.Task:
+            # Keep at most one part in flight so memory stays bounded
+            if pending is not None:
+                parts.append(await pending)
+            return asyncio.create_task(
+                self._upload_part(
+                    client, bucket, key, upload_id, len(parts) + 1, data
                 )
-                return key
+            )
 
-            except Exception as e:
-                # Abort multipart upload on error
-                logger.error("Multipart upload failed, aborting", key=key, error=str(e))
+        try:
+            async for chunk in chunks:
+                buffer += chunk
+                size += len(chunk)
+                if len(buffer) < MULTIPART_CHUNK_SIZE:
+                    continue
+
+                if upload_id is None:
+                    client = await self._get_client()
+                    response = await client.create_multipart_upload(
+                        Bucket=bucket,
+                        Key=key,
+                        ContentType=content_type,
+                        ChecksumAlgorithm=UPLOAD_CHECKSUM_ALGORITHM,
+                    )
+                    upload_id = response["UploadId"]
+
+                pending = await start_part(bytes(buffer))
+                buffer.clear()
+
+            if upload_id is None:
+                return await self.upload_bytes(bytes(buffer), key, bucket, content_type)
+
+            if buffer:
+                pending = await start_part(bytes(buffer))
+            parts.append(await pending)
+
+            await client.complete_multipart_upload(
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+            self._remember_exists(bucket, key)
+
+            logger.info(
+                "Streamed upload completed",
+                key=key,
+                parts=len(parts),
+                size_mb=round(size / (1024 * 1024), 2),
+            )
+            return key
+
+        except Exception as e:
+            if pending is not None and not pending.done():
+                pending.cancel()
+            if upload_id is not None:
+                logger.error("Streamed upload failed, aborting", key=key, error=str(e))
                 await client.abort_multipart_upload(
                     Bucket=bucket,
                     Key=key,
                     UploadId=upload_id,
                 )
-                raise
+            raise
 
     async def upload_files_parallel(
         self,
@@ -486,6 +967,103 @@ class R2Client:
         )
         return successful
 
+    async def download_files_parallel(
+        self,
+        files: list[tuple[str, str]],
+        bucket: Optional[str] = None,
+        max_concurrent: int = 32,
+    ) -> list[str]:
+        """Download multiple files in parallel.
+
+        Args:
+            files: List of (key, local_path) tuples
+            bucket: Bucket name (uses default if not provided)
+            max_concurrent: Maximum concurrent downloads
+
+        Returns:
+            List of successfully downloaded local paths
+        """
+        bucket = bucket or self.bucket_name
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def download_with_semaphore(key: str, local_path: str) -> Optional[str]:
+            async with semaphore:
+                try:
+                    return await self.download_file(key, local_path, bucket)
+                except Exception as e:
+                    logger.error("Failed to download file", key=key, error=str(e))
+                    return None
+
+        tasks = [download_with_semaphore(key, local_path) for key, local_path in files]
+        results = await asyncio.gather(*tasks)
+
+        # Filter out failed downloads
+        successful = [path for path in results if path is not None]
+        logger.info(
+            "Parallel download completed",
+            total=len(files),
+            successful=len(successful),
+            failed=len(files) - len(successful),
+        )
+        return successful
+
+    async def delete_files(
+        self,
+        keys: list[str],
+        bucket: Optional[str] = None,
+    ) -> list[str]:
+        """Delete multiple files using batched DeleteObjects requests.
+
+        Issues one request per 1000 keys instead of one per key.
+
+        Args:
+            keys: Object keys to delete
+            bucket: Bucket name (uses default if not provided)
+
+        Returns:
+            List of successfully deleted keys
+        """
+        bucket = bucket or self.bucket_name
+        client = await self._get_client()
+
+        async def delete_batch(batch: list[str]) -> list[str]:
+            try:
+                response = await client.delete_objects(
+                    Bucket=bucket,
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+                )
+            except Exception as e:
+                logger.error("Failed to delete batch", count=len(batch), error=str(e))
+                return []
+
+            errors = response.get("Errors", [])
+            for error in errors:
+                logger.error(
+                    "Failed to delete file",
+                    key=error.get("Key"),
+                    error=error.get("Message"),
+                )
+            failed = {error.get("Key") for error in errors}
+            deleted = [key for key in batch if key not in failed]
+            for key in deleted:
+                self._exists_cache.pop((bucket, key), None)
+            return deleted
+
+        batches = [
+            keys[i:i + DELETE_BATCH_SIZE]
+            for i in range(0, len(keys), DELETE_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(*[delete_batch(batch) for batch in batches])
+
+        deleted = [key for batch in results for key in batch]
+        logger.info(
+            "Batch delete completed",
+            total=len(keys),
+            successful=len(deleted),
+            failed=len(keys) - len(deleted),
+        )
+        return deleted
+
 
 # Singleton instance
 _r2_client: Optional[R2Client] = None
@@ -1,17 +1,32 @@
 """Scene detection module using PySceneDetect."""
 
+import os
+import stat
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+import orjson
 import structlog
 from scenedetect import AdaptiveDetector, ContentDetector, SceneManager, open_video
 from scenedetect.stats_manager import StatsManager
 
+try:
+    import av
+except ImportError:  # Optional in-process probing, falls back to FFprobe
+    av = None
+
 from .models import SceneBoundary, SceneDetectionResult
 
 logger = structlog.get_logger(__name__)
 
+# A FIFO can't be seeked, so a container whose index is at the end decodes no
+# frames from it; decoding must get this close to the end to be trusted
+FIFO_END_TOLERANCE = 1.0  # seconds
+
 
 class SceneDetectionError(Exception):
     """Error during scene detection."""
@@ -19,6 +34,129 @@ class SceneDetectionError(Exception):
     pass
 
 
+def _is_stream_url(video_path) -> bool:
+    """Check whether a video path is a network stream URL."""
+    return isinstance(video_path, str) and video_path.startswith(("http://", "https://"))
+
+
+def _is_fifo(video_path) -> bool:
+    """Check whether a video path is a FIFO (fed while it downloads)."""
+    try:
+        return stat.S_ISFIFO(os.stat(video_path).st_mode)
+    except OSError:
+        return False
+
+
+def _probe_with_av(video_path: str) -> Optional[dict]:
+    """Read video metadata in-process with PyAV.
+
+    Args:
+        video_path: Path to video file or stream URL
+
+    Returns:
+        Dictionary with duration, fps, width, height, codec, or None if
+        PyAV can't open the container or it has no video stream
+    """
+    try:
+        with av.open(video_path) as container:
+            if not container.streams.video:
+                return None
+
+            stream = container.streams.video[0]
+            rate = stream.average_rate or stream.base_rate
+            if container.duration is not None:
+                duration = container.duration / av.time_base
+            elif stream.duration is not None and stream.time_base:
+                duration = float(stream.duration * stream.time_base)
+            else:
+                duration = 0.0
+
+            return {
+                "duration": float(duration),
+                "fps": float(rate) if rate else 30.0,
+                "width": int(stream.codec_context.width),
+                "height": int(stream.codec_context.height),
+                "codec": stream.codec_context.name,
+            }
+    except av.FFmpegError as e:
+        logger.debug("PyAV probe failed, falling back to FFprobe", error=str(e))
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _probe_video(video_path: str, mtime_ns: int, size: int) -> dict:
+    """Read video metadata, in-process via PyAV or by running FFprobe.
+
+    The mtime and size arguments only serve as cache key, so a modified file
+    is probed again.
+
+    Args:
+        video_path: Path to video file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        Dictionary with duration, fps, width, height, codec
+    """
+    if av is not None:
+        info = _probe_with_av(video_path)
+        if info is not None:
+            return info
+
+    cmd = [
+        "ffprobe",
+        "-v",
+        "quiet",
+        "-print_format",
+        "json",
+        "-show_format",
+        "-show_streams",
+        video_path,
+    ]
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, timeout=30)
+
+        if result.returncode != 0:
+            raise SceneDetectionError(
+                f"FFprobe error: {result.stderr.decode('utf-8', errors='replace')}"
+            )
+
+        # Parse raw stdout bytes directly (no text decode step)
+        data = orjson.loads(result.stdout)
+
+        # Find video stream
+        video_stream = None
+        for stream in data.get("streams", []):
+            if stream.get("codec_type") == "video":
+                video_stream = stream
+                break
+
+        if not video_stream:
+            raise SceneDetectionError("No video stream found")
+
+        # Parse frame rate
+        fps_str = video_stream.get("r_frame_rate", "30/1")
+        if "/" in fps_str:
+            num, den = map(float, fps_str.split("/"))
+            fps = num / den if den else 30.0
+        else:
+            fps = float(fps_str)
+
+        return {
+            "duration": float(data.get("format", {}).get("duration", 0)),
+            "fps": fps,
+            "width": int(video_stream.get("width", 0)),
+            "height": int(video_stream.get("height", 0)),
+            "codec": video_stream.get("codec_name", "unknown"),
+        }
+
+    except subprocess.TimeoutExpired:
+        raise SceneDetectionError("FFprobe timed out")
+    except orjson.JSONDecodeError as e:
+        raise SceneDetectionError(f"Failed to parse FFprobe output: {e}")
+
+
 class SceneDetector:
     """Detects scene boundaries in videos using PySceneDetect."""
 
@@ -27,6 +165,8 @@ class SceneDetector:
         min_scene_len: float = 1.5,
         threshold: float = 27.0,
         use_adaptive: bool = True,
+        downscale: Optional[int] = None,
+        collect_stats: bool = False,
     ):
         """Initialize the scene detector.
 
@@ -34,110 +174,108 @@ class SceneDetector:
             min_scene_len: Minimum scene length in seconds
             threshold: Detection threshold (lower = more sensitive)
             use_adaptive: Use AdaptiveDetector (better for talking-head videos)
+            downscale: Frame downscale factor (None = PySceneDetect's automatic factor)
+            collect_stats: Record per-frame metrics in a StatsManager (debugging)
         """
         self.min_scene_len = min_scene_len
         self.threshold = threshold
         self.use_adaptive = use_adaptive
+        self.downscale = downscale
+        self.collect_stats = collect_stats
 
     def get_video_info(self, video_path: str) -> dict:
-        """Get video metadata using FFprobe.
+        """Get video metadata using PyAV (if installed) or FFprobe.
+
+        Results are cached per (path, mtime, size), so re-analyzing an
+        unchanged file does not spawn FFprobe again.
 
         Args:
-            video_path: Path to video file
+            video_path: Path to video file or stream URL
 
         Returns:
             Dictionary with duration, fps, width, height
         """
-        cmd = [
-            "ffprobe",
-            "-v",
-            "quiet",
-            "-print_format",
-            "json",
-            "-show_format",
-            "-show_streams",
-            video_path,
-        ]
+        if _is_stream_url(video_path):
+            return dict(_probe_video(video_path, 0, 0))
 
         try:
-            import json
+            st = os.stat(video_path)
+        except OSError as e:
+            raise SceneDetectionError(f"FFprobe error: {e}")
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        return dict(_probe_video(video_path, st.st_mtime_ns, st.st_size))
 
-            if result.returncode != 0:
-                raise SceneDetectionError(f"FFprobe error: {result.stderr}")
+    def _apply_downscale(self, scene_manager: SceneManager) -> None:
+        """Configure frame downscaling on a scene manager.
 
-            data = json.loads(result.stdout)
+        PySceneDetect's automatic factor (about the larger frame dimension
+        / 256, so ~7.5 at 1080p) is kept unless a factor was set explicitly.
 
-            # Find video stream
-            video_stream = None
-            for stream in data.get("streams", []):
-                if stream.get("codec_type") == "video":
-                    video_stream = stream
-                    break
-
-            if not video_stream:
-                raise SceneDetectionError("No video stream found")
-
-            # Parse frame rate
-            fps_str = video_stream.get("r_frame_rate", "30/1")
-            if "/" in fps_str:
-                num, den = map(float, fps_str.split("/"))
-                fps = num / den if den else 30.0
-            else:
-                fps = float(fps_str)
-
-            return {
-                "duration": float(data.get("format", {}).get("duration", 0)),
-                "fps": fps,
-                "width": int(video_stream.get("width", 0)),
-                "height": int(video_stream.get("height", 0)),
-                "codec": video_stream.get("codec_name", "unknown"),
-            }
-
-        except subprocess.TimeoutExpired:
-            raise SceneDetectionError("FFprobe timed out")
-        except json.JSONDecodeError as e:
-            raise SceneDetectionError(f"Failed to parse FFprobe output: {e}")
+        Args:
+            scene_manager: Scene manager to configure
+        """
+        if self.downscale is not None:
+            scene_manager.auto_downscale = False
+            scene_manager.downscale = max(1, self.downscale)
 
     def detect_scenes(self, video_path: str) -> SceneDetectionResult:
         """Detect scene boundaries in a video.
 
+        Streams are decoded sequentially, so a presigned URL, or a FIFO fed
+        with a download in progress, can be analyzed before the video is
+        complete on disk.
+
         Args:
-            video_path: Path to video file
+            video_path: Path to video file or FIFO, or stream URL (http/https)
 
         Returns:
             SceneDetectionResult with scene boundaries
         """
-        video_path = Path(video_path)
-        if not video_path.exists():
-            raise FileNotFoundError(f"Video file not found: {video_path}")
+        if _is_stream_url(video_path):
+            # Never log the signed query string
+            video_name = video_path.split("?", 1)[0]
+        else:
+            video_path = Path(video_path)
+            if not video_path.exists():
+                raise FileNotFoundError(f"Video file not found: {video_path}")
+            video_name = str(video_path)
+        # Checked before opening: whoever feeds a FIFO may unlink it then
+        is_fifo = _is_fifo(video_path)
 
         logger.info(
             "Starting scene detection",
-            video=str(video_path),
+            video=video_name,
             min_scene_len=self.min_scene_len,
             use_adaptive=self.use_adaptive,
         )
 
-        # Get video info
-        video_info = self.get_video_info(str(video_path))
-        fps = video_info["fps"]
-        duration = video_info["duration"]
+        # Open video with PySceneDetect and read metadata from the open stream
+        video = open_video(str(video_path))
+        fps = float(video.frame_rate)
+        duration = video.duration.get_seconds() if video.duration is not None else 0.0
+        width, height = video.frame_size
+
+        if not fps or not duration:
+            if is_fifo:
+                # A second reader would take bytes the detector needs
+                raise SceneDetectionError("Video stream has no frame rate or duration")
+            # Fall back to FFprobe for containers the backend can't introspect
+            video_info = self.get_video_info(str(video_path))
+            fps = video_info["fps"]
+            duration = video_info["duration"]
+            width, height = video_info["width"], video_info["height"]
 
         logger.info(
             "Video info",
             duration=duration,
             fps=fps,
-            resolution=f"{video_info['width']}x{video_info['height']}",
+            resolution=f"{width}x{height}",
         )
 
-        # Open video with PySceneDetect
-        video = open_video(str(video_path))
-
-        # Create scene manager with stats
-        stats_manager = StatsManager()
+        # Per-frame stats are only recorded when requested for debugging
+        stats_manager = StatsManager() if self.collect_stats else None
         scene_manager = SceneManager(stats_manager)
+        self._apply_downscale(scene_manager)
 
         # Choose detector based on configuration
         min_scene_frames = int(self.min_scene_len * fps)
@@ -162,21 +300,41 @@ class SceneDetector:
         scene_manager.detect_scenes(video)
         scene_list = scene_manager.get_scene_list()
 
-        # Convert to our model
-        scenes = []
-        for i, (start, end) in enumerate(scene_list):
-            start_time = start.get_seconds()
-            end_time = end.get_seconds()
+        if is_fifo and video.frame_number / fps < duration - FIFO_END_TOLERANCE:
+            raise SceneDetectionError(
+                f"Stream ended after {video.frame_number} frames of {duration:.1f}s"
+            )
 
-            scenes.append(
-                SceneBoundary(
-                    start_time=start_time,
-                    end_time=end_time,
-                    start_frame=start.get_frames(),
-                    end_frame=end.get_frames(),
-                    duration=end_time - start_time,
-                )
+        # Convert to our model, computing all times in one vectorized pass
+        start_frames = np.fromiter(
+            (start.get_frames() for start, _ in scene_list),
+            dtype=np.int64,
+            count=len(scene_list),
+        )
+        end_frames = np.fromiter(
+            (end.get_frames() for _, end in scene_list),
+            dtype=np.int64,
+            count=len(scene_list),
+        )
+        start_times = start_frames / fps
+        end_times = end_frames / fps
+
+        scenes = [
+            SceneBoundary(
+                start_time=start_time,
+                end_time=end_time,
+                start_frame=start_frame,
+                end_frame=end_frame,
+                duration=duration,
             )
+            for start_time, end_time, start_frame, end_frame, duration in zip(
+                start_times.tolist(),
+                end_times.tolist(),
+                start_frames.tolist(),
+                end_frames.tolist(),
+                (end_times - start_times).tolist(),
+            )
+        ]
 
         # If no scenes detected, treat entire video as one scene
         if not scenes:
@@ -235,3 +393,60 @@ def detect_scenes(
 
     result = detector.detect_scenes(video_path)
     return result.scenes
+
+
+def _detect_scenes_worker(
+    video_path: str,
+    min_scene_len: float,
+    threshold: float,
+    use_adaptive: bool,
+    downscale: Optional[int] = None,
+) -> SceneDetectionResult:
+    """Run scene detection for one video (process pool entry point)."""
+    detector = SceneDetector(
+        min_scene_len=min_scene_len,
+        threshold=threshold,
+        use_adaptive=use_adaptive,
+        downscale=downscale,
+    )
+    return detector.detect_scenes(video_path)
+
+
+def detect_scenes_batch(
+    video_paths: list[str],
+    min_scene_len: float = 1.5,
+    threshold: Optional[float] = None,
+    use_adaptive: bool = True,
+    max_workers: Optional[int] = None,
+) -> list[SceneDetectionResult]:
+    """Detect scene boundaries in several videos in parallel.
+
+    Each video is analyzed in its own worker process, so detection runs on
+    all cores instead of being serialized by the GIL.
+
+    Args:
+        video_paths: Paths to video files
+        min_scene_len: Minimum scene length in seconds
+        threshold: Detection threshold (auto-set based on detector type)
+        use_adaptive: Use AdaptiveDetector for talking-head videos
+        max_workers: Maximum worker processes (default: CPU count)
+
+    Returns:
+        List of SceneDetectionResult objects, in the order of video_paths
+    """
+    if threshold is None:
+        threshold = 3.0 if use_adaptive else 27.0
+
+    if not video_paths:
+        return []
+
+    max_workers = min(max_workers or os.cpu_count() or 1, len(video_paths))
+    worker = partial(
+        _detect_scenes_worker,
+        min_scene_len=min_scene_len,
+        threshold=threshold,
+        use_adaptive=use_adaptive,
+    )
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(worker, video_paths))
@@ -1,17 +1,54 @@
 """Video splitting module using FFmpeg."""
 
 import asyncio
+import bisect
+import logging
+import os
+import shutil
+import signal
 import subprocess
-import uuid
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Awaitable, Callable, Optional, TypeVar
 
+import orjson
 import structlog
 
 from .models import ClipDefinition, ClipResult
 
 logger = structlog.get_logger(__name__)
 
+# Hardware H.264 encoders in order of preference
+HW_ENCODERS = {
+    "nvenc": "h264_nvenc",
+    "vaapi": "h264_vaapi",
+    "videotoolbox": "h264_videotoolbox",
+}
+VAAPI_DEVICE = "/dev/dri/renderD128"
+# Concurrent NVENC sessions allowed by current consumer GPU drivers
+NVENC_MAX_SESSIONS = 8
+
+# Maximum stream-copied clips cut by a single FFmpeg process
+EXTRACT_BATCH_SIZE = 16
+
+# Read size when streaming clip output from an FFmpeg pipe (1MB)
+STREAM_READ_SIZE = 1024 * 1024
+
+# FFmpeg errors after which no other clip can succeed either
+FATAL_FFMPEG_ERRORS = (
+    "No space left on device",
+    "Disk quota exceeded",
+    "Read-only file system",
+)
+# Seconds FFmpeg gets to finalize outputs after SIGINT before it is killed
+FFMPEG_STOP_GRACE = 5.0
+
+# Fragmented MP4 never seeks back to write the moov atom, so it can be piped
+# and skips the +faststart rewrite of the finished file
+FRAGMENTED_MOVFLAGS = "+frag_keyframe+empty_moov+default_base_moof"
+
+T = TypeVar("T")
+
 
 class VideoSplitError(Exception):
     """Error during video splitting."""
@@ -19,6 +56,130 @@ class VideoSplitError(Exception):
     pass
 
 
+@lru_cache(maxsize=8)
+def _which(program: str) -> str:
+    """Resolve a program to an absolute path, falling back to its name."""
+    return shutil.which(program) or program
+
+
+async def _create_process(cmd: list[str], **kwargs) -> asyncio.subprocess.Process:
+    """Spawn an FFmpeg tool without scanning the parent's fd table.
+
+    Python opens every fd non-inheritable (PEP 446), so close_fds adds nothing
+    but a walk over the worker's open sockets. Together with an absolute
+    executable path this lets CPython launch via posix_spawn.
+    """
+    return await asyncio.create_subprocess_exec(
+        _which(cmd[0]), *cmd[1:], close_fds=False, **kwargs
+    )
+
+
+async def _stop_process(
+    process: asyncio.subprocess.Process, grace: float = FFMPEG_STOP_GRACE
+) -> None:
+    """Stop FFmpeg, letting it flush its outputs before resorting to SIGKILL."""
+    if process.returncode is not None:
+        return
+    try:
+        process.send_signal(signal.SIGINT)
+        await asyncio.wait_for(process.wait(), timeout=grace)
+    except ProcessLookupError:
+        pass
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+
+
+def _debug_logging_enabled() -> bool:
+    """Check whether debug events would be emitted by the configured logger."""
+    is_enabled_for = getattr(logger.bind(), "is_enabled_for", None)
+    return is_enabled_for is None or is_enabled_for(logging.DEBUG)
+
+
+def _is_fatal(error: BaseException) -> bool:
+    """Check whether a clip failure means the whole split must stop."""
+    return isinstance(error, VideoSplitError) and any(
+        message in str(error) for message in FATAL_FFMPEG_ERRORS
+    )
+
+
+@lru_cache(maxsize=1)
+def _available_encoders() -> frozenset[str]:
+    """List the encoders compiled into the local FFmpeg build."""
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return frozenset()
+
+    encoders = set()
+    for line in result.stdout.splitlines():
+        parts = line.split()
+        # Encoder lines look like " V....D h264_nvenc  NVIDIA NVENC ..."
+        if len(parts) >= 2 and len(parts[0]) == 6:
+            encoders.add(parts[1])
+    return frozenset(encoders)
+
+
+@lru_cache(maxsize=None)
+def _hardware_encoder_works(backend: str) -> bool:
+    """Check that a hardware encoder can actually encode on this host.
+
+    ``ffmpeg -encoders`` only lists what was compiled in (distro builds list
+    NVENC and VAAPI everywhere), so this runs a one-frame trial encode.
+    """
+    cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error"]
+    if backend == "vaapi":
+        cmd += ["-vaapi_device", VAAPI_DEVICE]
+    cmd += ["-f", "lavfi", "-i", "nullsrc=s=256x256", "-frames:v", "1"]
+    if backend == "vaapi":
+        cmd += ["-vf", "format=nv12,hwupload"]
+    cmd += ["-c:v", HW_ENCODERS[backend], "-f", "null", "-"]
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+
+    if result.returncode != 0:
+        logger.info(
+            "Hardware encoder unusable, skipping",
+            encoder=HW_ENCODERS[backend],
+            error=result.stderr.strip()[-200:],
+        )
+        return False
+    return True
+
+
+async def _nvenc_sessions_in_use() -> int:
+    """Count NVENC sessions currently open on the first GPU."""
+    try:
+        process = await _create_process(
+            [
+                "nvidia-smi",
+                "--query-gpu=encoder.stats.sessionCount",
+                "--format=csv,noheader",
+            ],
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except OSError:
+        return 0
+    try:
+        stdout, _ = await asyncio.wait_for(process.communicate(), timeout=10)
+        return int(stdout.decode().splitlines()[0])
+    except (asyncio.TimeoutError, IndexError, ValueError):
+        return 0
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+
+
 class VideoSplitter:
     """Splits videos into clips using FFmpeg."""
 
@@ -31,6 +192,13 @@ class VideoSplitter:
         audio_bitrate: str = "128k",
         thumbnail_time_offset: float = 0.5,
         fast_mode: bool = True,  # Use stream copy for faster processing
+        keyframe_tolerance: Optional[float] = 0.05,
+        encoder_backend: str = "auto",
+        threads_per_encode: int = 2,
+        preset: str = "veryfast",
+        crf: Optional[int] = 23,
+        accurate_seek: bool = True,
+        archival: bool = False,
     ):
         """Initialize the video splitter.
 
@@ -42,6 +210,20 @@ class VideoSplitter:
             audio_bitrate: Audio bitrate (e.g., "128k")
             thumbnail_time_offset: Time offset in seconds for thumbnail
             fast_mode: Use stream copy instead of re-encoding (10-100x faster)
+            keyframe_tolerance: In quality mode, stream copy clips whose start
+                lies within this many seconds after a source keyframe
+                (None always re-encodes)
+            encoder_backend: Encoder for H.264 re-encodes ("auto", "nvenc",
+                "vaapi", "videotoolbox" or "software")
+            threads_per_encode: FFmpeg threads per software encode, used to
+                size the default clip concurrency
+            preset: Software encoder preset (e.g., "veryfast")
+            crf: Constant rate factor for software encodes; None encodes at
+                video_bitrate instead
+            accurate_seek: Decode from the prior keyframe up to the exact start
+                when re-encoding; False starts re-encoded clips at that keyframe
+            archival: Write regular MP4 with the moov atom moved to the front
+                (+faststart) instead of fragmented MP4
         """
         self.output_format = output_format
         self.video_codec = video_codec
@@ -50,6 +232,112 @@ class VideoSplitter:
         self.audio_bitrate = audio_bitrate
         self.thumbnail_time_offset = thumbnail_time_offset
         self.fast_mode = fast_mode
+        self.keyframe_tolerance = keyframe_tolerance
+        self._keyframe_cache: dict[str, list[float]] = {}
+        self._probe_cache: dict[str, dict] = {}
+        self.encoder_backend = self._resolve_encoder_backend(encoder_backend)
+        self.threads_per_encode = threads_per_encode
+        self.preset = preset
+        self.crf = crf
+        self.accurate_seek = accurate_seek
+        self.archival = archival
+        # Checked once so per-clip debug events cost nothing in production
+        self._debug_enabled = _debug_logging_enabled()
+
+    def _resolve_encoder_backend(self, encoder_backend: str) -> str:
+        """Pick the encoder backend used when re-encoding clips.
+
+        Hardware encoders only replace libx264, so any other configured
+        codec always uses the software path.
+        """
+        if encoder_backend != "auto":
+            if encoder_backend != "software" and encoder_backend not in HW_ENCODERS:
+                raise ValueError(f"Unknown encoder backend: {encoder_backend}")
+            return encoder_backend
+
+        if self.video_codec != "libx264":
+            return "software"
+
+        available = _available_encoders()
+        for backend, encoder in HW_ENCODERS.items():
+            if encoder in available and _hardware_encoder_works(backend):
+                logger.info("Using hardware encoder", encoder=encoder)
+                return backend
+        return "software"
+
+    async def _default_concurrency(self) -> int:
+        """Size clip concurrency to the encoder that bounds throughput.
+
+        Software encodes share the CPU cores; NVENC is capped by the free
+        encoder sessions on the GPU.
+        """
+        cpu_slots = max(1, (os.cpu_count() or 1) // self.threads_per_encode)
+        if self.encoder_backend == "nvenc":
+            free_sessions = NVENC_MAX_SESSIONS - await _nvenc_sessions_in_use()
+            return max(1, min(cpu_slots, free_sessions))
+        return cpu_slots
+
+    def _encode_args(self) -> tuple[list[str], list[str]]:
+        """Build FFmpeg input and video output arguments for re-encoding.
+
+        Returns:
+            Tuple of (arguments placed before -i, video codec arguments)
+        """
+        bitrate_args = ["-b:v", self.video_bitrate]
+        if self.encoder_backend == "nvenc":
+            return (
+                ["-hwaccel", "cuda", "-hwaccel_output_format", "cuda"],
+                [
+                    "-c:v",
+                    HW_ENCODERS["nvenc"],
+                    "-preset",
+                    "p4",
+                    "-tune",
+                    "hq",
+                    *bitrate_args,
+                ],
+            )
+        if self.encoder_backend == "vaapi":
+            # Keep decoded frames on the GPU to avoid a download/upload round trip
+            return (
+                [
+                    "-hwaccel",
+                    "vaapi",
+                    "-hwaccel_device",
+                    VAAPI_DEVICE,
+                    "-hwaccel_output_format",
+                    "vaapi",
+                ],
+                ["-c:v", HW_ENCODERS["vaapi"], *bitrate_args],
+            )
+        if self.encoder_backend == "videotoolbox":
+            return [], ["-c:v", HW_ENCODERS["videotoolbox"], *bitrate_args]
+
+        video_args = [
+            "-c:v",
+            self.video_codec,
+            "-preset",
+            self.preset,
+            "-threads",
+            str(self.threads_per_encode),
+        ]
+        if self.crf is not None:
+            video_args += ["-crf", str(self.crf)]
+        else:
+            video_args += bitrate_args
+        if self.video_codec == "libx264":
+            # Short clips gain little from deep lookahead, many refs or B-frames;
+            # no -tune fastdecode, which would also drop CABAC and deblocking
+            video_args += [
+                "-x264-params",
+                "rc-lookahead=10:ref=1:bframes=0",
+            ]
+        return [], video_args
+
+    @property
+    def _movflags(self) -> str:
+        """MP4 flags for clip files; both layouts play while downloading."""
+        return "+faststart" if self.archival else FRAGMENTED_MOVFLAGS
 
     async def _run_ffmpeg(self, cmd: list[str], timeout: int = 120) -> None:
         """Run FFmpeg command asynchronously.
@@ -58,14 +346,15 @@ class VideoSplitter:
             cmd: FFmpeg command and arguments
             timeout: Command timeout in seconds
         """
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
+        # Only errors are written to stderr, so there is no progress output to drain
+        process = await _create_process(
+            [cmd[0], "-nostats", "-loglevel", "error", *cmd[1:]],
+            stdout=asyncio.subprocess.DEVNULL,
             stderr=asyncio.subprocess.PIPE,
         )
 
         try:
-            stdout, stderr = await asyncio.wait_for(
+            _, stderr = await asyncio.wait_for(
                 process.communicate(),
                 timeout=timeout,
             )
@@ -75,7 +364,157 @@ class VideoSplitter:
 
         except asyncio.TimeoutError:
             process.kill()
+            await process.wait()
             raise VideoSplitError("FFmpeg command timed out")
+        except asyncio.CancelledError:
+            await _stop_process(process)
+            raise
+
+    async def _probe(self, video_path: str) -> dict:
+        """Get ffprobe stream and format metadata, cached per path.
+
+        Args:
+            video_path: Path to source video
+
+        Returns:
+            Parsed ffprobe JSON (empty if probing fails)
+        """
+        if video_path in self._probe_cache:
+            return self._probe_cache[video_path]
+
+        cmd = [
+            "ffprobe",
+            "-v",
+            "error",
+            "-print_format",
+            "json",
+            "-show_streams",
+            "-show_format",
+            video_path,
+        ]
+
+        info: dict = {}
+        try:
+            process = await _create_process(
+                cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=30)
+            if process.returncode == 0:
+                info = orjson.loads(stdout)
+        except (OSError, orjson.JSONDecodeError, asyncio.TimeoutError) as e:
+            logger.warning("Video probe failed", video=video_path, error=str(e))
+
+        self._probe_cache[video_path] = info
+        return info
+
+    async def _get_duration(self, video_path: str) -> Optional[float]:
+        """Get the source duration in seconds, or None if unknown."""
+        info = await self._probe(video_path)
+        try:
+            return float(info["format"]["duration"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    async def _get_keyframes(self, video_path: str) -> list[float]:
+        """Get sorted keyframe timestamps of a video, cached per path.
+
+        Reads packet flags only, so nothing is decoded.
+
+        Args:
+            video_path: Path to source video
+
+        Returns:
+            Keyframe timestamps in seconds (empty if probing fails)
+        """
+        if video_path in self._keyframe_cache:
+            return self._keyframe_cache[video_path]
+
+        info = await self._probe(video_path)
+        streams = info.get("streams", [])
+        if info and not any(s.get("codec_type") == "video" for s in streams):
+            self._keyframe_cache[video_path] = []
+            return []
+
+        cmd = [
+            "ffprobe",
+            "-v",
+            "error",
+            "-select_streams",
+            "v:0",
+            "-show_entries",
+            "packet=pts_time,flags",
+            "-of",
+            "csv=p=0",
+            video_path,
+        ]
+
+        keyframes: list[float] = []
+        try:
+            process = await _create_process(
+                cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=60)
+            if process.returncode == 0:
+                for line in stdout.decode().splitlines():
+                    pts_time, _, flags = line.partition(",")
+                    if "K" in flags and pts_time not in ("", "N/A"):
+                        keyframes.append(float(pts_time))
+                keyframes.sort()
+        except (OSError, ValueError, asyncio.TimeoutError) as e:
+            logger.warning("Keyframe probe failed", video=video_path, error=str(e))
+            keyframes = []
+
+        self._keyframe_cache[video_path] = keyframes
+        return keyframes
+
+    async def _snap_to_keyframe(
+        self, video_path: str, start_time: float
+    ) -> Optional[float]:
+        """Find the keyframe a clip can be stream-copied from.
+
+        Args:
+            video_path: Path to source video
+            start_time: Requested clip start in seconds
+
+        Returns:
+            Nearest keyframe at or before start_time within the tolerance,
+            or None if the clip must be re-encoded
+        """
+        if self.keyframe_tolerance is None:
+            return None
+
+        keyframes = await self._get_keyframes(video_path)
+        i = bisect.bisect_right(keyframes, start_time + 1e-6)
+        if i == 0:
+            return None
+
+        keyframe = keyframes[i - 1]
+        if start_time - keyframe > self.keyframe_tolerance:
+            return None
+        return keyframe
+
+    async def _stream_copy_window(
+        self, video_path: str, start_time: float, end_time: float
+    ) -> Optional[tuple[float, float]]:
+        """Decide whether a clip can be stream copied.
+
+        In quality mode a clip starting on a keyframe is still frame-accurate
+        when stream copied, so only off-keyframe starts need re-encoding.
+
+        Returns:
+            Tuple of (copy start, duration), or None to re-encode
+        """
+        if self.fast_mode:
+            return start_time, end_time - start_time
+
+        keyframe = await self._snap_to_keyframe(video_path, start_time)
+        if keyframe is None:
+            return None
+        return keyframe, end_time - keyframe
 
     async def extract_clip(
         self,
@@ -83,30 +522,148 @@ class VideoSplitter:
         start_time: float,
         end_time: float,
         output_path: str,
+        thumbnail_path: Optional[str] = None,
+        thumbnail_offset: Optional[float] = None,
     ) -> str:
         """Extract a single clip from video.
 
+        The output directory must already exist.
+
         Args:
             video_path: Path to source video
             start_time: Start time in seconds
             end_time: End time in seconds
             output_path: Path for output clip
+            thumbnail_path: Also write a thumbnail here in the same FFmpeg pass
+            thumbnail_offset: Thumbnail time within the clip (default: use
+                configured offset)
 
         Returns:
             Path to extracted clip
         """
+        cmd, stream_copy, hw_frames = await self._clip_command(
+            video_path, start_time, end_time, self._movflags
+        )
+        cmd += ["-y", output_path]
+
+        if thumbnail_path is not None:
+            if thumbnail_offset is None:
+                thumbnail_offset = self.thumbnail_time_offset
+            cmd += self._thumbnail_output(
+                "0:v:0", thumbnail_offset, thumbnail_path, hw_frames=hw_frames
+            )
+
+        if self._debug_enabled:
+            logger.debug(
+                "Extracting clip",
+                start=start_time,
+                end=end_time,
+                duration=end_time - start_time,
+                output=output_path,
+                fast_mode=self.fast_mode,
+                stream_copy=stream_copy,
+            )
+
+        await self._run_ffmpeg(cmd)
+        return output_path
+
+    async def extract_clip_to_stream(
+        self,
+        video_path: str,
+        start_time: float,
+        end_time: float,
+        chunk_size: int = STREAM_READ_SIZE,
+        thumbnail_path: Optional[str] = None,
+        thumbnail_offset: Optional[float] = None,
+    ) -> AsyncIterator[bytes]:
+        """Extract a single clip as fragmented MP4, yielding it as it's produced.
+
+        The clip is not written to local disk, so the consumer (e.g. an R2
+        multipart upload) can overlap with extraction.
+
+        Args:
+            video_path: Path to source video
+            start_time: Start time in seconds
+            end_time: End time in seconds
+            chunk_size: Maximum bytes per yielded chunk
+            thumbnail_path: Also write a thumbnail here in the same FFmpeg
+                pass; it is complete once the stream is exhausted
+            thumbnail_offset: Thumbnail time within the clip (default: use
+                configured offset)
+
+        Yields:
+            Chunks of the MP4 output
+        """
+        cmd, stream_copy, hw_frames = await self._clip_command(
+            video_path, start_time, end_time, FRAGMENTED_MOVFLAGS
+        )
+        cmd += ["-f", "mp4", "pipe:1"]
+
+        if thumbnail_path is not None:
+            if thumbnail_offset is None:
+                thumbnail_offset = self.thumbnail_time_offset
+            cmd += self._thumbnail_output(
+                "0:v:0", thumbnail_offset, thumbnail_path, hw_frames=hw_frames
+            )
+
+        if self._debug_enabled:
+            logger.debug(
+                "Streaming clip",
+                start=start_time,
+                end=end_time,
+                stream_copy=stream_copy,
+            )
+
+        process = await _create_process(
+            [cmd[0], "-nostats", "-loglevel", "error", *cmd[1:]],
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        # Drain stderr alongside stdout so a chatty error can't fill its pipe
+        stderr_task = asyncio.ensure_future(process.stderr.read())
+
+        try:
+            while chunk := await process.stdout.read(chunk_size):
+                yield chunk
+
+            await process.wait()
+            stderr = await stderr_task
+            if process.returncode != 0:
+                raise VideoSplitError(f"FFmpeg error: {stderr.decode()}")
+        finally:
+            if process.returncode is None:
+                # Consumer stopped early or failed
+                process.kill()
+                await process.wait()
+            stderr_task.cancel()
+
+    async def _clip_command(
+        self,
+        video_path: str,
+        start_time: float,
+        end_time: float,
+        movflags: str,
+    ) -> tuple[list[str], bool, bool]:
+        """Build the FFmpeg command for a clip, up to its output target.
+
+        Returns:
+            Tuple of (command, whether streams are copied, whether decoded
+            frames live on the GPU)
+        """
         duration = end_time - start_time
 
-        # Ensure output directory exists
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        copy_window = await self._stream_copy_window(video_path, start_time, end_time)
+        stream_copy = copy_window is not None
+        hw_frames = False
 
-        if self.fast_mode:
+        if copy_window is not None:
+            copy_start, duration = copy_window
             # FAST MODE: Use stream copy (no re-encoding) - 10-100x faster
             # Note: Cuts may not be frame-accurate (keyframe aligned)
             cmd = [
                 "ffmpeg",
                 "-ss",
-                str(start_time),
+                str(copy_start),
                 "-i",
                 video_path,
                 "-t",
@@ -116,47 +673,83 @@ class VideoSplitter:
                 "-avoid_negative_ts",
                 "make_zero",  # Fix timestamp issues
                 "-movflags",
-                "+faststart",  # Enable streaming
-                "-y",
-                output_path,
+                movflags,
             ]
         else:
             # QUALITY MODE: Re-encode video (slower but frame-accurate)
+            input_args, video_args = self._encode_args()
+            hw_frames = self.encoder_backend in ("nvenc", "vaapi")
+            if not self.accurate_seek:
+                input_args = [*input_args, "-noaccurate_seek"]
             cmd = [
                 "ffmpeg",
+                *input_args,
                 "-ss",
                 str(start_time),
                 "-i",
                 video_path,
                 "-t",
                 str(duration),
-                "-c:v",
-                self.video_codec,
+                *video_args,
                 "-c:a",
                 self.audio_codec,
-                "-b:v",
-                self.video_bitrate,
                 "-b:a",
                 self.audio_bitrate,
-                "-preset",
-                "fast",
                 "-movflags",
-                "+faststart",  # Enable streaming
-                "-y",
-                output_path,
+                movflags,
             ]
 
-        logger.debug(
-            "Extracting clip",
-            start=start_time,
-            end=end_time,
-            duration=duration,
-            output=output_path,
-            fast_mode=self.fast_mode,
-        )
+        return cmd, stream_copy, hw_frames
 
-        await self._run_ffmpeg(cmd)
-        return output_path
+    def _thumbnail_filter(
+        self, width: int = 640, height: int = 360, hw_frames: bool = False
+    ) -> str:
+        """Build the scale/pad filter used for thumbnails.
+
+        GPU-resident frames are scaled on the device, so only the small
+        thumbnail is downloaded for padding and JPEG encoding.
+        """
+        fit = "force_original_aspect_ratio=decrease"
+        pad = f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2"
+        if hw_frames and self.encoder_backend == "nvenc":
+            scale = f"scale_cuda={width}:{height}:{fit},hwdownload,format=nv12"
+        elif hw_frames and self.encoder_backend == "vaapi":
+            scale = (
+                f"scale_vaapi=w={width}:h={height}:{fit}:format=nv12,"
+                "hwdownload,format=nv12"
+            )
+        else:
+            scale = f"scale={width}:{height}:{fit}"
+        return f"{scale},{pad}"
+
+    def _thumbnail_output(
+        self,
+        stream: str,
+        time_offset: float,
+        output_path: str,
+        hw_frames: bool = False,
+    ) -> list[str]:
+        """Build FFmpeg output arguments that add a thumbnail to a command.
+
+        Args:
+            stream: Input video stream to map (e.g. "0:v:0")
+            time_offset: Thumbnail time relative to the seeked input
+            output_path: Path for output thumbnail
+            hw_frames: Decoded frames live on the GPU
+        """
+        vf = self._thumbnail_filter(hw_frames=hw_frames)
+        return [
+            "-map",
+            stream,
+            "-ss",
+            str(time_offset),
+            "-frames:v",
+            "1",
+            "-vf",
+            vf,
+            "-y",
+            output_path,
+        ]
 
     async def generate_thumbnail(
         self,
@@ -165,15 +758,22 @@ class VideoSplitter:
         time_offset: Optional[float] = None,
         width: int = 640,
         height: int = 360,
+        keyframe_only: bool = False,
     ) -> str:
         """Generate a thumbnail from video.
 
+        Clips extracted by split_video already get their thumbnail in the
+        extraction pass; this is for standalone videos. The output directory
+        must already exist.
+
         Args:
             video_path: Path to video file
             output_path: Path for output thumbnail
             time_offset: Time in video for thumbnail (default: use configured offset)
             width: Thumbnail width
             height: Thumbnail height
+            keyframe_only: Use the keyframe at or before time_offset, so only a
+                single frame is decoded
 
         Returns:
             Path to generated thumbnail
@@ -181,25 +781,35 @@ class VideoSplitter:
         if time_offset is None:
             time_offset = self.thumbnail_time_offset
 
-        # Ensure output directory exists
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-
         # FFmpeg command for thumbnail generation
+        # The keyframe lands before time_offset, so its timestamp is negative
+        # and must be passed through rather than dropped
+        # With a GPU encoder configured, decode and scale on the GPU as well
+        hw_frames = self.encoder_backend in ("nvenc", "vaapi")
+        seek_args, sync_args = [], []
+        if hw_frames:
+            seek_args = self._encode_args()[0]
+        if keyframe_only:
+            seek_args = [*seek_args, "-skip_frame", "nokey", "-noaccurate_seek"]
+            sync_args = ["-fps_mode", "passthrough"]
         cmd = [
             "ffmpeg",
+            *seek_args,
             "-ss",
             str(time_offset),
             "-i",
             video_path,
-            "-vframes",
+            *sync_args,
+            "-frames:v",
             "1",
             "-vf",
-            f"scale={width}:{height}:force_original_aspect_ratio=decrease,pad={width}:{height}:(ow-iw)/2:(oh-ih)/2",
+            self._thumbnail_filter(width, height, hw_frames=hw_frames),
             "-y",
             output_path,
         ]
 
-        logger.debug("Generating thumbnail", video=video_path, output=output_path)
+        if self._debug_enabled:
+            logger.debug("Generating thumbnail", video=video_path, output=output_path)
 
         await self._run_ffmpeg(cmd, timeout=30)
         return output_path
@@ -212,6 +822,9 @@ class VideoSplitter:
     ) -> ClipResult:
         """Extract a single clip with thumbnail.
 
+        The output directory must already exist; split_video creates it once
+        for all clips.
+
         Args:
             video_path: Path to source video
             clip: Clip definition
@@ -220,45 +833,105 @@ class VideoSplitter:
         Returns:
             ClipResult with paths to clip and thumbnail
         """
-        output_dir = Path(output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        # Output paths
-        clip_filename = f"{clip.clip_id}.{self.output_format}"
-        thumb_filename = f"{clip.clip_id}_thumb.jpg"
-        clip_path = str(output_dir / clip_filename)
-        thumb_path = str(output_dir / thumb_filename)
+        clip_path, thumb_path = self._output_paths(clip, Path(output_dir))
 
-        # Extract clip
+        # Extract clip and thumbnail in a single FFmpeg pass
         await self.extract_clip(
             video_path,
             clip.start_time,
             clip.end_time,
             clip_path,
+            thumbnail_path=thumb_path,
+            thumbnail_offset=self._thumbnail_offset(clip),
         )
 
-        # Generate thumbnail
+        return self._clip_result(clip, clip_path, thumb_path)
+
+    def _output_paths(self, clip: ClipDefinition, output_dir: Path) -> tuple[str, str]:
+        """Get the clip and thumbnail output paths for a clip."""
+        clip_filename = f"{clip.clip_id}.{self.output_format}"
+        thumb_filename = f"{clip.clip_id}_thumb.jpg"
+        return str(output_dir / clip_filename), str(output_dir / thumb_filename)
+
+    def _thumbnail_offset(self, clip: ClipDefinition) -> float:
+        """Get the thumbnail time within a clip."""
         # Use middle of clip or thumbnail_time_offset, whichever is smaller
-        duration = clip.end_time - clip.start_time
-        thumb_offset = min(self.thumbnail_time_offset, duration / 2)
-        await self.generate_thumbnail(clip_path, thumb_path, time_offset=thumb_offset)
+        return min(self.thumbnail_time_offset, (clip.end_time - clip.start_time) / 2)
 
+    def _clip_result(
+        self, clip: ClipDefinition, clip_path: str, thumb_path: str
+    ) -> ClipResult:
+        """Build the result for an extracted clip."""
         return ClipResult(
             clip_id=clip.clip_id,
             start_time=clip.start_time,
             end_time=clip.end_time,
-            duration=duration,
+            duration=clip.end_time - clip.start_time,
             video_path=clip_path,
             thumbnail_path=thumb_path,
             transcript=clip.transcript,
         )
 
+    async def _extract_clips_batch(
+        self,
+        video_path: str,
+        windows: list[tuple[float, float]],
+        clips: list[ClipDefinition],
+        output_dir: Path,
+    ) -> list[ClipResult]:
+        """Stream copy several clips and their thumbnails with one FFmpeg process.
+
+        Each clip is still its own input-seeked demuxer over the source; the
+        saving is one FFmpeg process start per batch instead of one per clip.
+
+        Args:
+            video_path: Path to source video
+            windows: (copy start, duration) for each clip
+            clips: Clip definitions, in the same order as windows
+            output_dir: Directory for output files
+
+        Returns:
+            List of ClipResult objects
+        """
+        cmd = ["ffmpeg"]
+        for copy_start, duration in windows:
+            cmd += ["-ss", str(copy_start), "-t", str(duration), "-i", video_path]
+
+        results = []
+        for i, clip in enumerate(clips):
+            clip_path, thumb_path = self._output_paths(clip, output_dir)
+            cmd += [
+                "-map",
+                f"{i}:v:0",
+                "-map",
+                f"{i}:a:0?",
+                "-c",
+                "copy",
+                "-avoid_negative_ts",
+                "make_zero",
+                "-movflags",
+                self._movflags,
+                "-y",
+                clip_path,
+            ]
+            cmd += self._thumbnail_output(
+                f"{i}:v:0", self._thumbnail_offset(clip), thumb_path
+            )
+            results.append(self._clip_result(clip, clip_path, thumb_path))
+
+        if self._debug_enabled:
+            logger.debug("Extracting clip batch", video=video_path, clips=len(clips))
+
+        await self._run_ffmpeg(cmd, timeout=120 + 10 * len(clips))
+        return results
+
     async def split_video(
         self,
         video_path: str,
         clips: list[ClipDefinition],
         output_dir: str,
-        max_concurrent: int = 3,
+        max_concurrent: Optional[int] = None,
+        on_clip_ready: Optional[Callable[[ClipResult], None]] = None,
     ) -> list[ClipResult]:
         """Split video into multiple clips.
 
@@ -266,7 +939,11 @@ class VideoSplitter:
             video_path: Path to source video
             clips: List of clip definitions
             output_dir: Directory for output files
-            max_concurrent: Maximum concurrent FFmpeg processes
+            max_concurrent: Maximum concurrent FFmpeg processes (default:
+                sized to CPU cores or free NVENC sessions)
+            on_clip_ready: Called with each ClipResult as soon as its files
+                are written, so callers can start uploading before the
+                remaining clips finish
 
         Returns:
             List of ClipResult objects
@@ -282,26 +959,217 @@ class VideoSplitter:
             output_dir=output_dir,
         )
 
+        out_dir = Path(output_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        total_clips = len(clips)
+        clips = await self._drop_clips_past_end(str(video_path), clips)
+
+        # Stream-copied clips are cut in batches sharing one FFmpeg process;
+        # clips needing a re-encode keep one process each
+        windows = [
+            await self._stream_copy_window(str(video_path), c.start_time, c.end_time)
+            for c in clips
+        ]
+        copy_indices = [i for i, window in enumerate(windows) if window is not None]
+        batches = [
+            copy_indices[i : i + EXTRACT_BATCH_SIZE]
+            for i in range(0, len(copy_indices), EXTRACT_BATCH_SIZE)
+        ]
+        encode_indices = [i for i, window in enumerate(windows) if window is None]
+
         # Process clips with limited concurrency
+        if max_concurrent is None:
+            max_concurrent = await self._default_concurrency()
         semaphore = asyncio.Semaphore(max_concurrent)
+        results: list = [None] * len(clips)
 
         async def process_with_semaphore(clip: ClipDefinition) -> ClipResult:
             async with semaphore:
                 return await self.split_single_clip(str(video_path), clip, output_dir)
 
-        # Process all clips
-        results = await asyncio.gather(
-            *[process_with_semaphore(clip) for clip in clips],
-            return_exceptions=True,
+        async def process_batch(indices: list[int]) -> None:
+            async with semaphore:
+                try:
+                    batch_results = await self._extract_clips_batch(
+                        str(video_path),
+                        [windows[i] for i in indices],
+                        [clips[i] for i in indices],
+                        out_dir,
+                    )
+                except VideoSplitError as e:
+                    if _is_fatal(e):
+                        raise
+                    # Retry clips one by one so a single bad clip can't sink the batch
+                    logger.warning(
+                        "Batched extraction failed, retrying per clip",
+                        clips=len(indices),
+                        error=str(e),
+                    )
+                    batch_results = None
+
+            if batch_results is None:
+                batch_results = await asyncio.gather(
+                    *[process_with_semaphore(clips[i]) for i in indices],
+                    return_exceptions=True,
+                )
+            for i, result in zip(indices, batch_results):
+                results[i] = result
+                if _is_fatal(result):
+                    raise result
+                if on_clip_ready is not None and not isinstance(result, Exception):
+                    on_clip_ready(result)
+
+        async def process_single(index: int) -> None:
+            try:
+                results[index] = await process_with_semaphore(clips[index])
+            except Exception as e:
+                results[index] = e
+                if _is_fatal(e):
+                    raise
+            else:
+                if on_clip_ready is not None:
+                    on_clip_ready(results[index])
+
+        await self._run_clip_tasks(
+            str(video_path),
+            [
+                *[process_batch(batch) for batch in batches],
+                *[process_single(i) for i in encode_indices],
+            ],
+        )
+        return self._successful_results(clips, results, total_clips)
+
+    async def stream_clips(
+        self,
+        video_path: str,
+        clips: list[ClipDefinition],
+        output_dir: str,
+        consume: Callable[[ClipDefinition, AsyncIterator[bytes], str], Awaitable[T]],
+        max_concurrent: Optional[int] = None,
+    ) -> list[T]:
+        """Split video into clips piped to a consumer instead of written to disk.
+
+        Each clip is extracted as fragmented MP4 (the same layout split_video
+        writes unless archival) and handed to consume() as it is produced,
+        e.g. to stream it into an R2 multipart upload. Thumbnails are small
+        and are still written to output_dir, in the same FFmpeg pass.
+
+        Args:
+            video_path: Path to source video
+            clips: List of clip definitions
+            output_dir: Directory for thumbnails
+            consume: Called with (clip, chunks of the clip, thumbnail path); it
+                must read the chunks to the end, after which the thumbnail
+                file is complete
+            max_concurrent: Maximum concurrent FFmpeg processes (default:
+                sized to CPU cores or free NVENC sessions)
+
+        Returns:
+            consume() results for the clips that succeeded, in clip order
+        """
+        if not Path(video_path).exists():
+            raise FileNotFoundError(f"Video file not found: {video_path}")
+
+        logger.info(
+            "Starting streamed video splitting",
+            video=video_path,
+            total_clips=len(clips),
         )
 
-        # Filter out errors and log them
+        out_dir = Path(output_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        total_clips = len(clips)
+        clips = await self._drop_clips_past_end(video_path, clips)
+
+        if max_concurrent is None:
+            max_concurrent = await self._default_concurrency()
+        semaphore = asyncio.Semaphore(max_concurrent)
+        results: list = [None] * len(clips)
+
+        async def process_single(index: int) -> None:
+            clip = clips[index]
+            _, thumb_path = self._output_paths(clip, out_dir)
+            chunks = self.extract_clip_to_stream(
+                video_path,
+                clip.start_time,
+                clip.end_time,
+                thumbnail_path=thumb_path,
+                thumbnail_offset=self._thumbnail_offset(clip),
+            )
+            try:
+                async with semaphore:
+                    results[index] = await consume(clip, chunks, thumb_path)
+            except Exception as e:
+                results[index] = e
+                if _is_fatal(e):
+                    raise
+            finally:
+                # Stops FFmpeg if the consumer gave up before the end
+                await chunks.aclose()
+
+        await self._run_clip_tasks(
+            video_path, [process_single(i) for i in range(len(clips))]
+        )
+        return self._successful_results(clips, results, total_clips)
+
+    async def _drop_clips_past_end(
+        self, video_path: str, clips: list[ClipDefinition]
+    ) -> list[ClipDefinition]:
+        """Drop clips that start past the end of the source.
+
+        Saves letting FFmpeg fail on each of them.
+        """
+        source_duration = await self._get_duration(video_path)
+        if source_duration is None:
+            return clips
+
+        out_of_range = [c for c in clips if c.start_time >= source_duration]
+        for clip in out_of_range:
+            logger.warning(
+                "Clip starts after end of video",
+                clip_id=clip.clip_id,
+                start=clip.start_time,
+                video_duration=source_duration,
+            )
+        if not out_of_range:
+            return clips
+        return [c for c in clips if c.start_time < source_duration]
+
+    async def _run_clip_tasks(self, video_path: str, coros: list) -> None:
+        """Run clip extraction coroutines until done or one fails fatally.
+
+        A fatal error cancels the rest, which stops their FFmpeg processes
+        instead of letting them run to completion, and is re-raised.
+        """
+        tasks = [asyncio.create_task(coro) for coro in coros]
+        if not tasks:
+            return
+
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        for task in done:
+            if task.exception() is not None:
+                logger.error(
+                    "Aborting video splitting",
+                    video=video_path,
+                    error=str(task.exception()),
+                )
+                raise task.exception()
+
+    def _successful_results(
+        self, clips: list[ClipDefinition], results: list, total_clips: int
+    ) -> list:
+        """Filter out (and log) failed clips from per-clip results."""
         successful_results = []
-        for i, result in enumerate(results):
+        for clip, result in zip(clips, results):
             if isinstance(result, Exception):
                 logger.error(
                     "Failed to extract clip",
-                    clip_id=clips[i].clip_id,
+                    clip_id=clip.clip_id,
                     error=str(result),
                 )
             else:
@@ -311,6 +1179,7 @@ class VideoSplitter:
             "Video splitting completed",
             successful=len(successful_results),
             failed=len(clips) - len(successful_results),
+            skipped=total_clips - len(clips),
         )
 
         return successful_results
@@ -361,8 +1230,9 @@ def create_clip_definitions(
     """
     clips = []
     clip_index = 0
+    segment_index = _index_segments(transcript_segments)
 
-    for scene in scenes:
+    for scene_index, scene in enumerate(scenes):
         scene_start = scene.start_time
         scene_end = scene.end_time
         scene_duration = scene.duration
@@ -374,7 +1244,7 @@ def create_clip_definitions(
         if scene_duration <= max_duration:
             # Scene is within acceptable range
             transcript = _get_transcript_for_range(
-                transcript_segments, scene_start, scene_end
+                transcript_segments, scene_start, scene_end, segment_index
             )
             clips.append(
                 ClipDefinition(
@@ -382,7 +1252,7 @@ def create_clip_definitions(
                     start_time=scene_start,
                     end_time=scene_end,
                     transcript=transcript,
-                    scene_indices=[scenes.index(scene)],
+                    scene_indices=[scene_index],
                 )
             )
             clip_index += 1
@@ -396,6 +1266,7 @@ def create_clip_definitions(
                 max_duration,
                 source_id,
                 clip_index,
+                segment_index,
             )
             clips.extend(sub_clips)
             clip_index += len(sub_clips)
@@ -403,18 +1274,52 @@ def create_clip_definitions(
     return clips
 
 
+def _index_segments(segments: list) -> tuple[list, list[float], list[float]]:
+    """Sort transcript segments by start for range lookups.
+
+    Returns:
+        Tuple of (sorted segments, their start times, running maximum of
+        their end times)
+    """
+    ordered = sorted(segments, key=lambda seg: seg.start)
+    starts = [seg.start for seg in ordered]
+    max_ends = []
+    max_end = float("-inf")
+    for seg in ordered:
+        max_end = max(max_end, seg.end)
+        max_ends.append(max_end)
+    return ordered, starts, max_ends
+
+
+def _segments_in_range(
+    segment_index: tuple[list, list[float], list[float]],
+    start_time: float,
+    end_time: float,
+) -> list:
+    """Get the segments overlapping a time range from an index."""
+    ordered, starts, max_ends = segment_index
+    # Segments before first can't reach start_time; from stop on they start too late
+    first = bisect.bisect_right(max_ends, start_time)
+    stop = bisect.bisect_left(starts, end_time)
+    return [seg for seg in ordered[first:stop] if seg.end > start_time]
+
+
 def _get_transcript_for_range(
     segments: list,
     start_time: float,
     end_time: float,
+    segment_index: Optional[tuple[list, list[float], list[float]]] = None,
 ) -> str:
     """Get transcript text for a time range."""
-    texts = []
-    for segment in segments:
-        # Check if segment overlaps with range
-        if segment.end > start_time and segment.start < end_time:
-            texts.append(segment.text)
-    return " ".join(texts).strip()
+    if segment_index is None:
+        segment_index = _index_segments(segments)
+    # Only the overlapping slice is materialized, joined in a single pass
+    return " ".join(
+        [
+            segment.text
+            for segment in _segments_in_range(segment_index, start_time, end_time)
+        ]
+    ).strip()
 
 
 def _split_long_scene(
@@ -425,6 +1330,7 @@ def _split_long_scene(
     max_duration: float,
     source_id: str,
     start_index: int,
+    segment_index: Optional[tuple[list, list[float], list[float]]] = None,
 ) -> list[ClipDefinition]:
     """Split a long scene into smaller clips at natural breaks."""
     clips = []
@@ -432,11 +1338,9 @@ def _split_long_scene(
     clip_index = start_index
 
     # Find transcript segments within this scene
-    relevant_segments = [
-        seg
-        for seg in transcript_segments
-        if seg.end > start_time and seg.start < end_time
-    ]
+    if segment_index is None:
+        segment_index = _index_segments(transcript_segments)
+    relevant_segments = _segments_in_range(segment_index, start_time, end_time)
 
     if not relevant_segments:
         # No transcript, just split evenly
@@ -456,6 +1360,12 @@ def _split_long_scene(
         return clips
 
     # Try to split at sentence/segment boundaries
+    # Segments are sorted by start, so each window is found by bisection and
+    # sentence ends are checked once up front
+    seg_starts = [seg.start for seg in relevant_segments]
+    sentence_ends = [
+        seg.text.rstrip().endswith((".", "!", "?")) for seg in relevant_segments
+    ]
     accumulated_text = []
     segment_idx = 0
 
@@ -465,16 +1375,15 @@ def _split_long_scene(
         # Find best break point
         best_break = current_start + min_duration
         accumulated_text = []
+        window_end = bisect.bisect_left(seg_starts, target_end, lo=segment_idx)
 
-        for seg in relevant_segments[segment_idx:]:
-            if seg.start >= target_end:
-                break
-
+        for i in range(segment_idx, window_end):
+            seg = relevant_segments[i]
             if seg.start >= current_start:
                 accumulated_text.append(seg.text)
                 # Check if this is a good break point (end of sentence)
                 if seg.end >= current_start + min_duration:
-                    if seg.text.rstrip().endswith((".", "!", "?")):
+                    if sentence_ends[i]:
                         best_break = seg.end
                         if seg.end >= current_start + (max_duration * 0.7):
                             # Good enough break point
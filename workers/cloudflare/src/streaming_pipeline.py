@@ -2,8 +2,9 @@
 
 This pipeline is designed to handle large video files without memory overflow:
 - Streams video download directly to disk (never loads full video in memory)
-- Uses chunked transcription for audio files >25MB
-- Uploads clips directly to R2 from container (bypasses Worker)
+- Transcribes audio as parallel 30-second chunks
+- Uploads clips directly to R2 from container (bypasses Worker), piping them
+  from FFmpeg into multipart uploads when working files are on disk
 - Sends only metadata to webhook (R2 keys instead of base64 data)
 
 Memory Budget (with 12GB container):
@@ -11,42 +12,79 @@ Memory Budget (with 12GB container):
 - FFmpeg processing: 2-4GB
 - PySceneDetect: 1GB
 - Total: ~6GB (50% headroom)
+
+Working files go on tmpfs (/dev/shm) when the source fits, since it is read
+several times and the clips are read back for upload.
 """
 
 import asyncio
-import hashlib
 import hmac
+import multiprocessing
 import os
 import tempfile
 import time
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional, Union
 
 import httpx
+import orjson
 import structlog
 
+try:
+    import h2  # noqa: F401 - httpx needs h2 for HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 from .models import (
     ClipDefinition,
     ClipResult,
     TranscriptResult,
     TranscriptSegment,
+    WordTimestamp,
 )
 from .r2_client import R2Client, get_r2_client
-from .scene_detect import SceneDetector
-from .split_video import VideoSplitter, create_clip_definitions
-from .transcribe import Transcriber
+from .scene_detect import SceneDetector, _detect_scenes_worker
+from .split_video import (
+    VideoSplitter,
+    _index_segments,
+    _segments_in_range,
+    create_clip_definitions,
+)
+from .transcribe import Transcriber, shift_transcript
 
 logger = structlog.get_logger(__name__)
 
 # Download settings
-DOWNLOAD_CHUNK_SIZE = 8192  # 8KB chunks for streaming download
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB chunks for streaming download
 DOWNLOAD_TIMEOUT = 1800.0  # 30 minutes timeout for large files
 CONNECT_TIMEOUT = 60.0  # 60 seconds connection timeout
+HTTP_TIMEOUT = 30.0  # Default request timeout for the shared client
+DOWNLOAD_PROGRESS_MB = 50  # Log download progress every 50MB
+PARALLEL_DOWNLOAD_THRESHOLD = 64 * 1024 * 1024  # Use ranged download above 64MB
+DOWNLOAD_RANGE_SIZE = 16 * 1024 * 1024  # 16MB per Range request
+DOWNLOAD_RANGE_CONCURRENCY = 8  # Concurrent Range requests per download
+
+# Transcription settings
+TRANSCRIBE_CHUNK_SECONDS = 30  # Audio chunk length for parallel transcription
+TRANSCRIBE_CONCURRENCY = 8  # Concurrent Whisper requests per video
 
+# Upload settings (R2 client pool is far larger, so this is the only limit)
+DEFAULT_UPLOAD_CONCURRENCY = 16
 
-@dataclass
+# Working directory settings (tmpfs pages count against container memory)
+TMPFS_DIR = "/dev/shm"
+TMPFS_MAX_SOURCE_SIZE = 4 * 1024 * 1024 * 1024  # Keep larger sources on disk
+TMPFS_SPACE_FACTOR = 3  # Source + audio chunks + clips, relative to source size
+
+# Webhook settings
+WEBHOOK_SIGN_THREAD_THRESHOLD = 256 * 1024  # Sign larger bodies off the event loop
+
+
+@dataclass(slots=True)
 class StreamingClipMetadata:
     """Metadata for a clip uploaded to R2 (no base64 data)."""
 
@@ -59,7 +97,7 @@ class StreamingClipMetadata:
     transcript: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamingPipelineResult:
     """Result of streaming pipeline (metadata only, no binary data)."""
 
@@ -74,17 +112,265 @@ class StreamingPipelineResult:
     error: Optional[str] = None
 
 
+# Shared HTTP client (connection pool reused across downloads and webhooks)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(HTTP_TIMEOUT, connect=CONNECT_TIMEOUT),
+            limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60),
+            follow_redirects=True,
+        )
+    return _http_client
+
+
+async def aclose_http_client() -> None:
+    """Close the shared HTTP client on shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+# Shared process pool for scene detection (CPU-bound, holds the GIL)
+_scene_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_scene_pool() -> ProcessPoolExecutor:
+    """Get or create the shared scene detection process pool."""
+    global _scene_pool
+    if _scene_pool is None:
+        # forkserver: forking the server process would copy its event loop
+        # and thread state into the workers
+        _scene_pool = ProcessPoolExecutor(
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+    return _scene_pool
+
+
+def shutdown_scene_pool() -> None:
+    """Shut down the scene detection process pool on shutdown."""
+    global _scene_pool
+    if _scene_pool is not None:
+        _scene_pool.shutdown(cancel_futures=True)
+        _scene_pool = None
+
+
+def _sign_webhook_body(secret: bytes, body: bytes) -> str:
+    """HMAC-SHA256 hex signature of a webhook body (receivers verify SHA-256)."""
+    return hmac.digest(secret, body, "sha256").hex()
+
+
+class _DownloadProgress:
+    """Tracks downloaded bytes and logs every DOWNLOAD_PROGRESS_MB."""
+
+    def __init__(self, expected_size: Optional[int]):
+        self.expected_size = expected_size
+        self.total_bytes = 0
+        self._last_bucket = 0
+
+    def add(self, size: int) -> None:
+        self.total_bytes += size
+
+        # Log progress every DOWNLOAD_PROGRESS_MB
+        bucket = (self.total_bytes >> 20) // DOWNLOAD_PROGRESS_MB
+        if bucket != self._last_bucket:
+            self._last_bucket = bucket
+            logger.info(
+                "Download progress",
+                downloaded_mb=round(self.total_bytes / (1024 * 1024), 2),
+                expected_mb=round(self.expected_size / (1024 * 1024), 2) if self.expected_size else "unknown",
+            )
+
+
+class _WrittenPrefix:
+    """Tracks how much of a file is on disk without gaps from its start.
+
+    Ranged downloads finish out of order, so anything reading the file while
+    it downloads may only read up to the gap-free prefix.
+    """
+
+    def __init__(self):
+        self.size = 0
+        self.complete = False
+        self.changed = asyncio.Event()
+        self._ends: dict[int, int] = {}  # Start -> end of extents past a gap
+        self._starts: dict[int, int] = {}  # End -> start of the same extents
+
+    def add(self, offset: int, length: int) -> None:
+        """Record a finished write."""
+        start = self._starts.pop(offset, offset)
+        end = offset + length
+        if start != self.size:
+            self._ends[start] = end
+            self._starts[end] = start
+            return
+
+        self.size = end
+        # Take in the extents this write joined up with
+        while self.size in self._ends:
+            self.size = self._ends.pop(self.size)
+            del self._starts[self.size]
+        self.changed.set()
+
+    def track(self, write: asyncio.Future, offset: int, length: int) -> None:
+        """Record a pending write once it has succeeded."""
+
+        def on_done(future: asyncio.Future) -> None:
+            if not future.cancelled() and future.exception() is None:
+                self.add(offset, length)
+
+        write.add_done_callback(on_done)
+
+    def finish(self) -> None:
+        """Mark the file as fully written."""
+        self.complete = True
+        self.changed.set()
+
+
+def _preallocate(fd: int, size: int) -> None:
+    """Reserve a file's size up front, allocating its extents where supported.
+
+    posix_fallocate is missing on macOS; there the file is only extended.
+    """
+    if hasattr(os, "posix_fallocate"):
+        os.posix_fallocate(fd, 0, size)
+    else:
+        os.ftruncate(fd, size)
+
+
+async def _write_body(
+    response: httpx.Response,
+    fd: int,
+    offset: int,
+    progress: _DownloadProgress,
+    prefix: Optional[_WrittenPrefix] = None,
+) -> int:
+    """Write a streamed response body to a file descriptor at an offset.
+
+    Chunks are already large, so they go straight to the fd and skip Python's
+    buffered IO layer. Each write runs in a thread while the next chunk is
+    read, so disk flushes never block the loop.
+
+    Returns:
+        Bytes written
+    """
+    written = 0
+    pending_write: Optional[asyncio.Future] = None
+    try:
+        async for chunk in response.aiter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            if pending_write is not None:
+                # Shielded: a thread write can't be interrupted, so on
+                # cancellation it is awaited below instead
+                await asyncio.shield(pending_write)
+            pending_write = asyncio.ensure_future(
+                asyncio.to_thread(os.pwrite, fd, chunk, offset + written)
+            )
+            if prefix is not None:
+                prefix.track(pending_write, offset + written, len(chunk))
+            written += len(chunk)
+            progress.add(len(chunk))
+
+        if pending_write is not None:
+            await asyncio.shield(pending_write)
+    finally:
+        if pending_write is not None and not pending_write.done():
+            # Let the in-flight write finish before the caller closes its fd
+            # (asyncio.wait never cancels what it waits on)
+            await asyncio.wait([pending_write])
+    return written
+
+
+async def _get_ranged_size(
+    client: httpx.AsyncClient,
+    url: str,
+    timeout: httpx.Timeout,
+) -> Optional[int]:
+    """Get the object size if the server honours Range requests.
+
+    Presigned URLs are signed for GET only, so this asks for the first byte
+    instead of sending a HEAD.
+    """
+    async with client.stream(
+        "GET", url, headers={"Range": "bytes=0-0"}, timeout=timeout
+    ) as response:
+        response.raise_for_status()
+        content_range = response.headers.get("content-range", "")
+        if response.status_code != 206 or "/" not in content_range:
+            # Ranges unsupported; close without reading the full body
+            return None
+        total = content_range.rsplit("/", 1)[1]
+        return int(total) if total.isdigit() else None
+
+
+async def _download_ranges(
+    client: httpx.AsyncClient,
+    url: str,
+    fd: int,
+    size: int,
+    progress: _DownloadProgress,
+    timeout: httpx.Timeout,
+    prefix: Optional[_WrittenPrefix] = None,
+) -> int:
+    """Download an object as concurrent byte ranges into a preallocated file."""
+    semaphore = asyncio.Semaphore(DOWNLOAD_RANGE_CONCURRENCY)
+
+    async def download_range(start: int) -> int:
+        end = min(start + DOWNLOAD_RANGE_SIZE, size) - 1
+        async with semaphore:
+            async with client.stream(
+                "GET", url, headers={"Range": f"bytes={start}-{end}"}, timeout=timeout
+            ) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise httpx.HTTPError(
+                        f"Expected partial content for range {start}-{end}, "
+                        f"got {response.status_code}"
+                    )
+                written = await _write_body(response, fd, start, progress, prefix)
+
+        if written != end - start + 1:
+            raise httpx.HTTPError(
+                f"Short read for range {start}-{end}: {written} bytes"
+            )
+        return written
+
+    tasks = [
+        asyncio.create_task(download_range(start))
+        for start in range(0, size, DOWNLOAD_RANGE_SIZE)
+    ]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        # Stop the other ranges before the caller closes their fd
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return sum(results)
+
+
 async def stream_download_to_disk(
     url: str,
     dest_path: str,
     timeout: float = DOWNLOAD_TIMEOUT,
+    prefix: Optional[_WrittenPrefix] = None,
 ) -> int:
     """Stream video directly to disk - never hold full file in memory.
 
+    Large objects from servers that support Range requests (like R2) are
+    downloaded as concurrent ranges, each written at its own offset.
+
     Args:
         url: URL to download from (presigned R2 URL)
         dest_path: Local path to save the file
         timeout: Download timeout in seconds (default 30 min)
+        prefix: Updated as the file fills in, for readers of the partial file
 
     Returns:
         Total bytes downloaded
@@ -99,38 +385,60 @@ async def stream_download_to_disk(
         dest_path=dest_path,
     )
 
-    total_bytes = 0
+    client = get_http_client()
+    request_timeout = httpx.Timeout(timeout, connect=CONNECT_TIMEOUT)
+    ranged_size = await _get_ranged_size(client, url, request_timeout)
 
-    async with httpx.AsyncClient(
-        timeout=httpx.Timeout(timeout, connect=CONNECT_TIMEOUT),
-        follow_redirects=True,
-    ) as client:
-        async with client.stream("GET", url) as response:
-            response.raise_for_status()
+    fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if ranged_size is not None and ranged_size >= PARALLEL_DOWNLOAD_THRESHOLD:
+            logger.info(
+                "Download started",
+                expected_size_mb=round(ranged_size / (1024 * 1024), 2),
+                ranges=-(-ranged_size // DOWNLOAD_RANGE_SIZE),
+            )
+            # Ranges complete out of order, so reserve the whole file first
+            _preallocate(fd, ranged_size)
+            progress = _DownloadProgress(ranged_size)
+            await _download_ranges(
+                client, url, fd, ranged_size, progress, request_timeout, prefix
+            )
+        else:
+            async with client.stream("GET", url, timeout=request_timeout) as response:
+                response.raise_for_status()
 
-            # Get expected size if available
-            content_length = response.headers.get("content-length")
-            expected_size = int(content_length) if content_length else None
+                # Get expected size if available
+                content_length = response.headers.get("content-length")
+                expected_size = int(content_length) if content_length else None
 
-            if expected_size:
-                logger.info(
-                    "Download started",
-                    expected_size_mb=round(expected_size / (1024 * 1024), 2),
+                if expected_size:
+                    logger.info(
+                        "Download started",
+                        expected_size_mb=round(expected_size / (1024 * 1024), 2),
+                    )
+
+                # Reserve the file's extents up front so the filesystem isn't
+                # extending (and fragmenting) it on every write. The length
+                # is only the body size when the body isn't content-encoded.
+                preallocated = (
+                    expected_size
+                    if expected_size and "content-encoding" not in response.headers
+                    else 0
                 )
+                if preallocated:
+                    _preallocate(fd, preallocated)
 
-            with open(dest_path, "wb") as f:
-                async for chunk in response.aiter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
-                    f.write(chunk)
-                    total_bytes += len(chunk)
+                progress = _DownloadProgress(expected_size)
+                written = await _write_body(response, fd, 0, progress, prefix)
+                if written < preallocated:
+                    os.ftruncate(fd, written)
+    finally:
+        os.close(fd)
 
-                    # Log progress every 50MB
-                    if total_bytes % (50 * 1024 * 1024) < DOWNLOAD_CHUNK_SIZE:
-                        logger.info(
-                            "Download progress",
-                            downloaded_mb=round(total_bytes / (1024 * 1024), 2),
-                            expected_mb=round(expected_size / (1024 * 1024), 2) if expected_size else "unknown",
-                        )
+    if prefix is not None:
+        prefix.finish()
 
+    total_bytes = progress.total_bytes
     logger.info(
         "Download completed",
         total_bytes=total_bytes,
@@ -140,12 +448,122 @@ async def stream_download_to_disk(
     return total_bytes
 
 
+class _PipeFlow(asyncio.Protocol):
+    """Write pipe protocol exposing flow control as events."""
+
+    def __init__(self):
+        self.writable = asyncio.Event()
+        self.writable.set()
+        self.lost = asyncio.Event()
+
+    def pause_writing(self) -> None:
+        self.writable.clear()
+
+    def resume_writing(self) -> None:
+        self.writable.set()
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.lost.set()
+        self.writable.set()
+
+
+async def _wait_for_event(event: asyncio.Event, reader: asyncio.Future) -> None:
+    """Wait for an event, returning early once the reader is done."""
+    if event.is_set() or reader.done():
+        return
+    waiter = asyncio.ensure_future(event.wait())
+    try:
+        await asyncio.wait([waiter, reader], return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        waiter.cancel()
+
+
+async def _feed_fifo(
+    fifo_path: str,
+    video_path: str,
+    prefix: _WrittenPrefix,
+    reader: asyncio.Future,
+) -> bool:
+    """Copy a file that is still downloading into a FIFO, in order.
+
+    Bytes are read back from the file (normally from the page cache) once
+    the gap-free prefix covers them, so a slow reader never holds up the
+    download. Feeding stops as soon as the reader is done, and closing the
+    write end gives the reader EOF, so an abandoned reader stops too.
+
+    Args:
+        fifo_path: FIFO the reader opens
+        video_path: File being downloaded
+        prefix: Gap-free prefix of video_path written so far
+        reader: Future of the job reading the FIFO
+
+    Returns:
+        True if the whole file was fed, False if the reader finished first
+    """
+    # Opening the write end blocks until the reader opens the FIFO
+    opening = asyncio.ensure_future(asyncio.to_thread(os.open, fifo_path, os.O_WRONLY))
+    try:
+        await asyncio.wait([opening, reader], return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        if not opening.done():
+            # The reader never opened the FIFO; open its read end here so
+            # the open blocked in the thread returns
+            release = os.open(fifo_path, os.O_RDONLY | os.O_NONBLOCK)
+            await asyncio.wait([opening])
+            os.close(release)
+        # Unlinked while the write end is still open, so a reader that only
+        # gets to the FIFO now fails instead of waiting for a writer forever
+        os.unlink(fifo_path)
+
+    flow = _PipeFlow()
+    pipe = open(opening.result(), "wb", buffering=0)
+    try:
+        transport, _ = await asyncio.get_running_loop().connect_write_pipe(
+            lambda: flow, pipe
+        )
+    except BaseException:
+        pipe.close()
+        raise
+
+    source_fd = None
+    offset = 0
+    try:
+        while not reader.done() and not flow.lost.is_set():
+            if offset < prefix.size:
+                if source_fd is None:
+                    source_fd = os.open(video_path, os.O_RDONLY)
+                chunk = await asyncio.to_thread(
+                    os.pread,
+                    source_fd,
+                    min(DOWNLOAD_CHUNK_SIZE, prefix.size - offset),
+                    offset,
+                )
+                transport.write(chunk)
+                offset += len(chunk)
+                await _wait_for_event(flow.writable, reader)
+            elif prefix.complete:
+                # Flush what the transport still buffers, then EOF
+                transport.close()
+                await _wait_for_event(flow.lost, reader)
+                return flow.lost.is_set()
+            else:
+                prefix.changed.clear()
+                await _wait_for_event(prefix.changed, reader)
+        return False
+    finally:
+        # A graceful close that already flushed must not be aborted as well
+        if not transport.is_closing() or transport.get_write_buffer_size():
+            transport.abort()
+        if source_fd is not None:
+            os.close(source_fd)
+
+
 class StreamingVideoPipeline:
     """Process large videos without memory overflow.
 
     This pipeline:
     1. Streams video download to disk (100MB buffer max)
-    2. Extracts and transcribes audio (chunked if >25MB)
+    2. Extracts and transcribes audio (parallel 30s chunks)
     3. Detects scenes using PySceneDetect
     4. Splits video into clips
     5. Uploads clips directly to R2 (parallel uploads)
@@ -156,15 +574,34 @@ class StreamingVideoPipeline:
         self,
         r2_client: Optional[R2Client] = None,
         openai_api_key: Optional[str] = None,
+        upload_concurrency: Optional[int] = None,
+        use_tmpfs: Optional[bool] = None,
+        stream_clip_uploads: Optional[bool] = None,
     ):
         """Initialize the streaming pipeline.
 
         Args:
             r2_client: R2 client for uploads (uses singleton if not provided)
             openai_api_key: OpenAI API key for transcription
+            upload_concurrency: Max clips uploaded at once
+                (default CLIP_UPLOAD_CONCURRENCY env var, or 16)
+            use_tmpfs: Keep working files on tmpfs when they fit
+                (default USE_TMPFS env var, on unless set to "0")
+            stream_clip_uploads: Pipe clips from FFmpeg straight into R2
+                uploads when working files are on disk (default
+                STREAM_CLIP_UPLOADS env var, on unless set to "0")
         """
         self.r2_client = r2_client or get_r2_client()
         self.openai_api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
+        self.upload_concurrency = upload_concurrency or int(
+            os.getenv("CLIP_UPLOAD_CONCURRENCY", str(DEFAULT_UPLOAD_CONCURRENCY))
+        )
+        if use_tmpfs is None:
+            use_tmpfs = os.getenv("USE_TMPFS", "1") == "1"
+        self.use_tmpfs = use_tmpfs
+        if stream_clip_uploads is None:
+            stream_clip_uploads = os.getenv("STREAM_CLIP_UPLOADS", "1") == "1"
+        self.stream_clip_uploads = stream_clip_uploads
 
         self.scene_detector = SceneDetector()
         self.video_splitter = VideoSplitter()
@@ -211,22 +648,54 @@ class StreamingVideoPipeline:
         )
 
         try:
-            with tempfile.TemporaryDirectory() as temp_dir:
+            temp_root = await self._get_temp_root(video_url)
+            with tempfile.TemporaryDirectory(dir=temp_root) as temp_dir:
                 video_path = Path(temp_dir) / "source.mp4"
 
-                # Step 1: Stream download video to disk
-                logger.info("Step 1: Streaming download to disk", job_id=job_id)
-                await stream_download_to_disk(video_url, str(video_path))
+                # Step 3 starts first: the detector decodes the source from a
+                # FIFO fed with the bytes already downloaded, so decoding
+                # overlaps the download and transcription without fetching
+                # the video twice
+                logger.info("Step 3: Detecting scenes during download", job_id=job_id)
+                prefix = _WrittenPrefix()
+                fifo_path = str(Path(temp_dir) / "source.fifo")
+                os.mkfifo(fifo_path)
+                scene_future = self._detect_scenes(fifo_path, min_scene_length)
+                feed_task = asyncio.create_task(
+                    _feed_fifo(fifo_path, str(video_path), prefix, scene_future)
+                )
 
-                # Step 2: Transcribe audio (chunked if >25MB)
-                logger.info("Step 2: Transcribing audio", job_id=job_id)
-                transcript_result = await self._transcribe_video(str(video_path))
+                try:
+                    # Step 1: Stream download video to disk
+                    logger.info("Step 1: Streaming download to disk", job_id=job_id)
+                    await stream_download_to_disk(video_url, str(video_path), prefix=prefix)
+
+                    # Step 2: Transcribe audio (parallel 30s chunks)
+                    logger.info("Step 2: Transcribing audio", job_id=job_id)
+                    transcript_result = await self._transcribe_video(str(video_path))
+                except BaseException:
+                    # Cancelling detection ends the feed, and closing the FIFO
+                    # gives the pool worker EOF, so it stops decoding as well
+                    scene_future.cancel()
+                    await asyncio.gather(feed_task, return_exceptions=True)
+                    raise
                 transcript_segments = transcript_result.segments if transcript_result else []
 
-                # Step 3: Detect scenes
-                logger.info("Step 3: Detecting scenes", job_id=job_id)
-                self.scene_detector.min_scene_len = min_scene_length
-                scene_result = self.scene_detector.detect_scenes(str(video_path))
+                try:
+                    # A feed error truncates the stream, so its scenes are discarded
+                    await feed_task
+                    scene_result = await scene_future
+                except Exception as e:
+                    scene_future.cancel()
+                    logger.warning(
+                        "Scene detection during download failed, retrying on local file",
+                        job_id=job_id,
+                        error=str(e),
+                    )
+                    scene_result = await self._detect_scenes(
+                        str(video_path),
+                        min_scene_length,
+                    )
 
                 logger.info(
                     "Scenes detected",
@@ -262,28 +731,31 @@ class StreamingVideoPipeline:
                     clip_count=len(clip_definitions),
                 )
 
-                # Step 5: Split video into clips
-                logger.info("Step 5: Splitting video into clips", job_id=job_id)
+                # Steps 5-6: Split video into clips and upload them to R2
                 output_dir = str(Path(temp_dir) / "clips")
-                clip_results = await self.video_splitter.split_video(
-                    str(video_path),
-                    clip_definitions,
-                    output_dir,
-                )
-
-                logger.info(
-                    "Video split completed",
-                    job_id=job_id,
-                    clips_created=len(clip_results),
-                )
-
-                # Step 6: Upload clips to R2 (parallel)
-                logger.info("Step 6: Uploading clips to R2", job_id=job_id)
-                clip_metadata = await self._upload_clips_parallel(
-                    clip_results,
-                    source_id,
-                    transcript_segments,
-                )
+                segment_index = _index_segments(transcript_segments)
+                # Clips on tmpfs are cheap to write and read back, so they keep
+                # the batched extraction; on disk they are piped straight to R2
+                if self.stream_clip_uploads and temp_root is None:
+                    clip_metadata = await self._stream_clips_to_r2(
+                        str(video_path),
+                        clip_definitions,
+                        output_dir,
+                        source_id,
+                        transcript_segments,
+                        segment_index,
+                        job_id,
+                    )
+                else:
+                    clip_metadata = await self._split_and_upload_clips(
+                        str(video_path),
+                        clip_definitions,
+                        output_dir,
+                        source_id,
+                        transcript_segments,
+                        segment_index,
+                        job_id,
+                    )
 
                 logger.info(
                     "Clips uploaded to R2",
@@ -332,21 +804,7 @@ class StreamingVideoPipeline:
                 processing_time=processing_time,
             )
 
-            # Call webhook with error if URL provided
-            if webhook_url:
-                error_result = StreamingPipelineResult(
-                    job_id=job_id,
-                    source_id=source_id,
-                    status="failed",
-                    total_duration=0.0,
-                    total_clips=0,
-                    clips=[],
-                    processing_time_seconds=processing_time,
-                    error=str(e),
-                )
-                await self._call_webhook(webhook_url, error_result, webhook_secret)
-
-            return StreamingPipelineResult(
+            error_result = StreamingPipelineResult(
                 job_id=job_id,
                 source_id=source_id,
                 status="failed",
@@ -357,6 +815,80 @@ class StreamingVideoPipeline:
                 error=str(e),
             )
 
+            # Call webhook with error if URL provided
+            if webhook_url:
+                await self._call_webhook(webhook_url, error_result, webhook_secret)
+
+            return error_result
+
+    async def _get_temp_root(self, video_url: str) -> Optional[str]:
+        """Pick the parent directory for a job's working files.
+
+        Uses tmpfs when enabled and it has room for the source plus its
+        derived files; otherwise the default temp dir (on disk).
+
+        Args:
+            video_url: URL of the source video
+
+        Returns:
+            TMPFS_DIR, or None for the default temp dir
+        """
+        if not self.use_tmpfs or not os.path.isdir(TMPFS_DIR):
+            return None
+
+        try:
+            source_size = await _get_ranged_size(
+                get_http_client(),
+                video_url,
+                httpx.Timeout(HTTP_TIMEOUT, connect=CONNECT_TIMEOUT),
+            )
+        except httpx.HTTPError as e:
+            logger.warning("Could not size source for tmpfs", error=str(e))
+            return None
+
+        if source_size is None or source_size > TMPFS_MAX_SOURCE_SIZE:
+            return None
+
+        stats = os.statvfs(TMPFS_DIR)
+        if stats.f_bavail * stats.f_frsize < source_size * TMPFS_SPACE_FACTOR:
+            logger.info(
+                "Not enough tmpfs space, using disk for working files",
+                source_mb=round(source_size / (1024 * 1024), 2),
+                tmpfs_free_mb=round(stats.f_bavail * stats.f_frsize / (1024 * 1024), 2),
+            )
+            return None
+
+        return TMPFS_DIR
+
+    def _detect_scenes(
+        self,
+        video_path: str,
+        min_scene_length: float,
+    ) -> asyncio.Future:
+        """Run scene detection in the shared process pool.
+
+        Detection is CPU-bound and holds the GIL, so a worker thread would
+        still stall downloads and uploads on the event loop. Frames use
+        PySceneDetect's automatic downscaling unless the detector sets an
+        explicit factor.
+
+        Args:
+            video_path: Path to video file or FIFO
+            min_scene_length: Minimum scene length in seconds
+
+        Returns:
+            Future resolving to the SceneDetectionResult
+        """
+        return asyncio.get_running_loop().run_in_executor(
+            get_scene_pool(),
+            _detect_scenes_worker,
+            video_path,
+            min_scene_length,
+            self.scene_detector.threshold,
+            self.scene_detector.use_adaptive,
+            self.scene_detector.downscale,
+        )
+
     async def _transcribe_video(self, video_path: str) -> Optional[TranscriptResult]:
         """Transcribe video with chunking support.
 
@@ -371,8 +903,9 @@ class StreamingVideoPipeline:
             return None
 
         try:
-            # Use chunked transcription that handles >25MB audio files
-            result = await self.transcriber.transcribe_video_chunked(video_path)
+            # Transcribe short audio chunks in parallel (also keeps each
+            # request far below Whisper's 25MB limit)
+            result = await self._transcribe_video_parallel(video_path)
             logger.info(
                 "Transcription completed",
                 segments=len(result.segments),
@@ -383,58 +916,262 @@ class StreamingVideoPipeline:
             logger.error("Transcription failed", error=str(e))
             return None
 
-    async def _upload_clips_parallel(
+    async def _transcribe_video_parallel(self, video_path: str) -> TranscriptResult:
+        """Transcribe a video as fixed-length audio chunks in parallel.
+
+        Audio is split in a single FFmpeg pass; each chunk is sent to Whisper
+        as soon as it is written, and the results are stitched back together
+        by start time.
+
+        Args:
+            video_path: Path to video file
+
+        Returns:
+            TranscriptResult with full text, segments, and word timestamps
+        """
+        # Chunks live next to the source (on tmpfs when the source is)
+        with tempfile.TemporaryDirectory(dir=os.path.dirname(video_path)) as temp_dir:
+            semaphore = asyncio.Semaphore(TRANSCRIBE_CONCURRENCY)
+
+            async def transcribe_chunk(index: int, chunk_path: str) -> Optional[TranscriptResult]:
+                async with semaphore:
+                    try:
+                        return await self.transcriber.transcribe_audio(chunk_path)
+                    except Exception as e:
+                        logger.error(
+                            "Failed to transcribe chunk",
+                            chunk=index + 1,
+                            error=str(e),
+                        )
+                        # Continue with other chunks
+                        return None
+
+            # Send each chunk to Whisper as soon as FFmpeg has written it
+            chunks: list[tuple[str, float, float]] = []
+            tasks: list[asyncio.Task] = []
+            try:
+                async for chunk in self.transcriber.iter_audio_chunks(
+                    video_path, temp_dir, TRANSCRIBE_CHUNK_SECONDS
+                ):
+                    tasks.append(asyncio.create_task(transcribe_chunk(len(chunks), chunk[0])))
+                    chunks.append(chunk)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+            logger.info("Split audio into chunks", num_chunks=len(chunks))
+
+            results = await asyncio.gather(*tasks)
+
+        segments: list[TranscriptSegment] = []
+        words: list[WordTimestamp] = []
+        text_parts: list[str] = []
+        language = None
+        for (_, chunk_start, _), chunk_result in zip(chunks, results):
+            if chunk_result is None:
+                continue
+            chunk_segments, chunk_words = shift_transcript(chunk_result, chunk_start)
+            segments.extend(chunk_segments)
+            words.extend(chunk_words)
+            text_parts.append(chunk_result.full_text)
+            # Use detected language from first chunk
+            language = language or chunk_result.language
+
+        return TranscriptResult(
+            full_text=" ".join(text_parts),
+            language=language or "en",
+            duration=chunks[-1][2] if chunks else 0.0,
+            segments=segments,
+            words=words,
+        )
+
+    async def _split_and_upload_clips(
+        self,
+        video_path: str,
+        clip_definitions: list[ClipDefinition],
+        output_dir: str,
+        source_id: str,
+        transcript_segments: list[TranscriptSegment],
+        segment_index: tuple[list, list[float], list[float]],
+        job_id: str,
+    ) -> list[StreamingClipMetadata]:
+        """Split clips to files, uploading each to R2 as soon as it is written.
+
+        Returns:
+            List of clip metadata with R2 keys, in timeline order
+        """
+        logger.info("Step 5: Splitting video into clips", job_id=job_id)
+        upload_semaphore = asyncio.Semaphore(self.upload_concurrency)
+        upload_tasks: list[asyncio.Task] = []
+
+        def start_upload(clip: ClipResult) -> None:
+            upload_tasks.append(
+                asyncio.create_task(
+                    self._upload_clip(
+                        clip,
+                        source_id,
+                        transcript_segments,
+                        upload_semaphore,
+                        segment_index,
+                    )
+                )
+            )
+
+        try:
+            clip_results = await self.video_splitter.split_video(
+                video_path,
+                clip_definitions,
+                output_dir,
+                on_clip_ready=start_upload,
+            )
+        except Exception:
+            for task in upload_tasks:
+                task.cancel()
+            await asyncio.gather(*upload_tasks, return_exceptions=True)
+            raise
+
+        logger.info(
+            "Video split completed",
+            job_id=job_id,
+            clips_created=len(clip_results),
+        )
+
+        # Step 6: Wait for the remaining clip uploads
+        logger.info("Step 6: Uploading clips to R2", job_id=job_id)
+        return await self._gather_uploads(upload_tasks)
+
+    async def _stream_clips_to_r2(
         self,
-        clip_results: list[ClipResult],
+        video_path: str,
+        clip_definitions: list[ClipDefinition],
+        output_dir: str,
         source_id: str,
         transcript_segments: list[TranscriptSegment],
+        segment_index: tuple[list, list[float], list[float]],
+        job_id: str,
     ) -> list[StreamingClipMetadata]:
-        """Upload clips to R2 in parallel.
+        """Pipe each clip from FFmpeg into an R2 upload, skipping local files.
+
+        Only thumbnails are written locally.
+
+        Returns:
+            List of clip metadata with R2 keys, in timeline order
+        """
+        logger.info("Steps 5-6: Streaming clips to R2", job_id=job_id)
+
+        async def upload_clip_stream(
+            clip: ClipDefinition,
+            chunks: AsyncIterator[bytes],
+            thumbnail_path: str,
+        ) -> StreamingClipMetadata:
+            video_key, thumbnail_key = self._clip_keys(source_id, clip.clip_id)
+            await self.r2_client.upload_stream(chunks, video_key, content_type="video/mp4")
+
+            # FFmpeg has exited once the clip stream ends, so the thumbnail
+            # it wrote in the same pass is complete
+            thumbnail_uploaded = None
+            if os.path.exists(thumbnail_path):
+                await self.r2_client.upload_file_streaming(thumbnail_path, thumbnail_key)
+                thumbnail_uploaded = thumbnail_key
+
+            return self._clip_metadata(
+                clip,
+                video_key,
+                thumbnail_uploaded,
+                transcript_segments,
+                segment_index,
+            )
+
+        return await self.video_splitter.stream_clips(
+            video_path,
+            clip_definitions,
+            output_dir,
+            upload_clip_stream,
+        )
+
+    def _clip_keys(self, source_id: str, clip_id: str) -> tuple[str, str]:
+        """Get the R2 keys for a clip's video and thumbnail."""
+        return (
+            f"clips/{source_id}/{clip_id}.mp4",
+            f"clips/{source_id}/{clip_id}_thumb.jpg",
+        )
+
+    def _clip_metadata(
+        self,
+        clip: Union[ClipDefinition, ClipResult],
+        video_key: str,
+        thumbnail_key: Optional[str],
+        transcript_segments: list[TranscriptSegment],
+        segment_index: Optional[tuple[list, list[float], list[float]]] = None,
+    ) -> StreamingClipMetadata:
+        """Build the webhook metadata for an uploaded clip."""
+        # Get transcript for this clip's time range
+        clip_transcript = self._get_transcript_for_clip(
+            transcript_segments,
+            clip.start_time,
+            clip.end_time,
+            segment_index,
+        )
+
+        return StreamingClipMetadata(
+            clip_id=clip.clip_id,
+            start_time=clip.start_time,
+            end_time=clip.end_time,
+            duration=clip.end_time - clip.start_time,
+            video_key=video_key,
+            thumbnail_key=thumbnail_key,
+            transcript=clip_transcript,
+        )
+
+    async def _upload_clip(
+        self,
+        clip: ClipResult,
+        source_id: str,
+        transcript_segments: list[TranscriptSegment],
+        semaphore: asyncio.Semaphore,
+        segment_index: Optional[tuple[list, list[float], list[float]]] = None,
+    ) -> Optional[StreamingClipMetadata]:
+        """Upload a clip and its thumbnail to R2.
 
         Args:
-            clip_results: List of clip extraction results
+            clip: Clip extraction result
             source_id: Source video identifier
             transcript_segments: Transcript segments for clip transcript extraction
+            semaphore: Limits how many clips upload at once
+            segment_index: Prebuilt index of transcript_segments, shared by
+                all clips of a job
 
         Returns:
-            List of clip metadata with R2 keys
+            Clip metadata with R2 keys, or None if the upload failed
         """
-        async def upload_single_clip(clip: ClipResult) -> Optional[StreamingClipMetadata]:
+        async with semaphore:
             try:
                 # R2 keys
-                video_key = f"clips/{source_id}/{clip.clip_id}.mp4"
-                thumbnail_key = f"clips/{source_id}/{clip.clip_id}_thumb.jpg"
+                video_key, thumbnail_key = self._clip_keys(source_id, clip.clip_id)
 
-                # Upload video
-                await self.r2_client.upload_file_streaming(
-                    clip.video_path,
-                    video_key,
-                )
-
-                # Upload thumbnail if exists
+                # Upload video and thumbnail (if exists) together
+                uploads = [
+                    self.r2_client.upload_file_streaming(clip.video_path, video_key)
+                ]
                 thumbnail_uploaded = None
-                if clip.thumbnail_path and Path(clip.thumbnail_path).exists():
-                    await self.r2_client.upload_file_streaming(
-                        clip.thumbnail_path,
-                        thumbnail_key,
+                if clip.thumbnail_path and os.path.exists(clip.thumbnail_path):
+                    uploads.append(
+                        self.r2_client.upload_file_streaming(
+                            clip.thumbnail_path,
+                            thumbnail_key,
+                        )
                     )
                     thumbnail_uploaded = thumbnail_key
+                await asyncio.gather(*uploads)
 
-                # Get transcript for this clip's time range
-                clip_transcript = self._get_transcript_for_clip(
+                return self._clip_metadata(
+                    clip,
+                    video_key,
+                    thumbnail_uploaded,
                     transcript_segments,
-                    clip.start_time,
-                    clip.end_time,
-                )
-
-                return StreamingClipMetadata(
-                    clip_id=clip.clip_id,
-                    start_time=clip.start_time,
-                    end_time=clip.end_time,
-                    duration=clip.duration,
-                    video_key=video_key,
-                    thumbnail_key=thumbnail_uploaded,
-                    transcript=clip_transcript,
+                    segment_index,
                 )
             except Exception as e:
                 logger.error(
@@ -444,24 +1181,32 @@ class StreamingVideoPipeline:
                 )
                 return None
 
-        # Upload all clips in parallel (max 5 concurrent)
-        semaphore = asyncio.Semaphore(5)
+    async def _gather_uploads(
+        self,
+        upload_tasks: list[asyncio.Task],
+    ) -> list[StreamingClipMetadata]:
+        """Wait for clip uploads and drop the ones that failed.
 
-        async def upload_with_semaphore(clip: ClipResult) -> Optional[StreamingClipMetadata]:
-            async with semaphore:
-                return await upload_single_clip(clip)
+        Args:
+            upload_tasks: Tasks started by _upload_clip
 
-        tasks = [upload_with_semaphore(clip) for clip in clip_results]
-        results = await asyncio.gather(*tasks)
+        Returns:
+            List of clip metadata with R2 keys
+        """
+        results = await asyncio.gather(*upload_tasks)
 
-        # Filter out failed uploads
-        successful = [r for r in results if r is not None]
+        # Filter out failed uploads; clips finish out of order, so restore
+        # timeline order
+        successful = sorted(
+            (r for r in results if r is not None),
+            key=lambda clip: clip.start_time,
+        )
 
-        if len(successful) < len(clip_results):
+        if len(successful) < len(upload_tasks):
             logger.warning(
                 "Some clip uploads failed",
                 successful=len(successful),
-                total=len(clip_results),
+                total=len(upload_tasks),
             )
 
         return successful
@@ -471,6 +1216,7 @@ class StreamingVideoPipeline:
         segments: list[TranscriptSegment],
         start_time: float,
         end_time: float,
+        segment_index: Optional[tuple[list, list[float], list[float]]] = None,
     ) -> Optional[str]:
         """Get transcript text for a specific time range.
 
@@ -478,6 +1224,7 @@ class StreamingVideoPipeline:
             segments: Transcript segments
             start_time: Clip start time
             end_time: Clip end time
+            segment_index: Prebuilt index of segments (built if not provided)
 
         Returns:
             Transcript text or None
@@ -485,10 +1232,9 @@ class StreamingVideoPipeline:
         if not segments:
             return None
 
-        overlapping_segments = [
-            seg for seg in segments
-            if seg.end > start_time and seg.start < end_time
-        ]
+        if segment_index is None:
+            segment_index = _index_segments(segments)
+        overlapping_segments = _segments_in_range(segment_index, start_time, end_time)
 
         if not overlapping_segments:
             return None
@@ -501,13 +1247,18 @@ class StreamingVideoPipeline:
         webhook_url: str,
         result: StreamingPipelineResult,
         secret: Optional[str] = None,
+        retries: int = 3,
     ) -> bool:
         """Call webhook with processing results.
 
+        Server errors and connection failures are retried with exponential
+        backoff; 4xx responses are treated as final.
+
         Args:
             webhook_url: URL to call
             result: Pipeline result
             secret: Optional HMAC secret for signature
+            retries: Number of attempts
 
         Returns:
             True if webhook call succeeded
@@ -536,37 +1287,64 @@ class StreamingVideoPipeline:
             if result.error:
                 payload["error_message"] = result.error
 
-            import json
-            body = json.dumps(payload)
+            body = orjson.dumps(payload)
 
             headers = {"Content-Type": "application/json"}
 
-            # Add HMAC signature if secret provided
+            # Add HMAC signature if secret provided. OpenSSL releases the GIL
+            # while hashing, so large bodies are signed on a worker thread to
+            # keep the event loop serving other jobs.
             if secret:
-                signature = hmac.new(
-                    secret.encode(),
-                    body.encode(),
-                    hashlib.sha256,
-                ).hexdigest()
+                if len(body) >= WEBHOOK_SIGN_THREAD_THRESHOLD:
+                    signature = await asyncio.to_thread(
+                        _sign_webhook_body, secret.encode(), body
+                    )
+                else:
+                    signature = _sign_webhook_body(secret.encode(), body)
                 headers["x-webhook-signature"] = signature
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    webhook_url,
-                    content=body,
-                    headers=headers,
-                )
+            client = get_http_client()
+            for attempt in range(retries):
+                try:
+                    response = await client.post(
+                        webhook_url,
+                        content=body,
+                        headers=headers,
+                    )
+
+                    if response.status_code < 400:
+                        logger.info(
+                            "Webhook called successfully",
+                            status_code=response.status_code,
+                        )
+                        return True
+
+                    if response.status_code < 500:
+                        logger.error(
+                            "Webhook call failed",
+                            status_code=response.status_code,
+                            response=response.text[:500],
+                        )
+                        return False
 
-                if response.status_code >= 400:
-                    logger.error(
-                        "Webhook call failed",
+                    logger.warning(
+                        "Webhook returned error",
                         status_code=response.status_code,
-                        response=response.text[:500],
+                        attempt=attempt + 1,
                     )
-                    return False
 
-                logger.info("Webhook called successfully", status_code=response.status_code)
-                return True
+                except httpx.RequestError as e:
+                    logger.warning(
+                        "Webhook request failed",
+                        error=str(e),
+                        attempt=attempt + 1,
+                    )
+
+                if attempt < retries - 1:
+                    await asyncio.sleep(2**attempt)  # Exponential backoff
+
+            logger.error("Webhook failed after all retries")
+            return False
 
         except Exception as e:
             logger.error("Webhook call error", error=str(e))
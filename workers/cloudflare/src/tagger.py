@@ -1,16 +1,28 @@
 """Clip tagging module using GPT-4o-mini."""
 
+import asyncio
+import hashlib
 import os
+import re
+import time
+from collections import OrderedDict
 from typing import Optional
 
+import orjson
 import structlog
-from openai import AsyncOpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, stop_after_attempt, wait_random_exponential
 
 from .models import ClipContext, ClipTag, TagResult, TagScore
+from .openai_client import get_openai_client
 
 logger = structlog.get_logger(__name__)
 
+# Tag lookup by value (avoids the enum's value search per parsed tag)
+_TAG_BY_VALUE = {tag.value: tag for tag in ClipTag}
+
+# Trailing commas before a closing brace/bracket (invalid JSON, seen in GPT output)
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+
 
 class TaggingError(Exception):
     """Error during clip tagging."""
@@ -18,7 +30,92 @@ class TaggingError(Exception):
     pass
 
 
-# System prompt for clip classification
+# Account limits for the tagging model (gpt-4o-mini, tier 1)
+DEFAULT_REQUESTS_PER_MINUTE = 500
+DEFAULT_TOKENS_PER_MINUTE = 200_000
+# Completion budget per request (also counted against the token limit)
+MAX_COMPLETION_TOKENS = 500
+# Characters of the neighbouring clips' transcripts included in a prompt
+ADJACENT_TRANSCRIPT_CHARS = 200
+# Tag results remembered per tagger for clips with identical transcripts
+TAG_CACHE_SIZE = 1024
+
+# Circuit breaker: stop calling the API after this many failures in a row,
+# letting one probe request through every CIRCUIT_RESET_SECONDS
+CIRCUIT_FAILURE_THRESHOLD = 10
+CIRCUIT_RESET_SECONDS = 30.0
+
+# Batch API settings (opt-in for large, non-latency-critical jobs)
+BATCH_MIN_CLIPS = 20  # Smaller jobs are cheaper to run live than to wait for
+BATCH_POLL_INITIAL_SECONDS = 5.0
+BATCH_POLL_MAX_SECONDS = 60.0
+BATCH_MAX_WAIT_SECONDS = 3600.0  # Give up and tag live after an hour
+BATCH_FAILED_STATUSES = ("failed", "expired", "cancelled", "cancelling")
+
+
+class RateLimiter:
+    """Token bucket that paces API calls to per-minute request/token limits.
+
+    Both buckets start full and refill continuously, so short bursts go out
+    immediately and sustained load is spread out instead of running into
+    429s and retry backoff.
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        """Initialize the limiter.
+
+        Args:
+            requests_per_minute: Maximum requests per minute
+            tokens_per_minute: Maximum tokens (prompt + completion) per minute
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._available_requests = float(requests_per_minute)
+        self._available_tokens = float(tokens_per_minute)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the capacity earned since the last refill, up to one minute's worth."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._available_requests = min(
+            self.requests_per_minute,
+            self._available_requests + elapsed * self.requests_per_minute / 60,
+        )
+        self._available_tokens = min(
+            self.tokens_per_minute,
+            self._available_tokens + elapsed * self.tokens_per_minute / 60,
+        )
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until one request with the estimated token count may be sent.
+
+        Args:
+            tokens: Estimated tokens for the request
+        """
+        # A single request can never need more than a full bucket
+        tokens = min(tokens, self.tokens_per_minute)
+
+        # Waiters queue on the lock, so requests go out in arrival order
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._available_requests >= 1 and self._available_tokens >= tokens:
+                    self._available_requests -= 1
+                    self._available_tokens -= tokens
+                    return
+
+                wait = max(
+                    (1 - self._available_requests) * 60 / self.requests_per_minute,
+                    (tokens - self._available_tokens) * 60 / self.tokens_per_minute,
+                )
+                await asyncio.sleep(wait)
+
+
+# System prompt for clip classification. Kept static and above 1024 tokens
+# (with the examples) so every tagging request shares a cacheable prefix.
 SYSTEM_PROMPT = """You are an expert video content analyst specializing in marketing and advertising videos.
 Your task is to classify video clips based on their transcript content into specific content types.
 
@@ -47,7 +144,39 @@ Respond in JSON format with:
     "reasoning": "brief explanation of classification"
 }
 
-Include up to 3 relevant tags in all_tags, sorted by confidence."""
+Include up to 3 relevant tags in all_tags, sorted by confidence.
+
+Examples of transcripts and their classification:
+
+1. Position 0%, first clip: "Stop scrolling. What if I told you you've been brushing your teeth wrong your entire life?"
+{"primary_tag": "hook", "confidence": 0.95, "all_tags": [{"tag": "hook", "confidence": 0.95}], "reasoning": "Pattern interrupt followed by a provocative question in the first clip"}
+
+2. Position 5%: "Hi, I'm Sarah, founder of Glow Labs, and today I'm going to walk you through our new serum."
+{"primary_tag": "intro", "confidence": 0.9, "all_tags": [{"tag": "intro", "confidence": 0.9}, {"tag": "hook", "confidence": 0.2}], "reasoning": "Introduces the speaker, brand and topic without an attention grab"}
+
+3. Position 30%: "The blender crushes ice in under ten seconds and the jar goes straight into the dishwasher."
+{"primary_tag": "product_benefit", "confidence": 0.9, "all_tags": [{"tag": "product_benefit", "confidence": 0.9}, {"tag": "proof", "confidence": 0.25}], "reasoning": "Describes concrete product features and their advantages"}
+
+4. Position 45%: "In a twelve-week clinical study, 87 percent of participants saw visibly clearer skin."
+{"primary_tag": "proof", "confidence": 0.92, "all_tags": [{"tag": "proof", "confidence": 0.92}, {"tag": "product_benefit", "confidence": 0.3}], "reasoning": "Cites a study and a statistic as evidence for the claim"}
+
+5. Position 55%: "I was skeptical at first, but after a month my back pain was gone. I tell all my friends about it."
+{"primary_tag": "testimonial", "confidence": 0.93, "all_tags": [{"tag": "testimonial", "confidence": 0.93}, {"tag": "proof", "confidence": 0.35}], "reasoning": "First-person customer story describing a personal result"}
+
+6. Position 65%: "Now you might be thinking this is too expensive. But it costs less per day than your morning coffee."
+{"primary_tag": "objection_handling", "confidence": 0.91, "all_tags": [{"tag": "objection_handling", "confidence": 0.91}, {"tag": "product_benefit", "confidence": 0.2}], "reasoning": "Raises a price concern and answers it directly"}
+
+7. Position 50%: "So that's how the app tracks your spending. Next, let's look at the savings goals."
+{"primary_tag": "transition", "confidence": 0.85, "all_tags": [{"tag": "transition", "confidence": 0.85}], "reasoning": "Wraps up one topic and bridges to the next"}
+
+8. Position 40%: "" (no speech, footage of the product on a kitchen counter)
+{"primary_tag": "b_roll", "confidence": 0.9, "all_tags": [{"tag": "b_roll", "confidence": 0.9}], "reasoning": "No speech content; supplementary product footage"}
+
+9. Position 92%, last clip: "Tap the link below and use code SAVE20 to get twenty percent off your first order today."
+{"primary_tag": "cta", "confidence": 0.96, "all_tags": [{"tag": "cta", "confidence": 0.96}], "reasoning": "Direct request to act with a link and discount code"}
+
+10. Position 98%, last clip: "Thanks so much for watching, and I'll see you in the next video."
+{"primary_tag": "outro", "confidence": 0.92, "all_tags": [{"tag": "outro", "confidence": 0.92}], "reasoning": "Closing farewell at the end of the video"}"""
 
 
 class ClipTagger:
@@ -57,19 +186,35 @@ class ClipTagger:
         self,
         api_key: Optional[str] = None,
         model: str = "gpt-4o-mini",
+        requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE,
+        tokens_per_minute: int = DEFAULT_TOKENS_PER_MINUTE,
     ):
         """Initialize the tagger.
 
         Args:
             api_key: OpenAI API key (or from env OPENAI_API_KEY)
             model: Model to use for tagging
+            requests_per_minute: Request rate limit for the model
+            tokens_per_minute: Token rate limit for the model
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OpenAI API key is required")
 
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        self.client = get_openai_client(self.api_key)
         self.model = model
+        # Request parts that are identical for every clip
+        self._system_message = {"role": "system", "content": SYSTEM_PROMPT}
+        self._completion_params = {
+            "temperature": 0.3,  # Lower temperature for more consistent classification
+            "max_tokens": MAX_COMPLETION_TOKENS,
+            "response_format": {"type": "json_object"},
+        }
+        self.rate_limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        # LRU of in-flight or finished tag requests, keyed by _cache_key
+        self._tag_cache: OrderedDict[bytes, asyncio.Task] = OrderedDict()
+        self._consecutive_failures = 0
+        self._circuit_opened_at = 0.0
 
     def _build_user_prompt(self, context: ClipContext) -> str:
         """Build the user prompt for classification.
@@ -80,26 +225,55 @@ class ClipTagger:
         Returns:
             Formatted user prompt
         """
-        lines = [
-            f"Clip ID: {context.clip_id}",
-            f"Duration: {context.duration:.1f} seconds",
-            f"Position in video: {context.position_in_video:.1%}",
-        ]
+        # Notes and neighbouring transcripts are optional; build the prompt
+        # in one f-string rather than appending lines to a list
+        first_note = "\nNote: This is the FIRST clip in the video" if context.is_first_clip else ""
+        last_note = "\nNote: This is the LAST clip in the video" if context.is_last_clip else ""
+
+        # create_clip_contexts already trims these; slicing a short string is free
+        previous = context.previous_transcript
+        previous_block = (
+            f'\n\nPrevious clip transcript:\n"{previous[:ADJACENT_TRANSCRIPT_CHARS]}..."'
+            if previous
+            else ""
+        )
+        next_ = context.next_transcript
+        next_block = (
+            f'\n\nNext clip transcript:\n"{next_[:ADJACENT_TRANSCRIPT_CHARS]}..."'
+            if next_
+            else ""
+        )
 
-        if context.is_first_clip:
-            lines.append("Note: This is the FIRST clip in the video")
-        if context.is_last_clip:
-            lines.append("Note: This is the LAST clip in the video")
+        return (
+            f"Clip ID: {context.clip_id}\n"
+            f"Duration: {context.duration:.1f} seconds\n"
+            f"Position in video: {context.position_in_video:.1%}"
+            f"{first_note}{last_note}\n"
+            f'\nTranscript:\n"{context.transcript}"'
+            f"{previous_block}{next_block}"
+        )
 
-        lines.append(f"\nTranscript:\n\"{context.transcript}\"")
+    def _has_minimal_transcript(self, context: ClipContext) -> bool:
+        """Check whether a clip has too little speech to be worth an API call."""
+        return not context.transcript or len(context.transcript.strip()) < 10
 
-        if context.previous_transcript:
-            lines.append(f"\nPrevious clip transcript:\n\"{context.previous_transcript[:200]}...\"")
+    def _chat_request(self, context: ClipContext) -> dict:
+        """Build the chat completion request body for a clip.
 
-        if context.next_transcript:
-            lines.append(f"\nNext clip transcript:\n\"{context.next_transcript[:200]}...\"")
+        Args:
+            context: Clip context with transcript and metadata
 
-        return "\n".join(lines)
+        Returns:
+            Request parameters shared by live and batch calls
+        """
+        return {
+            "model": self.model,
+            **self._completion_params,
+            "messages": [
+                self._system_message,
+                {"role": "user", "content": self._build_user_prompt(context)},
+            ],
+        }
 
     def _parse_response(self, response_text: str, clip_id: str) -> TagResult:
         """Parse GPT response into TagResult.
@@ -111,29 +285,26 @@ class ClipTagger:
         Returns:
             TagResult object
         """
-        import json
-
         try:
             # Try to extract JSON from response
             # Handle cases where response might have markdown code blocks
             text = response_text.strip()
             if text.startswith("```"):
-                # Remove markdown code block
-                lines = text.split("\n")
-                text = "\n".join(lines[1:-1])
+                # Remove markdown code block (first and last line)
+                text = text[text.find("\n") + 1 : text.rfind("\n")]
 
-            data = json.loads(text)
+            data = _loads_json_object(text)
 
-            primary_tag = ClipTag(data["primary_tag"])
+            primary_tag = _TAG_BY_VALUE[data["primary_tag"]]
             primary_confidence = float(data.get("confidence", 0.8))
 
             all_tags = []
             for tag_data in data.get("all_tags", []):
                 try:
-                    tag = ClipTag(tag_data["tag"])
+                    tag = _TAG_BY_VALUE[tag_data["tag"]]
                     confidence = float(tag_data.get("confidence", 0.5))
                     all_tags.append(TagScore(tag=tag, confidence=confidence))
-                except (ValueError, KeyError):
+                except (ValueError, KeyError, TypeError):
                     continue
 
             # Ensure primary tag is in all_tags
@@ -148,7 +319,7 @@ class ClipTagger:
                 reasoning=data.get("reasoning", ""),
             )
 
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
+        except (orjson.JSONDecodeError, KeyError, ValueError, TypeError) as e:
             logger.warning(
                 "Failed to parse tagging response, using fallback",
                 error=str(e),
@@ -163,13 +334,49 @@ class ClipTagger:
                 reasoning="Failed to parse AI response, defaulting to b_roll",
             )
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
-    )
+    def _circuit_open(self) -> bool:
+        """Check whether API calls should be skipped after repeated failures."""
+        if self._consecutive_failures < CIRCUIT_FAILURE_THRESHOLD:
+            return False
+        now = time.monotonic()
+        if now - self._circuit_opened_at >= CIRCUIT_RESET_SECONDS:
+            # Half-open: let this request probe whether the API is back
+            self._circuit_opened_at = now
+            return False
+        return True
+
+    def _record_result(self, succeeded: bool) -> None:
+        """Track consecutive API failures for the circuit breaker."""
+        if succeeded:
+            self._consecutive_failures = 0
+            return
+
+        self._consecutive_failures += 1
+        if self._consecutive_failures == CIRCUIT_FAILURE_THRESHOLD:
+            self._circuit_opened_at = time.monotonic()
+            logger.warning(
+                "Tagging API failing repeatedly, skipping remaining calls",
+                failures=self._consecutive_failures,
+            )
+
+    def _cache_key(self, context: ClipContext) -> bytes:
+        """Key clips that would get the same classification.
+
+        Uses the transcript, the position rounded to 10% and the first/last
+        clip flags, which are what the prompt's guidance depends on.
+        """
+        key = (
+            f"{context.transcript}\x00{round(context.position_in_video, 1)}"
+            f"\x00{context.is_first_clip:d}{context.is_last_clip:d}"
+        )
+        return hashlib.blake2b(key.encode(), digest_size=16).digest()
+
     async def tag_clip(self, context: ClipContext) -> TagResult:
         """Tag a single clip based on its context.
 
+        Clips with an identical transcript (at a similar position) reuse the
+        earlier result, and concurrent identical clips share one request.
+
         Args:
             context: Clip context with transcript and metadata
 
@@ -177,7 +384,7 @@ class ClipTagger:
             TagResult with primary and secondary tags
         """
         # Handle empty or very short transcripts
-        if not context.transcript or len(context.transcript.strip()) < 10:
+        if self._has_minimal_transcript(context):
             logger.info(
                 "Clip has minimal transcript, classifying as b_roll",
                 clip_id=context.clip_id,
@@ -190,88 +397,301 @@ class ClipTagger:
                 reasoning="Clip has no or minimal speech content",
             )
 
-        user_prompt = self._build_user_prompt(context)
+        key = self._cache_key(context)
+        task = self._tag_cache.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._request_tag(context))
+            self._tag_cache[key] = task
+            if len(self._tag_cache) > TAG_CACHE_SIZE:
+                self._tag_cache.popitem(last=False)
+        else:
+            self._tag_cache.move_to_end(key)
+            logger.debug("Tag cache hit", clip_id=context.clip_id)
+
+        try:
+            # Shielded so one cancelled caller does not cancel the shared request
+            result = await asyncio.shield(task)
+        except Exception:
+            # Don't remember failures
+            if self._tag_cache.get(key) is task:
+                del self._tag_cache[key]
+            raise
+
+        if result.clip_id != context.clip_id:
+            result = result.model_copy(update={"clip_id": context.clip_id}, deep=True)
+        return result
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_random_exponential(multiplier=1, max=60),
+    )
+    async def _request_tag(self, context: ClipContext) -> TagResult:
+        """Tag a clip with a chat completion request (retried on failure).
+
+        Args:
+            context: Clip context with transcript and metadata
+
+        Returns:
+            TagResult with primary and secondary tags
+        """
+        request = self._chat_request(context)
 
         logger.debug("Tagging clip", clip_id=context.clip_id)
 
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt},
-            ],
-            temperature=0.3,  # Lower temperature for more consistent classification
-            max_tokens=500,
-            response_format={"type": "json_object"},
-        )
+        # Pace against the account limits (~4 characters per token)
+        prompt_chars = sum(len(m["content"]) for m in request["messages"])
+        await self.rate_limiter.acquire(prompt_chars // 4 + MAX_COMPLETION_TOKENS)
+
+        response = await self.client.chat.completions.create(**request)
 
         response_text = response.choices[0].message.content
         result = self._parse_response(response_text, context.clip_id)
 
+        # Prompt tokens served from OpenAI's prefix cache (the system prompt)
+        usage = getattr(response, "usage", None)
+        prompt_details = getattr(usage, "prompt_tokens_details", None)
+
         logger.info(
             "Clip tagged",
             clip_id=context.clip_id,
             primary_tag=result.primary_tag,
             confidence=result.primary_confidence,
+            cached_tokens=getattr(prompt_details, "cached_tokens", None),
+            total_tokens=getattr(usage, "total_tokens", None),
         )
 
         return result
 
+    async def _tag_clips_batch(self, clips: list[ClipContext]) -> dict[str, TagResult]:
+        """Tag clips through the OpenAI Batch API.
+
+        Uploads one JSONL request file, polls the batch with exponential
+        backoff and parses the output per clip. Batch requests cost half as
+        much and do not count against the live rate limits, but can take a
+        while to complete.
+
+        Args:
+            clips: Clip contexts that need an API call
+
+        Returns:
+            TagResult per clip ID for every request that succeeded
+
+        Raises:
+            TaggingError: If the batch failed, expired or timed out
+        """
+        lines = [
+            orjson.dumps(
+                {
+                    "custom_id": context.clip_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self._chat_request(context),
+                }
+            )
+            for context in clips
+        ]
+        input_file = await self._call_batch_api(
+            self.client.files.create,
+            file=("tagging.jsonl", b"\n".join(lines)),
+            purpose="batch",
+        )
+        batch = None
+        try:
+            batch = await self._call_batch_api(
+                self.client.batches.create,
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            logger.info("Tagging batch submitted", batch_id=batch.id, total=len(clips))
+
+            deadline = time.monotonic() + BATCH_MAX_WAIT_SECONDS
+            delay = BATCH_POLL_INITIAL_SECONDS
+            while batch.status != "completed":
+                if batch.status in BATCH_FAILED_STATUSES:
+                    raise TaggingError(f"Tagging batch {batch.id} {batch.status}")
+                if time.monotonic() >= deadline:
+                    raise TaggingError(f"Tagging batch {batch.id} timed out")
+
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, BATCH_POLL_MAX_SECONDS)
+                batch = await self._call_batch_api(self.client.batches.retrieve, batch.id)
+
+            results: dict[str, TagResult] = {}
+            if not batch.output_file_id:
+                return results
+
+            output = await self._call_batch_api(
+                self.client.files.content, batch.output_file_id
+            )
+            for line in output.text.splitlines():
+                if not line:
+                    continue
+                item = orjson.loads(line)
+                response = item.get("response") or {}
+                if response.get("status_code") != 200:
+                    continue
+                clip_id = item["custom_id"]
+                response_text = response["body"]["choices"][0]["message"]["content"]
+                results[clip_id] = self._parse_response(response_text, clip_id)
+
+            logger.info("Tagging batch completed", batch_id=batch.id, tagged=len(results))
+            return results
+        except BaseException:
+            # The caller tags these clips live instead, so a batch left
+            # running would be paid for twice
+            if batch is not None and batch.status not in ("completed", *BATCH_FAILED_STATUSES):
+                await self._cancel_batch(batch.id)
+            raise
+        finally:
+            # Batch files otherwise count against the account's storage
+            file_ids = [input_file.id]
+            if batch is not None:
+                file_ids += [
+                    file_id
+                    for file_id in (batch.output_file_id, batch.error_file_id)
+                    if file_id
+                ]
+            await self._delete_files(file_ids)
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_random_exponential(multiplier=1, max=60),
+    )
+    async def _call_batch_api(self, method, *args, **kwargs):
+        """Call a Files or Batches API method, retrying transient failures.
+
+        The shared client has SDK retries off, and a batch lives far longer
+        than any one of these calls.
+        """
+        return await method(*args, **kwargs)
+
+    async def _cancel_batch(self, batch_id: str) -> None:
+        """Cancel a batch that is still running, logging failures."""
+        try:
+            await self._call_batch_api(self.client.batches.cancel, batch_id)
+        except Exception as e:
+            logger.warning("Failed to cancel tagging batch", batch_id=batch_id, error=str(e))
+
+    async def _delete_files(self, file_ids: list[str]) -> None:
+        """Delete uploaded or generated files, logging failures."""
+        for file_id in file_ids:
+            try:
+                await self.client.files.delete(file_id)
+            except Exception as e:
+                logger.warning("Failed to delete batch file", file_id=file_id, error=str(e))
+
     async def tag_clips(
         self,
         clips: list[ClipContext],
         max_concurrent: int = 5,
+        use_batch_api: bool = False,
     ) -> list[TagResult]:
         """Tag multiple clips.
 
         Args:
             clips: List of clip contexts
             max_concurrent: Maximum concurrent API calls
+            use_batch_api: Tag jobs of BATCH_MIN_CLIPS or more through the
+                Batch API (half the cost, no live rate limits, slower).
+                Clips the batch did not tag are tagged live.
 
         Returns:
             List of TagResult objects
         """
-        import asyncio
-
         logger.info("Tagging clips", total=len(clips))
 
+        batch_results: dict[str, TagResult] = {}
+        if use_batch_api and len(clips) >= BATCH_MIN_CLIPS:
+            try:
+                batch_results = await self._tag_clips_batch(
+                    [c for c in clips if not self._has_minimal_transcript(c)]
+                )
+            except Exception as e:
+                logger.warning(
+                    "Batch tagging failed, falling back to live API",
+                    error=str(e),
+                )
+
         semaphore = asyncio.Semaphore(max_concurrent)
 
         async def tag_with_semaphore(context: ClipContext) -> TagResult:
-            async with semaphore:
+            if context.clip_id in batch_results:
+                return batch_results[context.clip_id]
+            if self._has_minimal_transcript(context):
+                # No API call needed
                 return await self.tag_clip(context)
+            async with semaphore:
+                if self._circuit_open():
+                    raise TaggingError("Skipped after repeated tagging API failures")
+                try:
+                    result = await self.tag_clip(context)
+                except Exception:
+                    self._record_result(succeeded=False)
+                    raise
+                self._record_result(succeeded=True)
+                return result
 
         results = await asyncio.gather(
             *[tag_with_semaphore(clip) for clip in clips],
             return_exceptions=True,
         )
 
-        # Handle any errors
-        final_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(
-                    "Failed to tag clip",
-                    clip_id=clips[i].clip_id,
-                    error=str(result),
-                )
-                # Return fallback result
-                final_results.append(
-                    TagResult(
-                        clip_id=clips[i].clip_id,
-                        primary_tag=ClipTag.B_ROLL,
-                        primary_confidence=0.1,
-                        all_tags=[TagScore(tag=ClipTag.B_ROLL, confidence=0.1)],
-                        reasoning=f"Tagging failed: {str(result)}",
-                    )
-                )
-            else:
-                final_results.append(result)
+        # Handle any errors (fallback results are only built for failures)
+        final_results = [
+            _failed_tag_result(clip.clip_id, result)
+            if isinstance(result, BaseException)
+            else result
+            for clip, result in zip(clips, results)
+        ]
 
-        logger.info("Tagging completed", successful=len(final_results))
+        failed = sum(isinstance(result, BaseException) for result in results)
+        logger.info("Tagging completed", successful=len(results) - failed, failed=failed)
         return final_results
 
 
+def _loads_json_object(text: str) -> dict:
+    """Parse a JSON object, salvaging slightly malformed model output.
+
+    Falls back to the outermost braces (dropping stray text around the
+    object) and then to stripping trailing commas, so a near-miss response
+    is still used instead of being discarded.
+    """
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        start, end = text.find("{"), text.rfind("}")
+        if start == -1 or end < start:
+            raise
+
+    text = text[start : end + 1]
+    try:
+        data = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        data = orjson.loads(_TRAILING_COMMA_RE.sub(r"\1", text))
+
+    logger.debug("Salvaged malformed tagging response")
+    return data
+
+
+def _failed_tag_result(clip_id: str, error: BaseException) -> TagResult:
+    """Log a tagging failure and build its low-confidence b_roll fallback.
+
+    Cancellation is re-raised rather than turned into a fallback result.
+    """
+    if isinstance(error, asyncio.CancelledError):
+        raise error
+
+    logger.error("Failed to tag clip", clip_id=clip_id, error=str(error))
+    return TagResult(
+        clip_id=clip_id,
+        primary_tag=ClipTag.B_ROLL,
+        primary_confidence=0.1,
+        all_tags=[TagScore(tag=ClipTag.B_ROLL, confidence=0.1)],
+        reasoning=f"Tagging failed: {error}",
+    )
+
+
 async def tag_clip(transcript: str, context: ClipContext) -> TagResult:
     """Tag a clip based on its transcript and context.
 
@@ -315,8 +735,15 @@ def create_clip_contexts(
             position_in_video=position,
             is_first_clip=(i == 0),
             is_last_clip=(i == len(clips) - 1),
-            previous_transcript=clips[i - 1].transcript if i > 0 else None,
-            next_transcript=clips[i + 1].transcript if i < len(clips) - 1 else None,
+            # Only the part the prompt uses is kept
+            previous_transcript=(
+                clips[i - 1].transcript[:ADJACENT_TRANSCRIPT_CHARS] if i > 0 else None
+            ),
+            next_transcript=(
+                clips[i + 1].transcript[:ADJACENT_TRANSCRIPT_CHARS]
+                if i < len(clips) - 1
+                else None
+            ),
         )
         contexts.append(context)
 
@@ -3,22 +3,27 @@
 Supports:
 - Direct transcription for files <25MB
 - Chunked transcription for larger files (splits into 10-min segments)
+- Batched transcription of short clips in a single request
 - Word-level and segment-level timestamps
+- In-memory transcript cache keyed by audio content hash
 """
 
 import asyncio
-import math
+import bisect
+import hashlib
+import json
 import os
-import subprocess
 import tempfile
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 import structlog
-from openai import AsyncOpenAI
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from .models import TranscriptResult, TranscriptSegment, WordTimestamp
+from .openai_client import get_openai_client
 
 logger = structlog.get_logger(__name__)
 
@@ -26,6 +31,21 @@ logger = structlog.get_logger(__name__)
 MAX_AUDIO_SIZE_MB = 25
 # Chunk duration for splitting large audio files (10 minutes)
 CHUNK_DURATION_SECONDS = 600
+# Concurrent chunk transcriptions per file
+CHUNK_CONCURRENCY = 5
+# Source audio that can be stream-copied instead of re-encoded
+COPY_AUDIO_CODECS = {"mp3"}
+COPY_AUDIO_MAX_SAMPLE_RATE = 16000
+COPY_AUDIO_MAX_BIT_RATE = 64000  # Keeps copies as small as the encoded output
+# Batched transcription: inputs are joined as 16kHz mono PCM with silence between
+BATCH_SILENCE_SECONDS = 1.0
+PCM_SAMPLE_RATE = 16000
+PCM_BYTES_PER_SECOND = PCM_SAMPLE_RATE * 2  # 16-bit mono
+# Whisper model (part of the transcript cache key)
+WHISPER_MODEL = "whisper-1"
+# Transcripts kept in memory, keyed by audio content hash
+TRANSCRIPT_CACHE_SIZE = 128
+TRANSCRIPT_CACHE_TTL_SECONDS = 24 * 3600
 
 
 class TranscriptionError(Exception):
@@ -34,6 +54,218 @@ class TranscriptionError(Exception):
     pass
 
 
+async def _run_process(
+    cmd: list[str],
+    timeout: Optional[float],
+    input: Optional[bytes] = None,
+) -> tuple[int, bytes, str]:
+    """Run a command without blocking the event loop.
+
+    Args:
+        cmd: Command and arguments
+        timeout: Timeout in seconds (None waits indefinitely)
+        input: Data to write to the command's stdin
+
+    Returns:
+        Tuple of (return code, raw stdout, decoded stderr)
+
+    Raises:
+        asyncio.TimeoutError: If the command did not finish in time (the
+            process is killed)
+    """
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE if input is not None else None,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(input), timeout=timeout)
+    except (asyncio.TimeoutError, asyncio.CancelledError):
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        raise
+
+    return process.returncode, stdout, stderr.decode(errors="replace")
+
+
+def shift_words(words: list[WordTimestamp], offset: float) -> list[WordTimestamp]:
+    """Shift word timestamps by an offset in seconds."""
+    return [
+        WordTimestamp(word=w.word, start=w.start + offset, end=w.end + offset)
+        for w in words
+    ]
+
+
+def shift_transcript(
+    transcript: TranscriptResult,
+    offset: float,
+) -> tuple[list[TranscriptSegment], list[WordTimestamp]]:
+    """Shift a transcript's segments and words by an offset in seconds.
+
+    Segment words are the same objects as the transcript's word list, so each
+    word is shifted once and the copy is shared instead of rebuilt per segment.
+
+    Returns:
+        Tuple of (shifted segments, shifted words)
+    """
+    words = shift_words(transcript.words, offset)
+    shifted = {id(old): new for old, new in zip(transcript.words, words)}
+
+    segments = [
+        TranscriptSegment(
+            text=segment.text,
+            start=segment.start + offset,
+            end=segment.end + offset,
+            words=[
+                shifted.get(id(w))
+                or WordTimestamp(word=w.word, start=w.start + offset, end=w.end + offset)
+                for w in segment.words
+            ],
+        )
+        for segment in transcript.segments
+    ]
+    return segments, words
+
+
+def _part_index(offsets: list[float], start: float) -> int:
+    """Get the index of the last input starting at or before a time."""
+    return max(bisect.bisect_right(offsets, start) - 1, 0)
+
+
+def _clamp_segment(
+    segment: TranscriptSegment,
+    offset: float,
+    duration: float,
+) -> TranscriptSegment:
+    """Clamp a segment's times to one input's span of the joined audio."""
+    start = max(segment.start, offset)
+    end = max(min(segment.end, offset + duration), start)
+    if start == segment.start and end == segment.end:
+        return segment
+    return TranscriptSegment.model_construct(
+        text=segment.text, start=start, end=end, words=segment.words
+    )
+
+
+def split_transcript(
+    transcript: TranscriptResult,
+    offsets: list[float],
+    durations: list[float],
+) -> list[TranscriptResult]:
+    """Split a transcript of joined inputs back into one transcript per input.
+
+    Words and segments go to the last input starting at or before their start
+    time and are shifted onto that input's own timeline. A segment whose
+    words run across the join of two inputs is split at the join, each part
+    keeping its own words and the text rebuilt from them; segment times are
+    clamped to the input they end up in.
+
+    Args:
+        transcript: Transcript of the joined audio
+        offsets: Start of each input in the joined audio, ascending
+        durations: Duration of each input in seconds
+
+    Returns:
+        One TranscriptResult per input, in input order
+    """
+    part_words: list[list[WordTimestamp]] = [[] for _ in offsets]
+    part_segments: list[list[TranscriptSegment]] = [[] for _ in offsets]
+    for word in transcript.words:
+        part_words[_part_index(offsets, word.start)].append(word)
+    for segment in transcript.segments:
+        by_part: dict[int, list[WordTimestamp]] = {}
+        for word in segment.words:
+            by_part.setdefault(_part_index(offsets, word.start), []).append(word)
+
+        if len(by_part) <= 1:
+            # Follow the words, which may start after a segment begun in the gap
+            index = next(iter(by_part), _part_index(offsets, segment.start))
+            part_segments[index].append(
+                _clamp_segment(segment, offsets[index], durations[index])
+            )
+            continue
+
+        for i, words in by_part.items():
+            piece = TranscriptSegment.model_construct(
+                text=" ".join(w.word.strip() for w in words),
+                start=segment.start,
+                end=segment.end,
+                words=words,
+            )
+            part_segments[i].append(_clamp_segment(piece, offsets[i], durations[i]))
+
+    results = []
+    for offset, duration, words, segments in zip(offsets, durations, part_words, part_segments):
+        part = TranscriptResult.model_construct(segments=segments, words=words)
+        shifted_segments, shifted_words = shift_transcript(part, -offset)
+        results.append(
+            TranscriptResult(
+                full_text=" ".join(segment.text for segment in segments),
+                language=transcript.language,
+                duration=duration,
+                segments=shifted_segments,
+                words=shifted_words,
+            )
+        )
+    return results
+
+
+class TranscriptCache:
+    """In-memory LRU cache of transcripts keyed by audio content hash.
+
+    Re-running a job on the same source produces the same audio, so its
+    transcript is served from here instead of calling Whisper again.
+    Entries are stored as JSON, so every hit returns a fresh copy.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = TRANSCRIPT_CACHE_SIZE,
+        ttl_seconds: float = TRANSCRIPT_CACHE_TTL_SECONDS,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    @staticmethod
+    def key(audio: bytes, language: Optional[str]) -> str:
+        """Build the cache key for audio data and a requested language."""
+        digest = hashlib.sha256(audio).hexdigest()
+        return f"{WHISPER_MODEL}:{language or ''}:{digest}"
+
+    def get(self, key: str) -> Optional[TranscriptResult]:
+        """Get a cached transcript, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, data = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return TranscriptResult.model_validate_json(data)
+
+    def set(self, key: str, result: TranscriptResult) -> None:
+        """Store a transcript, evicting the least recently used entries."""
+        self._entries[key] = (time.monotonic(), result.model_dump_json())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached transcripts."""
+        self._entries.clear()
+
+
+# Shared across Transcriber instances (pipelines are created per request)
+transcript_cache = TranscriptCache()
+
+
 class Transcriber:
     """Transcribes audio/video using OpenAI Whisper API."""
 
@@ -47,7 +279,7 @@ class Transcriber:
         if not self.api_key:
             raise ValueError("OpenAI API key is required")
 
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        self.client = get_openai_client(self.api_key)
 
     async def extract_audio(self, video_path: str, output_path: Optional[str] = None) -> str:
         """Extract audio from video file using FFmpeg.
@@ -70,36 +302,19 @@ class Transcriber:
 
         logger.info("Extracting audio from video", video=str(video_path), output=output_path)
 
-        # FFmpeg command to extract audio
-        cmd = [
-            "ffmpeg",
-            "-i",
-            str(video_path),
-            "-vn",  # No video
-            "-acodec",
-            "libmp3lame",  # MP3 codec
-            "-ar",
-            "16000",  # 16kHz sample rate (optimal for Whisper)
-            "-ac",
-            "1",  # Mono
-            "-b:a",
-            "64k",  # 64kbps bitrate (reduces file size)
+        cmd = await self._extract_audio_cmd(str(video_path))
+        cmd += [
             "-y",  # Overwrite output
             output_path,
         ]
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minute timeout
-            )
+            returncode, _, stderr = await _run_process(cmd, timeout=300)  # 5 minute timeout
 
-            if result.returncode != 0:
-                raise TranscriptionError(f"FFmpeg error: {result.stderr}")
+            if returncode != 0:
+                raise TranscriptionError(f"FFmpeg error: {stderr}")
 
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             raise TranscriptionError("Audio extraction timed out")
 
         # Check file size
@@ -113,6 +328,122 @@ class Transcriber:
         logger.info("Audio extracted successfully", size_mb=round(file_size_mb, 2))
         return output_path
 
+    async def extract_audio_bytes(self, video_path: str) -> bytes:
+        """Extract audio from video file into memory using FFmpeg.
+
+        Same encoding as extract_audio, but FFmpeg writes the MP3 to a pipe,
+        so no temp file is written and read back before the upload.
+
+        Args:
+            video_path: Path to video file
+
+        Returns:
+            MP3 audio data
+        """
+        video_path = Path(video_path)
+        if not video_path.exists():
+            raise FileNotFoundError(f"Video file not found: {video_path}")
+
+        logger.info("Extracting audio from video", video=str(video_path))
+
+        cmd = await self._extract_audio_cmd(str(video_path))
+        cmd += ["-f", "mp3", "pipe:1"]
+
+        try:
+            returncode, audio, stderr = await _run_process(cmd, timeout=300)  # 5 minute timeout
+
+            if returncode != 0:
+                raise TranscriptionError(f"FFmpeg error: {stderr}")
+
+        except asyncio.TimeoutError:
+            raise TranscriptionError("Audio extraction timed out")
+
+        size_mb = len(audio) / (1024 * 1024)
+        if size_mb > MAX_AUDIO_SIZE_MB:
+            logger.warning(
+                "Audio exceeds Whisper limit, will be chunked",
+                size_mb=size_mb,
+            )
+
+        logger.info("Audio extracted successfully", size_mb=round(size_mb, 2))
+        return audio
+
+    async def _extract_audio_cmd(self, video_path: str) -> list[str]:
+        """Build the FFmpeg input and audio codec arguments for extraction.
+
+        Args:
+            video_path: Path to video file
+
+        Returns:
+            FFmpeg command without the output arguments
+        """
+        cmd = [
+            "ffmpeg",
+            "-i",
+            video_path,
+            "-vn",  # No video
+        ]
+        if await self._can_copy_audio(video_path):
+            # Already low-rate mono MP3: copy the stream, no decode/encode
+            cmd += ["-c:a", "copy"]
+        else:
+            cmd += [
+                "-acodec",
+                "libmp3lame",  # MP3 codec
+                "-ar",
+                "16000",  # 16kHz sample rate (optimal for Whisper)
+                "-ac",
+                "1",  # Mono
+                "-b:a",
+                "64k",  # 64kbps bitrate (reduces file size)
+            ]
+        return cmd
+
+    async def _can_copy_audio(self, input_path: str) -> bool:
+        """Check whether the first audio stream can be copied as-is.
+
+        Copying is only used for MP3 that is already mono, at most 16kHz and
+        at most 64kbps, so the result is no larger than a re-encode. Probe
+        failures fall back to re-encoding.
+
+        Args:
+            input_path: Path to source audio or video
+
+        Returns:
+            True if the audio stream can be stream-copied
+        """
+        cmd = [
+            "ffprobe",
+            "-v", "quiet",
+            "-print_format", "json",
+            "-select_streams", "a:0",
+            "-show_streams",
+            input_path,
+        ]
+
+        try:
+            returncode, stdout, _ = await _run_process(cmd, timeout=30)
+            if returncode != 0:
+                return False
+            streams = json.loads(stdout).get("streams") or []
+        except (OSError, ValueError, asyncio.TimeoutError):
+            return False
+
+        if not streams:
+            return False
+
+        stream = streams[0]
+        try:
+            return (
+                stream.get("codec_name") in COPY_AUDIO_CODECS
+                and int(stream.get("channels", 0)) == 1
+                and int(stream.get("sample_rate", 0)) <= COPY_AUDIO_MAX_SAMPLE_RATE
+                and int(stream.get("bit_rate", COPY_AUDIO_MAX_BIT_RATE + 1))
+                <= COPY_AUDIO_MAX_BIT_RATE
+            )
+        except (TypeError, ValueError):
+            return False
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=30),
@@ -133,49 +464,201 @@ class Transcriber:
 
         logger.info("Transcribing audio", path=str(audio_path))
 
-        with open(audio_path, "rb") as audio_file:
-            # Use verbose_json to get word timestamps
-            response = await self.client.audio.transcriptions.create(
-                model="whisper-1",
-                file=audio_file,
-                response_format="verbose_json",
-                timestamp_granularities=["word", "segment"],
-                language=language,
+        # Read in one call off the event loop (an open file handle would be
+        # streamed by httpx in blocking chunks)
+        audio = await asyncio.to_thread(audio_path.read_bytes)
+
+        return await self._create_transcription(audio_path.name, audio, language)
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=30),
+    )
+    async def transcribe_audio_bytes(
+        self,
+        audio: bytes,
+        language: Optional[str] = None,
+        filename: str = "audio.mp3",
+    ) -> TranscriptResult:
+        """Transcribe in-memory audio using OpenAI Whisper API.
+
+        Args:
+            audio: Encoded audio data
+            language: Optional language code (e.g., 'en')
+            filename: Upload file name (its extension tells Whisper the format)
+
+        Returns:
+            TranscriptResult with full text, segments, and word timestamps
+        """
+        logger.info("Transcribing audio", size_mb=round(len(audio) / (1024 * 1024), 2))
+
+        return await self._create_transcription(filename, audio, language)
+
+    async def transcribe_batch(
+        self,
+        audio_paths: list[str],
+        language: Optional[str] = None,
+    ) -> list[TranscriptResult]:
+        """Transcribe several short audio files with a single Whisper request.
+
+        Inputs are decoded to PCM, joined with BATCH_SILENCE_SECONDS of
+        silence between them and encoded once, saving a Whisper round trip
+        per input. The transcript is split back per input by start time.
+        The joined audio must fit Whisper's 25MB limit.
+
+        Args:
+            audio_paths: Paths to audio (or video) files
+            language: Optional language code
+
+        Returns:
+            One TranscriptResult per input, in input order, with timestamps
+            relative to the start of that input
+        """
+        if not audio_paths:
+            return []
+
+        for path in audio_paths:
+            if not Path(path).exists():
+                raise FileNotFoundError(f"Audio file not found: {path}")
+
+        semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+
+        async def decode(path: str) -> bytes:
+            async with semaphore:
+                return await self._decode_pcm(path)
+
+        pcm_inputs = await asyncio.gather(*[decode(path) for path in audio_paths])
+
+        # Exact input durations come from the PCM sizes
+        durations = [len(pcm) / PCM_BYTES_PER_SECOND for pcm in pcm_inputs]
+        offsets = []
+        position = 0.0
+        for duration in durations:
+            offsets.append(position)
+            position += duration + BATCH_SILENCE_SECONDS
+
+        silence = bytes(int(BATCH_SILENCE_SECONDS * PCM_SAMPLE_RATE) * 2)
+        audio = await self._encode_pcm_mp3(silence.join(pcm_inputs))
+
+        size_mb = len(audio) / (1024 * 1024)
+        if size_mb > MAX_AUDIO_SIZE_MB:
+            raise TranscriptionError(
+                f"Batched audio is {size_mb:.1f}MB, over Whisper's {MAX_AUDIO_SIZE_MB}MB limit"
             )
 
+        logger.info("Transcribing audio batch", inputs=len(audio_paths), size_mb=round(size_mb, 2))
+
+        transcript = await self.transcribe_audio_bytes(audio, language, filename="batch.mp3")
+        return split_transcript(transcript, offsets, durations)
+
+    async def _decode_pcm(self, input_path: str) -> bytes:
+        """Decode the first audio stream to 16kHz mono 16-bit PCM."""
+        cmd = [
+            "ffmpeg",
+            "-nostdin",
+            "-loglevel", "error",
+            "-i", input_path,
+            "-vn",
+            "-f", "s16le",
+            "-acodec", "pcm_s16le",
+            "-ar", str(PCM_SAMPLE_RATE),
+            "-ac", "1",
+            "pipe:1",
+        ]
+        try:
+            returncode, pcm, stderr = await _run_process(cmd, timeout=300)
+        except asyncio.TimeoutError:
+            raise TranscriptionError("Audio decoding timed out")
+        if returncode != 0:
+            raise TranscriptionError(f"FFmpeg error: {stderr}")
+        return pcm
+
+    async def _encode_pcm_mp3(self, pcm: bytes) -> bytes:
+        """Encode 16kHz mono 16-bit PCM to MP3 for upload."""
+        cmd = [
+            "ffmpeg",
+            "-loglevel", "error",
+            "-f", "s16le",
+            "-ar", str(PCM_SAMPLE_RATE),
+            "-ac", "1",
+            "-i", "pipe:0",
+            "-acodec", "libmp3lame",
+            "-b:a", "64k",
+            "-f", "mp3",
+            "pipe:1",
+        ]
+        try:
+            returncode, audio, stderr = await _run_process(cmd, timeout=300, input=pcm)
+        except asyncio.TimeoutError:
+            raise TranscriptionError("Audio encoding timed out")
+        if returncode != 0:
+            raise TranscriptionError(f"FFmpeg error: {stderr}")
+        return audio
+
+    async def _create_transcription(
+        self, filename: str, audio: bytes, language: Optional[str]
+    ) -> TranscriptResult:
+        """Send audio to Whisper and parse the response into our models.
+
+        Identical audio is served from the transcript cache.
+
+        Args:
+            filename: Upload file name (its extension tells Whisper the format)
+            audio: Encoded audio data
+            language: Optional language code
+
+        Returns:
+            TranscriptResult with full text, segments, and word timestamps
+        """
+        # Hashing releases the GIL, so run it off the event loop
+        cache_key = await asyncio.to_thread(TranscriptCache.key, audio, language)
+        cached = transcript_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Transcript cache hit", duration=cached.duration)
+            return cached
+
+        # Use verbose_json to get word timestamps
+        response = await self.client.audio.transcriptions.create(
+            model=WHISPER_MODEL,
+            file=(filename, audio),
+            response_format="verbose_json",
+            timestamp_granularities=["word", "segment"],
+            language=language,
+        )
+
         # Parse response into our models
         # The OpenAI SDK returns objects with attributes, not dicts
-        words = []
-        if hasattr(response, "words") and response.words:
-            for word_data in response.words:
-                words.append(
-                    WordTimestamp(
-                        word=getattr(word_data, "word", ""),
-                        start=getattr(word_data, "start", 0.0),
-                        end=getattr(word_data, "end", 0.0),
-                    )
-                )
+        words = [
+            WordTimestamp(word=w.word, start=w.start, end=w.end)
+            for w in (response.words or ())
+        ]
 
         segments = []
-        if hasattr(response, "segments") and response.segments:
-            for seg in response.segments:
-                # Get words for this segment
-                segment_words = []
-                seg_start = getattr(seg, "start", 0.0)
-                seg_end = getattr(seg, "end", 0.0)
-
-                for word in words:
-                    if word.start >= seg_start and word.end <= seg_end:
-                        segment_words.append(word)
-
-                segments.append(
-                    TranscriptSegment(
-                        text=getattr(seg, "text", "").strip(),
-                        start=seg_start,
-                        end=seg_end,
-                        words=segment_words,
-                    )
+        # Words and segments are both in time order, so a single cursor
+        # sweeps the words once instead of rescanning them per segment
+        num_words = len(words)
+        word_idx = 0
+        for seg in response.segments or ():
+            seg_start = seg.start
+            seg_end = seg.end
+
+            # Skip words that start before this segment
+            while word_idx < num_words and words[word_idx].start < seg_start:
+                word_idx += 1
+
+            # Get words for this segment
+            end_idx = word_idx
+            while end_idx < num_words and words[end_idx].end <= seg_end:
+                end_idx += 1
+
+            segments.append(
+                TranscriptSegment(
+                    text=seg.text.strip(),
+                    start=seg_start,
+                    end=seg_end,
+                    words=words[word_idx:end_idx],
                 )
+            )
 
         result = TranscriptResult(
             full_text=response.text,
@@ -192,12 +675,15 @@ class Transcriber:
             words=len(result.words),
         )
 
+        transcript_cache.set(cache_key, result)
         return result
 
     async def transcribe_video(self, video_path: str, language: Optional[str] = None) -> TranscriptResult:
         """Transcribe a video file.
 
-        Extracts audio first, then transcribes.
+        Extracts audio in memory first, then transcribes. Audio over
+        Whisper's 25MB limit is transcribed in chunks instead; the chunks are
+        cut from the extracted MP3, so the audio is only encoded once.
 
         Args:
             video_path: Path to video file
@@ -208,20 +694,19 @@ class Transcriber:
         """
         logger.info("Starting video transcription", video=video_path)
 
-        # Extract audio
-        audio_path = await self.extract_audio(video_path)
+        # Extract audio straight into memory (no temp file to write and clean up)
+        audio = await self.extract_audio_bytes(video_path)
 
-        try:
-            # Transcribe audio
-            result = await self.transcribe_audio(audio_path, language)
-            return result
-        finally:
-            # Clean up temp audio file
-            try:
-                Path(audio_path).unlink()
-                Path(audio_path).parent.rmdir()
-            except Exception as e:
-                logger.warning("Failed to clean up temp audio", error=str(e))
+        if len(audio) > MAX_AUDIO_SIZE_MB * 1024 * 1024:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                audio_path = Path(temp_dir) / "audio.mp3"
+                await asyncio.to_thread(audio_path.write_bytes, audio)
+                del audio
+                return await self._transcribe_chunks(
+                    str(audio_path), language, copy=True
+                )
+
+        return await self.transcribe_audio_bytes(audio, language)
 
     async def transcribe_chunked(
         self,
@@ -231,8 +716,9 @@ class Transcriber:
         """Transcribe audio file, automatically chunking if >25MB.
 
         For large audio files that exceed Whisper's 25MB limit, this method
-        splits the audio into 10-minute chunks, transcribes each separately,
-        and merges the results with adjusted timestamps.
+        splits the audio into 10-minute chunks, transcribes them concurrently
+        (up to CHUNK_CONCURRENCY at a time) while later chunks are still being
+        cut, and merges the results with adjusted timestamps.
 
         Args:
             audio_path: Path to audio file
@@ -259,84 +745,91 @@ class Transcriber:
             size_mb=round(file_size_mb, 2),
         )
 
-        # Get audio duration
-        duration = await self._get_audio_duration(str(audio_path))
-        num_chunks = math.ceil(duration / CHUNK_DURATION_SECONDS)
+        return await self._transcribe_chunks(str(audio_path), language)
 
-        logger.info(
-            "Splitting audio into chunks",
-            duration=duration,
-            num_chunks=num_chunks,
-            chunk_duration=CHUNK_DURATION_SECONDS,
-        )
+    async def _transcribe_chunks(
+        self,
+        input_path: str,
+        language: Optional[str] = None,
+        copy: bool = False,
+    ) -> TranscriptResult:
+        """Transcribe audio (or a video's audio) as 10-minute chunks.
 
-        all_segments: list[TranscriptSegment] = []
-        all_words: list[WordTimestamp] = []
-        all_text_parts: list[str] = []
-        detected_language = language
+        Args:
+            input_path: Path to audio or video file
+            language: Optional language code
+            copy: Input is already Whisper-ready MP3; split without re-encoding
 
+        Returns:
+            TranscriptResult with full text, segments, and word timestamps
+        """
         with tempfile.TemporaryDirectory() as temp_dir:
-            for i in range(num_chunks):
-                start_time = i * CHUNK_DURATION_SECONDS
-                chunk_path = Path(temp_dir) / f"chunk_{i:03d}.mp3"
-
-                # Extract chunk
-                await self._extract_audio_chunk(
-                    str(audio_path),
-                    str(chunk_path),
-                    start_time,
-                    CHUNK_DURATION_SECONDS,
-                )
+            semaphore = asyncio.Semaphore(CHUNK_CONCURRENCY)
+
+            async def process_chunk(i: int, chunk_path: str) -> Optional[TranscriptResult]:
+                async with semaphore:
+                    # Transcribe chunk
+                    logger.info("Transcribing chunk", chunk=i + 1)
+
+                    try:
+                        return await self.transcribe_audio(chunk_path, language)
+                    except Exception as e:
+                        logger.error(
+                            "Failed to transcribe chunk",
+                            chunk=i + 1,
+                            error=str(e),
+                        )
+                        # Continue with other chunks
+                        return None
 
-                # Transcribe chunk
-                logger.info(
-                    "Transcribing chunk",
-                    chunk=i + 1,
-                    total=num_chunks,
-                    start_time=start_time,
-                )
+            # Cut every chunk in a single FFmpeg pass, starting each chunk's
+            # transcription as soon as it is written
+            chunks: list[tuple[str, float, float]] = []
+            tasks: list[asyncio.Task] = []
+            try:
+                async for chunk in self.iter_audio_chunks(
+                    input_path, temp_dir, CHUNK_DURATION_SECONDS, copy=copy
+                ):
+                    tasks.append(asyncio.create_task(process_chunk(len(chunks), chunk[0])))
+                    chunks.append(chunk)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+            num_chunks = len(chunks)
+            duration = chunks[-1][2] if chunks else 0.0
 
-                try:
-                    chunk_result = await self.transcribe_audio(str(chunk_path), language)
-
-                    # Adjust timestamps and add to results
-                    for segment in chunk_result.segments:
-                        adjusted_segment = TranscriptSegment(
-                            text=segment.text,
-                            start=segment.start + start_time,
-                            end=segment.end + start_time,
-                            words=[
-                                WordTimestamp(
-                                    word=w.word,
-                                    start=w.start + start_time,
-                                    end=w.end + start_time,
-                                )
-                                for w in segment.words
-                            ],
-                        )
-                        all_segments.append(adjusted_segment)
+            logger.info(
+                "Split audio into chunks",
+                duration=duration,
+                num_chunks=num_chunks,
+                chunk_duration=CHUNK_DURATION_SECONDS,
+            )
 
-                    for word in chunk_result.words:
-                        adjusted_word = WordTimestamp(
-                            word=word.word,
-                            start=word.start + start_time,
-                            end=word.end + start_time,
-                        )
-                        all_words.append(adjusted_word)
+            # Results come back in chunk order, so timestamps stay sorted
+            results = await asyncio.gather(*tasks)
+
+        all_segments: list[TranscriptSegment] = []
+        all_words: list[WordTimestamp] = []
+        all_text_parts: list[str] = []
+        detected_language = language
+
+        for (_, start_time, _), chunk_result in zip(chunks, results):
+            if chunk_result is None:
+                continue
 
-                    all_text_parts.append(chunk_result.full_text)
+            # Adjust timestamps and add to results
+            segments, words = shift_transcript(chunk_result, start_time)
+            all_segments.extend(segments)
+            all_words.extend(words)
 
-                    # Use detected language from first chunk
-                    if detected_language is None:
-                        detected_language = chunk_result.language
+            all_text_parts.append(chunk_result.full_text)
 
-                except Exception as e:
-                    logger.error(
-                        "Failed to transcribe chunk",
-                        chunk=i + 1,
-                        error=str(e),
-                    )
-                    # Continue with other chunks
+            # Use detected language from first chunk
+            if detected_language is None:
+                detected_language = chunk_result.language
 
         result = TranscriptResult(
             full_text=" ".join(all_text_parts),
@@ -355,70 +848,78 @@ class Transcriber:
 
         return result
 
-    async def _get_audio_duration(self, audio_path: str) -> float:
-        """Get audio file duration using FFprobe.
-
-        Args:
-            audio_path: Path to audio file
-
-        Returns:
-            Duration in seconds
-        """
-        import json
-
-        cmd = [
-            "ffprobe",
-            "-v", "quiet",
-            "-print_format", "json",
-            "-show_format",
-            audio_path,
-        ]
-
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-        if result.returncode != 0:
-            raise TranscriptionError(f"FFprobe error: {result.stderr}")
-
-        data = json.loads(result.stdout)
-        return float(data.get("format", {}).get("duration", 0))
-
-    async def _extract_audio_chunk(
+    async def iter_audio_chunks(
         self,
         input_path: str,
-        output_path: str,
-        start_time: float,
-        duration: float,
-    ) -> None:
-        """Extract a chunk of audio from a file.
+        output_dir: str,
+        chunk_seconds: float,
+        copy: bool = False,
+    ) -> AsyncIterator[tuple[str, float, float]]:
+        """Extract audio as fixed-length MP3 chunks with the segment muxer.
+
+        The input is decoded once and every chunk is written in the same
+        FFmpeg pass. Each chunk is yielded as soon as the muxer closes it,
+        so callers can transcribe earlier chunks while later ones are still
+        being encoded. Video inputs are fine too; their video stream is
+        dropped.
 
         Args:
-            input_path: Path to source audio
-            output_path: Path for output chunk
-            start_time: Start time in seconds
-            duration: Duration in seconds
+            input_path: Path to source audio or video
+            output_dir: Directory for the chunk files
+            chunk_seconds: Target chunk length in seconds
+            copy: Stream copy MP3 input instead of re-encoding it
+
+        Yields:
+            (chunk path, start, end) tuples in timeline order. Times come
+            from the muxer's segment list, so they match the actual cut
+            points rather than multiples of chunk_seconds.
         """
         cmd = [
             "ffmpeg",
-            "-ss", str(start_time),
+            "-nostdin",
+            "-nostats",
+            "-loglevel", "error",
             "-i", input_path,
-            "-t", str(duration),
-            "-acodec", "libmp3lame",
-            "-ar", "16000",
-            "-ac", "1",
-            "-b:a", "64k",
+            "-vn",  # No video
+        ]
+        if copy:
+            cmd += ["-c:a", "copy"]
+        else:
+            cmd += [
+                "-acodec", "libmp3lame",
+                "-ar", "16000",  # 16kHz sample rate (optimal for Whisper)
+                "-ac", "1",  # Mono
+                "-b:a", "64k",
+            ]
+        cmd += [
+            "-f", "segment",
+            "-segment_time", str(chunk_seconds),
+            "-segment_list", "pipe:1",  # One CSV line per finished chunk
+            "-segment_list_type", "csv",
             "-y",
-            output_path,
+            str(Path(output_dir) / "chunk_%04d.mp3"),
         ]
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=120,
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
 
-        if result.returncode != 0:
-            raise TranscriptionError(f"FFmpeg chunk extraction error: {result.stderr}")
+        try:
+            async for line in process.stdout:
+                name, start, end = line.decode().rstrip().rsplit(",", 2)
+                yield str(Path(output_dir) / name), float(start), float(end)
+
+            stderr = await process.stderr.read()
+            if await process.wait() != 0:
+                raise TranscriptionError(
+                    f"FFmpeg audio chunking error: {stderr.decode(errors='replace')[-500:]}"
+                )
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
 
     async def transcribe_video_chunked(
         self,
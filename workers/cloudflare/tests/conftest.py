@@ -8,6 +8,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.transcribe import transcript_cache
+
 from .mocks.mock_openai import (
     MockChatCompletion,
     MockOpenAIClient,
@@ -25,6 +27,14 @@ os.environ.setdefault("R2_ENDPOINT_URL", "https://test.r2.cloudflarestorage.com"
 os.environ.setdefault("R2_BUCKET_NAME", "test-bucket")
 
 
+@pytest.fixture(autouse=True)
+def clear_transcript_cache():
+    """Keep cached transcripts from leaking between tests."""
+    transcript_cache.clear()
+    yield
+    transcript_cache.clear()
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for tests."""
@@ -6,7 +6,7 @@ from typing import Any, Optional
 from unittest.mock import AsyncMock, MagicMock
 
 
-@dataclass
+@dataclass(slots=True)
 class MockWord:
     """Mock word with timestamp."""
 
@@ -18,7 +18,7 @@ class MockWord:
         return getattr(self, key, default)
 
 
-@dataclass
+@dataclass(slots=True)
 class MockSegment:
     """Mock transcript segment."""
 
@@ -30,7 +30,31 @@ class MockSegment:
         return getattr(self, key, default)
 
 
-@dataclass
+# Default Whisper payload, built once and shared (tests only read it)
+_DEFAULT_WORDS = (
+    MockWord(word="This", start=0.0, end=0.5),
+    MockWord(word="is", start=0.5, end=0.7),
+    MockWord(word="a", start=0.7, end=0.8),
+    MockWord(word="test", start=0.8, end=1.2),
+    MockWord(word="transcription.", start=1.2, end=2.0),
+    MockWord(word="It", start=2.0, end=2.2),
+    MockWord(word="has", start=2.2, end=2.5),
+    MockWord(word="multiple", start=2.5, end=3.0),
+    MockWord(word="sentences.", start=3.0, end=3.8),
+    MockWord(word="Each", start=4.0, end=4.3),
+    MockWord(word="sentence", start=4.3, end=4.8),
+    MockWord(word="is", start=4.8, end=5.0),
+    MockWord(word="important.", start=5.0, end=5.8),
+)
+
+_DEFAULT_SEGMENTS = (
+    MockSegment(text="This is a test transcription.", start=0.0, end=2.0),
+    MockSegment(text="It has multiple sentences.", start=2.0, end=3.8),
+    MockSegment(text="Each sentence is important.", start=4.0, end=5.8),
+)
+
+
+@dataclass(slots=True)
 class MockWhisperResponse:
     """Mock Whisper API response."""
 
@@ -43,32 +67,14 @@ class MockWhisperResponse:
     def __post_init__(self):
         if not self.words:
             # Generate mock words
-            self.words = [
-                {"word": "This", "start": 0.0, "end": 0.5},
-                {"word": "is", "start": 0.5, "end": 0.7},
-                {"word": "a", "start": 0.7, "end": 0.8},
-                {"word": "test", "start": 0.8, "end": 1.2},
-                {"word": "transcription.", "start": 1.2, "end": 2.0},
-                {"word": "It", "start": 2.0, "end": 2.2},
-                {"word": "has", "start": 2.2, "end": 2.5},
-                {"word": "multiple", "start": 2.5, "end": 3.0},
-                {"word": "sentences.", "start": 3.0, "end": 3.8},
-                {"word": "Each", "start": 4.0, "end": 4.3},
-                {"word": "sentence", "start": 4.3, "end": 4.8},
-                {"word": "is", "start": 4.8, "end": 5.0},
-                {"word": "important.", "start": 5.0, "end": 5.8},
-            ]
+            self.words = list(_DEFAULT_WORDS)
 
         if not self.segments:
             # Generate mock segments
-            self.segments = [
-                {"text": "This is a test transcription.", "start": 0.0, "end": 2.0},
-                {"text": "It has multiple sentences.", "start": 2.0, "end": 3.8},
-                {"text": "Each sentence is important.", "start": 4.0, "end": 5.8},
-            ]
+            self.segments = list(_DEFAULT_SEGMENTS)
 
 
-@dataclass
+@dataclass(slots=True)
 class MockChatMessage:
     """Mock chat message."""
 
@@ -76,7 +82,7 @@ class MockChatMessage:
     role: str = "assistant"
 
 
-@dataclass
+@dataclass(slots=True)
 class MockChatChoice:
     """Mock chat choice."""
 
@@ -85,7 +91,21 @@ class MockChatChoice:
     finish_reason: str = "stop"
 
 
-@dataclass
+# Default tagging response content, serialized once
+_DEFAULT_TAG_CONTENT = json.dumps(
+    {
+        "primary_tag": "hook",
+        "confidence": 0.85,
+        "all_tags": [
+            {"tag": "hook", "confidence": 0.85},
+            {"tag": "product_benefit", "confidence": 0.45},
+        ],
+        "reasoning": "The clip opens with attention-grabbing content typical of a hook.",
+    }
+)
+
+
+@dataclass(slots=True)
 class MockChatCompletion:
     """Mock chat completion response."""
 
@@ -96,18 +116,7 @@ class MockChatCompletion:
     def __post_init__(self):
         if not self.choices:
             # Default tagging response
-            response = {
-                "primary_tag": "hook",
-                "confidence": 0.85,
-                "all_tags": [
-                    {"tag": "hook", "confidence": 0.85},
-                    {"tag": "product_benefit", "confidence": 0.45},
-                ],
-                "reasoning": "The clip opens with attention-grabbing content typical of a hook.",
-            }
-            self.choices = [
-                MockChatChoice(message=MockChatMessage(content=json.dumps(response)))
-            ]
+            self.choices = [MockChatChoice(message=MockChatMessage(content=_DEFAULT_TAG_CONTENT))]
 
 
 class MockAudioTranscriptions:
@@ -179,15 +188,11 @@ def create_mock_whisper_response(
 
     for word in text.split():
         words.append(
-            {
-                "word": word,
-                "start": current_time,
-                "end": current_time + word_duration,
-            }
+            MockWord(word=word, start=current_time, end=current_time + word_duration)
         )
         current_time += word_duration
 
-    segments = [{"text": text, "start": 0.0, "end": duration}]
+    segments = [MockSegment(text=text, start=0.0, end=duration)]
 
     return MockWhisperResponse(
         text=text,
@@ -0,0 +1,63 @@
+"""Tests for quality rating module."""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src import quality_rate
+from src.quality_rate import QualityRater
+
+
+@pytest.fixture
+def varying_loudness_audio_path(temp_dir):
+    """Create a 30-second stereo tone alternating between loud and quiet.
+
+    The 8kHz tone is sampled 30 degrees either side of its peaks, so the
+    true peak sits above the sample peak.
+    """
+    audio_path = Path(temp_dir) / "varying_loudness.wav"
+
+    cmd = [
+        "ffmpeg",
+        "-f",
+        "lavfi",
+        "-i",
+        "aevalsrc='0.5*sin(2*PI*8000*t+PI/3)*if(lt(mod(t,5),2),1,0.1)':s=48000:d=30",
+        "-ac",
+        "2",
+        "-y",
+        str(audio_path),
+    ]
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        if result.returncode != 0:
+            pytest.skip(f"FFmpeg not available or failed: {result.stderr}")
+    except FileNotFoundError:
+        pytest.skip("FFmpeg not installed")
+
+    return str(audio_path)
+
+
+class TestAnalyzeAudioQuality:
+    """Tests for audio loudness analysis."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(
+        quality_rate.pyloudnorm is None,
+        reason="In-process loudness needs PyAV, pyloudnorm and SciPy",
+    )
+    async def test_in_process_matches_loudnorm(self, varying_loudness_audio_path):
+        """Test the in-process measurement agrees with FFmpeg's loudnorm."""
+        rater = QualityRater()
+
+        in_process = quality_rate._measure_loudness_in_process(varying_loudness_audio_path)
+        with patch.object(quality_rate, "pyloudnorm", None):
+            loudnorm = await rater.analyze_audio_quality(varying_loudness_audio_path)
+
+        assert loudnorm.loudness_range > 10.0
+        assert in_process.loudness_lufs == pytest.approx(loudnorm.loudness_lufs, abs=0.2)
+        assert in_process.loudness_range == pytest.approx(loudnorm.loudness_range, abs=0.5)
+        assert in_process.true_peak_db == pytest.approx(loudnorm.true_peak_db, abs=0.3)
@@ -0,0 +1,144 @@
+"""Tests for R2 client module."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.r2_client import EXISTS_CACHE_TTL, R2Client
+
+
+def _not_found() -> ClientError:
+    return ClientError({"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject")
+
+
+@pytest.fixture
+def s3_client():
+    """Mock S3 client where every HEAD finds its key and listings are empty."""
+    client = MagicMock()
+    client.head_object = AsyncMock(return_value={})
+    client.list_objects_v2 = AsyncMock(return_value={"Contents": [], "IsTruncated": False})
+    return client
+
+
+@pytest.fixture
+def r2_client(s3_client):
+    """R2 client backed by the mock S3 client."""
+    client = R2Client(bucket_name="test-bucket")
+    client._get_client = AsyncMock(return_value=s3_client)
+    return client
+
+
+class TestFileExists:
+    """Tests for checking a single key."""
+
+    @pytest.mark.asyncio
+    async def test_miss_sends_one_head(self, r2_client, s3_client):
+        """Test an unknown key costs one HEAD and later checks hit the cache."""
+        assert await r2_client.file_exists("clips/source-1/clip-1.mp4") is True
+        assert await r2_client.file_exists("clips/source-1/clip-1.mp4") is True
+
+        s3_client.head_object.assert_awaited_once_with(
+            Bucket="test-bucket", Key="clips/source-1/clip-1.mp4"
+        )
+        s3_client.list_objects_v2.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_missing_key_not_cached(self, r2_client, s3_client):
+        """Test a missing key is reported and checked again next time."""
+        s3_client.head_object.side_effect = _not_found()
+
+        assert await r2_client.file_exists("clips/source-1/missing.mp4") is False
+        assert await r2_client.file_exists("clips/source-1/missing.mp4") is False
+        assert s3_client.head_object.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_expires(self, r2_client, s3_client):
+        """Test a cached key is checked again once its entry expires."""
+        with patch("src.r2_client.time.monotonic", return_value=1000.0):
+            r2_client._remember_exists("test-bucket", "clips/source-1/clip-1.mp4")
+            assert await r2_client.file_exists("clips/source-1/clip-1.mp4") is True
+        s3_client.head_object.assert_not_awaited()
+
+        with patch("src.r2_client.time.monotonic", return_value=1000.0 + EXISTS_CACHE_TTL + 1):
+            s3_client.head_object.side_effect = _not_found()
+            assert await r2_client.file_exists("clips/source-1/clip-1.mp4") is False
+        s3_client.head_object.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_oldest(self, r2_client):
+        """Test the cache keeps at most EXISTS_CACHE_MAXSIZE keys."""
+        with patch("src.r2_client.EXISTS_CACHE_MAXSIZE", 2):
+            for name in ("a", "b", "c"):
+                r2_client._remember_exists("test-bucket", name)
+
+        assert not r2_client._known_to_exist("test-bucket", "a")
+        assert r2_client._known_to_exist("test-bucket", "c")
+
+
+class TestFilesExist:
+    """Tests for checking many keys at once."""
+
+    @pytest.mark.asyncio
+    async def test_lists_prefix_for_many_keys(self, r2_client, s3_client):
+        """Test many keys under one prefix are answered by one listing."""
+        keys = [f"clips/source-1/clip-{i}.mp4" for i in range(5)]
+        s3_client.list_objects_v2.return_value = {
+            "Contents": [{"Key": key} for key in keys[:3]],
+            "IsTruncated": False,
+        }
+
+        result = await r2_client.files_exist(keys)
+
+        assert result == {key: key in keys[:3] for key in keys}
+        s3_client.list_objects_v2.assert_awaited_once_with(
+            Bucket="test-bucket", Prefix="clips/source-1/"
+        )
+        s3_client.head_object.assert_not_awaited()
+
+        # Listed keys are cached for single checks
+        assert await r2_client.file_exists(keys[0]) is True
+        s3_client.head_object.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_few_keys_use_head(self, r2_client, s3_client):
+        """Test a handful of keys under a prefix are checked with HEAD."""
+        keys = ["clips/source-1/clip-1.mp4", "clips/source-2/clip-1.mp4"]
+
+        result = await r2_client.files_exist(keys)
+
+        assert result == {key: True for key in keys}
+        assert s3_client.head_object.await_count == 2
+        s3_client.list_objects_v2.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_truncated_listing_falls_back_to_head(self, r2_client, s3_client):
+        """Test keys past a truncated listing are checked with HEAD."""
+        keys = [f"clips/source-1/clip-{i}.mp4" for i in range(5)]
+        s3_client.list_objects_v2.return_value = {
+            "Contents": [{"Key": keys[0]}, {"Key": keys[1]}],
+            "IsTruncated": True,
+        }
+        s3_client.head_object.side_effect = [{}, _not_found(), _not_found()]
+
+        result = await r2_client.files_exist(keys)
+
+        assert result == {
+            keys[0]: True,
+            keys[1]: True,
+            keys[2]: True,
+            keys[3]: False,
+            keys[4]: False,
+        }
+        assert [c.kwargs["Key"] for c in s3_client.head_object.await_args_list] == keys[2:]
+
+    @pytest.mark.asyncio
+    async def test_cached_keys_skip_requests(self, r2_client, s3_client):
+        """Test keys already known to exist need no request."""
+        keys = [f"clips/source-1/clip-{i}.mp4" for i in range(5)]
+        for key in keys:
+            r2_client._remember_exists("test-bucket", key)
+
+        assert await r2_client.files_exist(keys) == {key: True for key in keys}
+        s3_client.list_objects_v2.assert_not_awaited()
+        s3_client.head_object.assert_not_awaited()
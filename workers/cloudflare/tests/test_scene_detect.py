@@ -1,13 +1,22 @@
 """Tests for scene detection module."""
 
+import os
+import shutil
 import subprocess
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from scenedetect import SceneManager
 
 from src.models import SceneBoundary, SceneDetectionResult
-from src.scene_detect import SceneDetectionError, SceneDetector, detect_scenes
+from src.scene_detect import (
+    SceneDetectionError,
+    SceneDetector,
+    detect_scenes,
+    detect_scenes_batch,
+)
 
 
 class TestSceneDetector:
@@ -20,6 +29,7 @@ class TestSceneDetector:
         assert detector.min_scene_len == 1.5
         assert detector.threshold == 27.0
         assert detector.use_adaptive is True
+        assert detector.collect_stats is False
 
     def test_init_custom_values(self):
         """Test initialization with custom values."""
@@ -33,6 +43,17 @@ class TestSceneDetector:
         assert detector.threshold == 30.0
         assert detector.use_adaptive is False
 
+    def test_downscale_factor(self):
+        """Test automatic downscaling is kept unless a factor is set."""
+        scene_manager = SceneManager()
+        SceneDetector()._apply_downscale(scene_manager)
+        assert scene_manager.auto_downscale is True
+
+        scene_manager = SceneManager()
+        SceneDetector(downscale=2)._apply_downscale(scene_manager)
+        assert scene_manager.auto_downscale is False
+        assert scene_manager.downscale == 2
+
     def test_get_video_info(self, sample_video_path):
         """Test getting video metadata."""
         detector = SceneDetector()
@@ -53,6 +74,44 @@ class TestSceneDetector:
         with pytest.raises(SceneDetectionError):
             detector.get_video_info("/nonexistent/video.mp4")
 
+    def test_get_video_info_cached(self, temp_dir):
+        """Test that FFprobe runs once per unchanged file."""
+        video_path = Path(temp_dir) / "cached.mp4"
+        video_path.write_bytes(b"not really a video")
+        probe_output = MagicMock(
+            returncode=0,
+            stdout=b'{"format": {"duration": "5.0"}, "streams": '
+            b'[{"codec_type": "video", "r_frame_rate": "30/1", "width": 320, "height": 240}]}',
+        )
+        detector = SceneDetector()
+
+        with patch("src.scene_detect.av", None), \
+                patch("src.scene_detect.subprocess.run", return_value=probe_output) as mock_run:
+            first = detector.get_video_info(str(video_path))
+            second = detector.get_video_info(str(video_path))
+
+        assert mock_run.call_count == 1
+        assert first == second
+        assert first["fps"] == 30.0
+        assert first["duration"] == 5.0
+
+    def test_get_video_info_stream_url(self):
+        """Test that stream URLs are probed directly without a local stat."""
+        probe_output = MagicMock(
+            returncode=0,
+            stdout=b'{"format": {"duration": "8.0"}, "streams": '
+            b'[{"codec_type": "video", "r_frame_rate": "25/1", "width": 640, "height": 360}]}',
+        )
+        detector = SceneDetector()
+
+        with patch("src.scene_detect.av", None), \
+                patch("src.scene_detect.subprocess.run", return_value=probe_output) as mock_run:
+            info = detector.get_video_info("https://r2.example.com/source.mp4?X-Amz-Signature=abc")
+
+        assert mock_run.call_count == 1
+        assert info["fps"] == 25.0
+        assert info["duration"] == 8.0
+
     def test_detect_scenes_basic(self, sample_video_path):
         """Test basic scene detection."""
         detector = SceneDetector(min_scene_len=0.5)
@@ -116,6 +175,44 @@ class TestSceneDetector:
         assert content_result.total_scenes >= 1
 
 
+    @pytest.mark.parametrize("faststart", [True, False])
+    def test_detect_scenes_from_fifo(self, sample_video_path, temp_dir, faststart):
+        """Test decoding from a FIFO, which fails if the index is at the end."""
+        source_path = sample_video_path
+        if faststart:
+            source_path = str(Path(temp_dir) / "faststart.mp4")
+            subprocess.run(
+                [
+                    "ffmpeg", "-i", sample_video_path, "-c", "copy",
+                    "-movflags", "+faststart", "-y", source_path,
+                ],
+                capture_output=True,
+                check=True,
+            )
+        fifo_path = str(Path(temp_dir) / "video.fifo")
+        os.mkfifo(fifo_path)
+
+        def feed():
+            with open(fifo_path, "wb") as fifo, open(source_path, "rb") as source:
+                try:
+                    shutil.copyfileobj(source, fifo)
+                except BrokenPipeError:
+                    pass
+
+        feeder = threading.Thread(target=feed)
+        feeder.start()
+        detector = SceneDetector()
+        try:
+            if faststart:
+                result = detector.detect_scenes(fifo_path)
+                assert result == detector.detect_scenes(source_path)
+            else:
+                with pytest.raises(SceneDetectionError):
+                    detector.detect_scenes(fifo_path)
+        finally:
+            feeder.join()
+
+
 class TestSceneBoundary:
     """Tests for SceneBoundary model."""
 
@@ -176,3 +273,19 @@ class TestConvenienceFunction:
 
         assert isinstance(scenes, list)
         assert len(scenes) >= 1
+
+    def test_detect_scenes_batch(self, sample_video_path):
+        """Test parallel detection across several videos."""
+        results = detect_scenes_batch(
+            [sample_video_path, sample_video_path],
+            min_scene_len=0.5,
+            max_workers=2,
+        )
+
+        assert len(results) == 2
+        assert all(isinstance(r, SceneDetectionResult) for r in results)
+        assert all(r.total_scenes >= 1 for r in results)
+
+    def test_detect_scenes_batch_empty(self):
+        """Test batch detection with no videos."""
+        assert detect_scenes_batch([]) == []
@@ -42,6 +42,90 @@ class TestVideoSplitter:
         assert splitter.audio_codec == "libopus"
         assert splitter.video_bitrate == "1M"
 
+    def test_encoder_backend_auto(self):
+        """Test hardware encoder auto-detection."""
+        with patch(
+            "src.split_video._available_encoders",
+            return_value=frozenset({"libx264", "h264_vaapi"}),
+        ), patch("src.split_video._hardware_encoder_works", return_value=True):
+            assert VideoSplitter().encoder_backend == "vaapi"
+            # Non-H.264 codecs never switch to a hardware encoder
+            splitter = VideoSplitter(video_codec="libvpx-vp9")
+            assert splitter.encoder_backend == "software"
+
+        # Compiled in but no usable device (e.g. distro FFmpeg without a GPU)
+        with patch(
+            "src.split_video._available_encoders",
+            return_value=frozenset({"libx264", "h264_nvenc", "h264_vaapi"}),
+        ), patch("src.split_video._hardware_encoder_works", return_value=False):
+            assert VideoSplitter().encoder_backend == "software"
+
+        with patch(
+            "src.split_video._available_encoders",
+            return_value=frozenset({"libx264"}),
+        ):
+            splitter = VideoSplitter()
+            assert splitter.encoder_backend == "software"
+            _, video_args = splitter._encode_args()
+            assert video_args[:4] == ["-c:v", "libx264", "-preset", "veryfast"]
+            assert "-crf" in video_args
+            assert "-b:v" not in video_args
+            assert "-tune" not in video_args
+            assert video_args[video_args.index("-x264-params") + 1] == (
+                "rc-lookahead=10:ref=1:bframes=0"
+            )
+
+            splitter = VideoSplitter(crf=None)
+            _, video_args = splitter._encode_args()
+            assert video_args[video_args.index("-b:v") + 1] == "2M"
+
+    @pytest.mark.asyncio
+    async def test_default_concurrency(self):
+        """Test sizing concurrency to CPU cores and NVENC sessions."""
+        with patch("src.split_video.os.cpu_count", return_value=16):
+            splitter = VideoSplitter(encoder_backend="software", threads_per_encode=4)
+            assert await splitter._default_concurrency() == 4
+
+            splitter = VideoSplitter(encoder_backend="nvenc", threads_per_encode=1)
+            with patch(
+                "src.split_video._nvenc_sessions_in_use",
+                AsyncMock(return_value=6),
+            ):
+                assert await splitter._default_concurrency() == 2
+
+    def test_thumbnail_filter_backends(self):
+        """Test thumbnail scaling stays on the GPU for hardware backends."""
+        assert VideoSplitter(encoder_backend="software")._thumbnail_filter(
+            hw_frames=True
+        ).startswith("scale=640:360")
+        assert VideoSplitter(encoder_backend="nvenc")._thumbnail_filter(
+            hw_frames=True
+        ).startswith("scale_cuda=640:360")
+        assert VideoSplitter(encoder_backend="vaapi")._thumbnail_filter(
+            hw_frames=True
+        ).startswith("scale_vaapi=w=640:h=360")
+        assert VideoSplitter(encoder_backend="vaapi")._thumbnail_filter().startswith(
+            "scale=640:360"
+        )
+
+    def test_encoder_backend_invalid(self):
+        """Test rejecting unknown encoder backends."""
+        with pytest.raises(ValueError):
+            VideoSplitter(encoder_backend="quicksync")
+
+    @pytest.mark.asyncio
+    async def test_snap_to_keyframe(self):
+        """Test snapping clip starts to cached keyframes."""
+        splitter = VideoSplitter(fast_mode=False, keyframe_tolerance=0.05)
+        splitter._keyframe_cache["video.mp4"] = [0.0, 2.0, 4.0]
+
+        assert await splitter._snap_to_keyframe("video.mp4", 2.0) == 2.0
+        assert await splitter._snap_to_keyframe("video.mp4", 4.03) == 4.0
+        assert await splitter._snap_to_keyframe("video.mp4", 3.0) is None
+
+        splitter.keyframe_tolerance = None
+        assert await splitter._snap_to_keyframe("video.mp4", 2.0) is None
+
     @pytest.mark.asyncio
     async def test_extract_clip(self, sample_video_path, temp_dir):
         """Test extracting a single clip."""
@@ -58,6 +142,50 @@ class TestVideoSplitter:
         assert Path(result).exists()
         assert result == output_path
 
+    @pytest.mark.asyncio
+    async def test_extract_clip_without_accurate_seek(self, sample_video_path, temp_dir):
+        """Test re-encoding a clip that starts at the prior keyframe."""
+        splitter = VideoSplitter(
+            fast_mode=False, keyframe_tolerance=None, accurate_seek=False
+        )
+        output_path = str(Path(temp_dir) / "clip.mp4")
+
+        result = await splitter.extract_clip(
+            sample_video_path,
+            start_time=1.0,
+            end_time=2.0,
+            output_path=output_path,
+        )
+
+        assert Path(result).exists()
+
+    @pytest.mark.asyncio
+    async def test_extract_clip_to_stream(self, sample_video_path):
+        """Test streaming a clip as fragmented MP4."""
+        splitter = VideoSplitter()
+
+        chunks = [
+            chunk
+            async for chunk in splitter.extract_clip_to_stream(
+                sample_video_path, start_time=0.0, end_time=2.0
+            )
+        ]
+
+        data = b"".join(chunks)
+        assert data[4:8] == b"ftyp"
+        assert b"moof" in data
+
+    @pytest.mark.asyncio
+    async def test_extract_clip_to_stream_error(self):
+        """Test streaming a clip from a missing source."""
+        splitter = VideoSplitter()
+
+        with pytest.raises(VideoSplitError):
+            async for _ in splitter.extract_clip_to_stream(
+                "/nonexistent/video.mp4", start_time=0.0, end_time=1.0
+            ):
+                pass
+
     @pytest.mark.asyncio
     async def test_generate_thumbnail(self, sample_video_path, temp_dir):
         """Test generating a thumbnail."""
@@ -73,6 +201,21 @@ class TestVideoSplitter:
         assert Path(result).exists()
         assert result == output_path
 
+    @pytest.mark.asyncio
+    async def test_generate_thumbnail_keyframe_only(self, sample_video_path, temp_dir):
+        """Test generating a thumbnail from the nearest keyframe."""
+        splitter = VideoSplitter()
+        output_path = str(Path(temp_dir) / "thumb.jpg")
+
+        result = await splitter.generate_thumbnail(
+            sample_video_path,
+            output_path=output_path,
+            time_offset=2.5,
+            keyframe_only=True,
+        )
+
+        assert Path(result).exists()
+
     @pytest.mark.asyncio
     async def test_split_single_clip(self, sample_video_path, temp_dir):
         """Test splitting a single clip with thumbnail."""
@@ -127,6 +270,43 @@ class TestVideoSplitter:
         assert results[0].clip_id == "clip_001"
         assert results[1].clip_id == "clip_002"
 
+    @pytest.mark.asyncio
+    async def test_split_video_skips_clips_past_end(self, sample_video_path, temp_dir):
+        """Test that clips starting after the end of the video are skipped."""
+        splitter = VideoSplitter()
+        splitter._probe_cache[sample_video_path] = {"format": {"duration": "5.0"}}
+        clips = [
+            ClipDefinition(clip_id="inside", start_time=0.0, end_time=1.0),
+            ClipDefinition(clip_id="outside", start_time=6.0, end_time=7.0),
+        ]
+
+        results = await splitter.split_video(sample_video_path, clips, temp_dir)
+
+        assert [r.clip_id for r in results] == ["inside"]
+
+    @pytest.mark.asyncio
+    async def test_stream_clips(self, sample_video_path, temp_dir):
+        """Test piping clips to a consumer instead of writing them."""
+        splitter = VideoSplitter()
+        clips = [
+            ClipDefinition(clip_id="clip_001", start_time=0.0, end_time=1.5),
+            ClipDefinition(clip_id="clip_002", start_time=1.5, end_time=3.0),
+        ]
+
+        async def consume(clip, chunks, thumbnail_path):
+            data = b"".join([chunk async for chunk in chunks])
+            return clip.clip_id, data, Path(thumbnail_path).exists()
+
+        output_dir = Path(temp_dir) / "clips"
+
+        results = await splitter.stream_clips(
+            sample_video_path, clips, str(output_dir), consume
+        )
+
+        assert [r[0] for r in results] == ["clip_001", "clip_002"]
+        assert all(data[4:8] == b"ftyp" and has_thumb for _, data, has_thumb in results)
+        assert not list(output_dir.glob("*.mp4"))
+
     @pytest.mark.asyncio
     async def test_split_video_missing_source(self, temp_dir):
         """Test splitting with missing source file."""
@@ -146,6 +326,33 @@ class TestVideoSplitter:
                 temp_dir,
             )
 
+    @pytest.mark.asyncio
+    async def test_split_video_aborts_on_fatal_error(self, sample_video_path, temp_dir):
+        """Test that a disk-full error cancels the remaining clips."""
+        splitter = VideoSplitter(fast_mode=False, keyframe_tolerance=None)
+        clips = [
+            ClipDefinition(clip_id=f"clip_{i}", start_time=0.0, end_time=1.0)
+            for i in range(3)
+        ]
+        cancelled = []
+
+        async def fake_split(video_path, clip, output_dir):
+            if clip.clip_id == "clip_0":
+                raise VideoSplitError("FFmpeg error: No space left on device")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(clip.clip_id)
+                raise
+
+        with patch.object(splitter, "split_single_clip", side_effect=fake_split):
+            with pytest.raises(VideoSplitError, match="No space left"):
+                await splitter.split_video(
+                    sample_video_path, clips, temp_dir, max_concurrent=3
+                )
+
+        assert sorted(cancelled) == ["clip_1", "clip_2"]
+
     @pytest.mark.asyncio
     async def test_split_video_concurrent_limit(self, sample_video_path, temp_dir):
         """Test that concurrent limit is respected."""
@@ -222,6 +429,35 @@ class TestCreateClipDefinitions:
             assert clip.clip_id.startswith("test_source_clip_")
             assert clip.end_time - clip.start_time >= 2.0
 
+    def test_create_clips_scene_indices(self, sample_scene_boundaries):
+        """Test that identical scenes get their own scene index."""
+        scene = sample_scene_boundaries[0]
+        clips = create_clip_definitions(
+            scenes=[scene, scene],
+            transcript_segments=[],
+            min_duration=0.1,
+            max_duration=1000.0,
+            source_id="test",
+        )
+
+        assert [clip.scene_indices for clip in clips] == [[0], [1]]
+
+    def test_get_transcript_for_range(self):
+        """Test transcript lookup for overlapping segments."""
+        from src.models import TranscriptSegment
+        from src.split_video import _get_transcript_for_range
+
+        segments = [
+            TranscriptSegment(text="Long.", start=0.0, end=10.0, words=[]),
+            TranscriptSegment(text="One.", start=1.0, end=2.0, words=[]),
+            TranscriptSegment(text="Two.", start=3.0, end=4.0, words=[]),
+            TranscriptSegment(text="Three.", start=5.0, end=6.0, words=[]),
+        ]
+
+        assert _get_transcript_for_range(segments, 2.5, 5.0) == "Long. Two."
+        assert _get_transcript_for_range(segments, 1.5, 3.5) == "Long. One. Two."
+        assert _get_transcript_for_range(segments, 11.0, 12.0) == ""
+
     def test_create_clips_respects_min_duration(self, sample_scene_boundaries):
         """Test that clips respect minimum duration."""
         # Create very short scenes
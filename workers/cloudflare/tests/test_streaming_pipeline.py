@@ -0,0 +1,318 @@
+"""Tests for streaming pipeline module."""
+
+import asyncio
+import os
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import orjson
+import pytest
+
+from src.streaming_pipeline import (
+    StreamingPipelineResult,
+    StreamingVideoPipeline,
+    _feed_fifo,
+    _sign_webhook_body,
+    _WrittenPrefix,
+    stream_download_to_disk,
+)
+
+
+def _read_fifo(fifo_path: str, delay: float = 0.0) -> bytes:
+    """Read a FIFO until EOF, pausing after every 64KB read."""
+    data = b""
+    with open(fifo_path, "rb", buffering=0) as fifo:
+        while chunk := fifo.read(65536):
+            data += chunk
+            time.sleep(delay)
+    return data
+
+
+def _serve(data: bytes, ranges: bool = True, short_range_start: int = -1):
+    """Build a mock transport serving data, honouring Range headers if asked.
+
+    The range starting at short_range_start comes back one byte short.
+    """
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        range_header = request.headers.get("range")
+        if not ranges or range_header is None:
+            return httpx.Response(200, content=data)
+
+        start, end = (int(n) for n in range_header.removeprefix("bytes=").split("-"))
+        body = data[start : end + 1]
+        if start == short_range_start:
+            body = body[:-1]
+        return httpx.Response(
+            206,
+            headers={"content-range": f"bytes {start}-{end}/{len(data)}"},
+            content=body,
+        )
+
+    return httpx.MockTransport(handler), requests
+
+
+class TestStreamDownloadToDisk:
+    """Tests for streaming a download to disk."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fallocate", [True, False])
+    async def test_ranged_download(self, temp_dir, monkeypatch, fallocate):
+        """Test a large object from a ranged server is fetched as ranges."""
+        if not fallocate:
+            # As on macOS
+            monkeypatch.delattr(os, "posix_fallocate", raising=False)
+        data = os.urandom(10 * 1024 + 100)
+        transport, requests = _serve(data)
+        dest_path = Path(temp_dir) / "source.mp4"
+        prefix = _WrittenPrefix()
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            with patch("src.streaming_pipeline.get_http_client", return_value=client), patch(
+                "src.streaming_pipeline.PARALLEL_DOWNLOAD_THRESHOLD", 1024
+            ), patch("src.streaming_pipeline.DOWNLOAD_RANGE_SIZE", 4096):
+                total = await stream_download_to_disk(
+                    "https://r2.test/video.mp4", str(dest_path), prefix=prefix
+                )
+
+        assert total == len(data)
+        assert dest_path.read_bytes() == data
+        assert prefix.size == len(data) and prefix.complete
+        # Size probe, then three ranges
+        assert requests[0].headers["range"] == "bytes=0-0"
+        assert sorted(r.headers["range"] for r in requests[1:]) == [
+            "bytes=0-4095",
+            "bytes=4096-8191",
+            "bytes=8192-10339",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_server_ignoring_range(self, temp_dir):
+        """Test a server answering the Range probe with 200 gets one plain GET."""
+        data = os.urandom(10 * 1024)
+        transport, requests = _serve(data, ranges=False)
+        dest_path = Path(temp_dir) / "source.mp4"
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            with patch("src.streaming_pipeline.get_http_client", return_value=client), patch(
+                "src.streaming_pipeline.PARALLEL_DOWNLOAD_THRESHOLD", 1024
+            ):
+                total = await stream_download_to_disk("https://r2.test/video.mp4", str(dest_path))
+
+        assert total == len(data)
+        assert dest_path.read_bytes() == data
+        assert len(requests) == 2
+        assert "range" not in requests[1].headers
+
+    @pytest.mark.asyncio
+    async def test_short_range_read(self, temp_dir):
+        """Test a range that comes back short fails the download."""
+        data = os.urandom(10 * 1024)
+        transport, requests = _serve(data, short_range_start=4096)
+        dest_path = Path(temp_dir) / "source.mp4"
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            with patch("src.streaming_pipeline.get_http_client", return_value=client), patch(
+                "src.streaming_pipeline.PARALLEL_DOWNLOAD_THRESHOLD", 1024
+            ), patch("src.streaming_pipeline.DOWNLOAD_RANGE_SIZE", 4096):
+                with pytest.raises(httpx.HTTPError, match="Short read for range 4096-8191"):
+                    await stream_download_to_disk("https://r2.test/video.mp4", str(dest_path))
+
+
+class TestWrittenPrefix:
+    """Tests for tracking the gap-free prefix of a download."""
+
+    def test_out_of_order_writes(self):
+        """Test extents past a gap join the prefix once the gap fills."""
+        prefix = _WrittenPrefix()
+
+        prefix.add(20, 10)
+        prefix.add(30, 10)
+        prefix.add(50, 10)
+        assert prefix.size == 0
+
+        prefix.add(0, 10)
+        assert prefix.size == 10
+
+        prefix.add(10, 10)
+        assert prefix.size == 40
+
+        prefix.add(40, 10)
+        assert prefix.size == 60
+
+
+class TestFeedFifo:
+    """Tests for feeding scene detection from a download in progress."""
+
+    @pytest.mark.asyncio
+    async def test_feeds_file_in_order(self, temp_dir):
+        """Test the reader gets the whole file as it is written."""
+        data = os.urandom(3 * 1024 * 1024)
+        video_path = Path(temp_dir) / "source.mp4"
+        video_path.write_bytes(data)
+        fifo_path = str(Path(temp_dir) / "source.fifo")
+        os.mkfifo(fifo_path)
+
+        prefix = _WrittenPrefix()
+        reader = asyncio.ensure_future(asyncio.to_thread(_read_fifo, fifo_path))
+        feed = asyncio.create_task(_feed_fifo(fifo_path, str(video_path), prefix, reader))
+
+        # The second half lands first
+        half = len(data) // 2
+        prefix.add(half, len(data) - half)
+        await asyncio.sleep(0.05)
+        prefix.add(0, half)
+        prefix.finish()
+
+        assert await asyncio.wait_for(feed, timeout=10) is True
+        assert await asyncio.wait_for(reader, timeout=10) == data
+        assert not os.path.exists(fifo_path)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_reader_gets_eof(self, temp_dir):
+        """Test cancelling the reader's job ends the feed and closes the FIFO."""
+        video_path = Path(temp_dir) / "source.mp4"
+        video_path.write_bytes(os.urandom(8 * 1024 * 1024))
+        fifo_path = str(Path(temp_dir) / "source.fifo")
+        os.mkfifo(fifo_path)
+
+        prefix = _WrittenPrefix()
+        prefix.add(0, 8 * 1024 * 1024)
+        job = asyncio.get_running_loop().create_future()
+        # A slow reader, still decoding when its job is cancelled
+        reading = asyncio.ensure_future(asyncio.to_thread(_read_fifo, fifo_path, 0.01))
+        feed = asyncio.create_task(_feed_fifo(fifo_path, str(video_path), prefix, job))
+
+        await asyncio.sleep(0.05)
+        job.cancel()
+
+        assert await asyncio.wait_for(feed, timeout=10) is False
+        assert len(await asyncio.wait_for(reading, timeout=10)) < 8 * 1024 * 1024
+
+    @pytest.mark.asyncio
+    async def test_reader_that_never_opens(self, temp_dir):
+        """Test the feed does not wait forever for a reader that never starts."""
+        video_path = Path(temp_dir) / "source.mp4"
+        video_path.write_bytes(b"video")
+        fifo_path = str(Path(temp_dir) / "source.fifo")
+        os.mkfifo(fifo_path)
+
+        job = asyncio.get_running_loop().create_future()
+        feed = asyncio.create_task(
+            _feed_fifo(fifo_path, str(video_path), _WrittenPrefix(), job)
+        )
+        await asyncio.sleep(0.05)
+        job.cancel()
+
+        assert await asyncio.wait_for(feed, timeout=10) is False
+        assert not os.path.exists(fifo_path)
+
+
+class TestCallWebhook:
+    """Tests for calling the job's webhook."""
+
+    @staticmethod
+    def _result() -> StreamingPipelineResult:
+        return StreamingPipelineResult(
+            source_id="test-source",
+            job_id="test-job",
+            status="completed",
+            total_duration=10.0,
+            total_clips=0,
+            clips=[],
+            processing_time_seconds=1.0,
+        )
+
+    @staticmethod
+    def _response(status_code: int) -> MagicMock:
+        response = MagicMock()
+        response.status_code = status_code
+        response.text = ""
+        return response
+
+    @pytest.mark.asyncio
+    async def test_call_webhook_retry_on_failure(self, mock_r2_client):
+        """Test server errors and connection failures are retried with backoff."""
+        pipeline = StreamingVideoPipeline(r2_client=mock_r2_client)
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(
+            side_effect=[
+                self._response(500),
+                httpx.ConnectError("connection refused"),
+                self._response(200),
+            ]
+        )
+
+        with patch(
+            "src.streaming_pipeline.get_http_client", return_value=mock_client
+        ), patch("asyncio.sleep", AsyncMock()) as mock_sleep:
+            result = await pipeline._call_webhook(
+                "https://example.com/webhook", self._result(), retries=3
+            )
+
+        assert result is True
+        assert mock_client.post.call_count == 3
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_call_webhook_gives_up_after_retries(self, mock_r2_client):
+        """Test a webhook that keeps failing is attempted retries times."""
+        pipeline = StreamingVideoPipeline(r2_client=mock_r2_client)
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(return_value=self._response(503))
+
+        with patch(
+            "src.streaming_pipeline.get_http_client", return_value=mock_client
+        ), patch("asyncio.sleep", AsyncMock()):
+            result = await pipeline._call_webhook(
+                "https://example.com/webhook", self._result(), retries=2
+            )
+
+        assert result is False
+        assert mock_client.post.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_call_webhook_client_error_not_retried(self, mock_r2_client):
+        """Test a 4xx response is final."""
+        pipeline = StreamingVideoPipeline(r2_client=mock_r2_client)
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(return_value=self._response(404))
+
+        with patch(
+            "src.streaming_pipeline.get_http_client", return_value=mock_client
+        ), patch("asyncio.sleep", AsyncMock()) as mock_sleep:
+            result = await pipeline._call_webhook(
+                "https://example.com/webhook", self._result(), retries=3
+            )
+
+        assert result is False
+        assert mock_client.post.call_count == 1
+        mock_sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sign_thread_threshold", [256 * 1024, 0])
+    async def test_call_webhook_signature(self, mock_r2_client, sign_thread_threshold):
+        """Test the signature header is the HMAC of the exact body sent."""
+        pipeline = StreamingVideoPipeline(r2_client=mock_r2_client)
+        mock_client = AsyncMock()
+        mock_client.post = AsyncMock(return_value=self._response(200))
+
+        with patch(
+            "src.streaming_pipeline.get_http_client", return_value=mock_client
+        ), patch(
+            "src.streaming_pipeline.WEBHOOK_SIGN_THREAD_THRESHOLD", sign_thread_threshold
+        ):
+            result = await pipeline._call_webhook(
+                "https://example.com/webhook", self._result(), secret="webhook-secret"
+            )
+
+        assert result is True
+        kwargs = mock_client.post.call_args.kwargs
+        assert orjson.loads(kwargs["content"])["job_id"] == "test-job"
+        assert kwargs["headers"]["x-webhook-signature"] == _sign_webhook_body(
+            b"webhook-secret", kwargs["content"]
+        )
@@ -2,12 +2,14 @@
 
 import json
 import os
-from unittest.mock import AsyncMock, patch
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.models import ClipContext, ClipTag, TagResult, TagScore
-from src.tagger import ClipTagger, create_clip_contexts, tag_clip
+from src.tagger import ClipTagger, RateLimiter, create_clip_contexts, tag_clip
 
 from .mocks.mock_openai import (
     MockChatCompletion,
@@ -129,6 +131,44 @@ class TestClipTagger:
         assert result.primary_tag == ClipTag.B_ROLL
         assert result.primary_confidence == 0.3
 
+    def test_parse_response_salvages_malformed_json(self):
+        """Test stray text and trailing commas around the JSON are tolerated."""
+        tagger = ClipTagger(api_key="test-key")
+        response = """Here you go: {
+    "primary_tag": "testimonial",
+    "confidence": 0.8,
+    "all_tags": [{"tag": "testimonial", "confidence": 0.8},],
+    "reasoning": "Customer story",
+} Hope this helps!"""
+
+        result = tagger._parse_response(response, "test_001")
+
+        assert result.primary_tag == ClipTag.TESTIMONIAL
+        assert result.primary_confidence == 0.8
+
+    def test_parse_response_unknown_tags(self):
+        """Test unknown secondary tags are dropped and unknown primary tags fall back."""
+        tagger = ClipTagger(api_key="test-key")
+        response = json.dumps(
+            {
+                "primary_tag": "proof",
+                "confidence": 0.7,
+                "all_tags": [
+                    {"tag": "proof", "confidence": 0.7},
+                    {"tag": "meme", "confidence": 0.2},
+                ],
+            }
+        )
+
+        result = tagger._parse_response(response, "test_001")
+
+        assert [t.tag for t in result.all_tags] == [ClipTag.PROOF]
+
+        result = tagger._parse_response('{"primary_tag": "meme"}', "test_001")
+
+        assert result.primary_tag == ClipTag.B_ROLL
+        assert result.primary_confidence == 0.3
+
     @pytest.mark.asyncio
     async def test_tag_clip_empty_transcript(self):
         """Test tagging clip with empty transcript returns b_roll."""
@@ -204,6 +244,215 @@ class TestClipTagger:
         assert len(results) == 3
         assert all(isinstance(r, TagResult) for r in results)
 
+    @pytest.mark.asyncio
+    async def test_tag_clips_reuses_identical_transcripts(self, mock_tag_response):
+        """Test that clips with the same transcript share one API call."""
+        tagger = ClipTagger(api_key="test-key")
+        mock_client = MockOpenAIClient(chat_response=mock_tag_response)
+        tagger.client = mock_client
+
+        contexts = [
+            ClipContext(
+                clip_id=f"test_{i:03d}",
+                transcript="Use code SAVE20 at checkout today",
+                duration=5.0,
+                position_in_video=0.5,
+            )
+            for i in range(3)
+        ]
+
+        results = await tagger.tag_clips(contexts)
+
+        mock_client.chat.completions.create.assert_called_once()
+        assert [r.clip_id for r in results] == ["test_000", "test_001", "test_002"]
+        assert len({r.primary_tag for r in results}) == 1
+
+    @pytest.mark.asyncio
+    async def test_tag_clips_failure_fallback(self):
+        """Test that a failed clip gets a low-confidence b_roll fallback."""
+        tagger = ClipTagger(api_key="test-key")
+        tagged = TagResult(
+            clip_id="test_000",
+            primary_tag=ClipTag.HOOK,
+            primary_confidence=0.9,
+            all_tags=[TagScore(tag=ClipTag.HOOK, confidence=0.9)],
+            reasoning="Opens with a question",
+        )
+        tagger.tag_clip = AsyncMock(side_effect=[tagged, RuntimeError("API down")])
+
+        contexts = [
+            ClipContext(
+                clip_id=f"test_{i:03d}",
+                transcript=f"Clip {i} transcript with enough text",
+                duration=5.0,
+                position_in_video=i * 0.5,
+            )
+            for i in range(2)
+        ]
+
+        results = await tagger.tag_clips(contexts, max_concurrent=1)
+
+        assert results[0] is tagged
+        assert results[1].clip_id == "test_001"
+        assert results[1].primary_tag == ClipTag.B_ROLL
+        assert results[1].primary_confidence == 0.1
+        assert "API down" in results[1].reasoning
+
+    @pytest.mark.asyncio
+    async def test_tag_clips_circuit_breaker(self):
+        """Test that repeated failures stop further API calls."""
+        tagger = ClipTagger(api_key="test-key")
+        tagger.tag_clip = AsyncMock(side_effect=RuntimeError("API down"))
+
+        contexts = [
+            ClipContext(
+                clip_id=f"test_{i:03d}",
+                transcript=f"Clip {i} transcript with enough text",
+                duration=5.0,
+                position_in_video=i * 0.2,
+            )
+            for i in range(5)
+        ]
+
+        with patch("src.tagger.CIRCUIT_FAILURE_THRESHOLD", 2):
+            results = await tagger.tag_clips(contexts, max_concurrent=1)
+
+        assert tagger.tag_clip.call_count == 2
+        assert all(r.primary_tag == ClipTag.B_ROLL for r in results)
+        assert "repeated" in results[-1].reasoning
+
+    @pytest.mark.asyncio
+    async def test_tag_clips_batch_api(self):
+        """Test batch tagging, with missing batch results tagged live."""
+        tagger = ClipTagger(api_key="test-key")
+        mock_client = MockOpenAIClient(
+            chat_response=create_mock_tag_response("cta", 0.8)
+        )
+        tagger.client = mock_client
+
+        contexts = [
+            ClipContext(
+                clip_id=f"test_{i:03d}",
+                transcript=f"Clip {i} transcript with enough text",
+                duration=5.0,
+                position_in_video=i / 25,
+            )
+            for i in range(25)
+        ]
+
+        # The batch returns results for all but the last clip
+        output = "\n".join(
+            json.dumps(
+                {
+                    "custom_id": c.clip_id,
+                    "response": {
+                        "status_code": 200,
+                        "body": {
+                            "choices": [
+                                {"message": {"content": json.dumps({"primary_tag": "hook"})}}
+                            ]
+                        },
+                    },
+                }
+            )
+            for c in contexts[:-1]
+        )
+        mock_client.files = MagicMock()
+        mock_client.files.create = AsyncMock(return_value=SimpleNamespace(id="file-in"))
+        mock_client.files.content = AsyncMock(return_value=SimpleNamespace(text=output))
+        mock_client.files.delete = AsyncMock()
+        mock_client.batches = MagicMock()
+        mock_client.batches.create = AsyncMock(
+            return_value=SimpleNamespace(
+                id="batch-1",
+                status="completed",
+                output_file_id="file-out",
+                error_file_id=None,
+            )
+        )
+
+        results = await tagger.tag_clips(contexts, use_batch_api=True)
+
+        assert [r.clip_id for r in results] == [c.clip_id for c in contexts]
+        assert all(r.primary_tag == ClipTag.HOOK for r in results[:-1])
+        assert results[-1].primary_tag == ClipTag.CTA
+        mock_client.chat.completions.create.assert_called_once()
+        deleted = [c.args[0] for c in mock_client.files.delete.call_args_list]
+        assert deleted == ["file-in", "file-out"]
+
+    @pytest.mark.asyncio
+    async def test_tag_clips_batch_api_failures(self):
+        """Test batch polling retries transient errors and cancels a lost batch."""
+        tagger = ClipTagger(api_key="test-key")
+        mock_client = MockOpenAIClient(
+            chat_response=create_mock_tag_response("cta", 0.8)
+        )
+        tagger.client = mock_client
+
+        contexts = [
+            ClipContext(
+                clip_id=f"test_{i:03d}",
+                transcript=f"Clip {i} transcript with enough text",
+                duration=5.0,
+                position_in_video=i / 25,
+            )
+            for i in range(25)
+        ]
+        running = SimpleNamespace(
+            id="batch-1", status="in_progress", output_file_id=None, error_file_id=None
+        )
+        completed = SimpleNamespace(
+            id="batch-1", status="completed", output_file_id=None, error_file_id=None
+        )
+        mock_client.files = MagicMock()
+        mock_client.files.create = AsyncMock(return_value=SimpleNamespace(id="file-in"))
+        mock_client.files.delete = AsyncMock()
+        mock_client.batches = MagicMock()
+        mock_client.batches.create = AsyncMock(return_value=running)
+        mock_client.batches.cancel = AsyncMock()
+
+        with patch("asyncio.sleep", AsyncMock()):
+            # One failed poll is retried
+            mock_client.batches.retrieve = AsyncMock(
+                side_effect=[ConnectionError("reset"), completed]
+            )
+            await tagger._tag_clips_batch(contexts)
+            mock_client.batches.cancel.assert_not_called()
+
+            # A batch that can't be polled is cancelled before tagging live
+            mock_client.batches.retrieve = AsyncMock(side_effect=ConnectionError("reset"))
+            results = await tagger.tag_clips(contexts, use_batch_api=True)
+
+        mock_client.batches.cancel.assert_awaited_once_with("batch-1")
+        assert len(results) == len(contexts)
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter token bucket."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_within_capacity_does_not_wait(self):
+        """Test that requests within the bucket go out immediately."""
+        limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=6000)
+
+        start = time.monotonic()
+        for _ in range(5):
+            await limiter.acquire(100)
+
+        assert time.monotonic() - start < 0.1
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_token_refill(self):
+        """Test that an exhausted token bucket paces the next request."""
+        # 600 tokens/minute refills 10 tokens per second
+        limiter = RateLimiter(requests_per_minute=600, tokens_per_minute=600)
+        await limiter.acquire(600)
+
+        start = time.monotonic()
+        await limiter.acquire(3)
+
+        assert time.monotonic() - start >= 0.25
+
 
 class TestTagResult:
     """Tests for TagResult model."""
@@ -1,5 +1,6 @@
 """Tests for transcription module."""
 
+import asyncio
 import os
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -7,9 +8,20 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from src.models import TranscriptResult, TranscriptSegment, WordTimestamp
-from src.transcribe import Transcriber, TranscriptionError, transcribe_video
-
-from .mocks.mock_openai import MockOpenAIClient, create_mock_whisper_response
+from src.transcribe import (
+    Transcriber,
+    TranscriptionError,
+    split_transcript,
+    transcribe_video,
+)
+
+from .mocks.mock_openai import (
+    MockOpenAIClient,
+    MockSegment,
+    MockWhisperResponse,
+    MockWord,
+    create_mock_whisper_response,
+)
 
 
 class TestTranscriber:
@@ -34,6 +46,10 @@ class TestTranscriber:
             with pytest.raises(ValueError, match="API key is required"):
                 Transcriber()
 
+    def test_shares_openai_client(self):
+        """Test that transcribers with the same key reuse one OpenAI client."""
+        assert Transcriber(api_key="test-key").client is Transcriber(api_key="test-key").client
+
     @pytest.mark.asyncio
     async def test_extract_audio(self, sample_video_path, temp_dir):
         """Test audio extraction from video."""
@@ -87,6 +103,141 @@ class TestTranscriber:
         assert result.language == "fr"
         mock_client.audio.transcriptions.create.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_transcribe_audio_assigns_words_to_segments(self, sample_audio_path):
+        """Test that each segment gets the words inside its time range."""
+        transcriber = Transcriber(api_key="test-key")
+
+        mock_response = MockWhisperResponse(
+            words=[
+                MockWord(word="Hello", start=0.0, end=0.5),
+                MockWord(word="world.", start=0.5, end=1.0),
+                MockWord(word="Second", start=1.2, end=1.6),
+                MockWord(word="segment.", start=1.6, end=2.0),
+            ],
+            segments=[
+                MockSegment(text=" Hello world.", start=0.0, end=1.0),
+                MockSegment(text=" Second segment.", start=1.2, end=2.0),
+            ],
+        )
+        transcriber.client = MockOpenAIClient(whisper_response=mock_response)
+
+        result = await transcriber.transcribe_audio(sample_audio_path)
+
+        assert [w.word for w in result.segments[0].words] == ["Hello", "world."]
+        assert [w.word for w in result.segments[1].words] == ["Second", "segment."]
+        assert result.segments[1].text == "Second segment."
+
+    @pytest.mark.asyncio
+    async def test_transcribe_audio_uses_cache(self, sample_audio_path, mock_whisper_response):
+        """Test that identical audio is only sent to Whisper once per language."""
+        transcriber = Transcriber(api_key="test-key")
+        mock_client = MockOpenAIClient(whisper_response=mock_whisper_response)
+        transcriber.client = mock_client
+
+        first = await transcriber.transcribe_audio(sample_audio_path)
+        second = await Transcriber(api_key="test-key").transcribe_audio(sample_audio_path)
+        await transcriber.transcribe_audio(sample_audio_path, language="fr")
+
+        assert second == first
+        assert second is not first
+        assert mock_client.audio.transcriptions.create.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_transcribe_batch_splits_per_input(self, sample_audio_path):
+        """Test that batched inputs share one request and get their own timelines."""
+        transcriber = Transcriber(api_key="test-key")
+
+        # Second input starts after the 3s first input and 1s of silence
+        mock_response = MockWhisperResponse(
+            text="One. Two.",
+            words=[
+                MockWord(word="One.", start=0.5, end=1.0),
+                MockWord(word="Two.", start=4.5, end=5.0),
+            ],
+            segments=[
+                MockSegment(text="One.", start=0.0, end=1.0),
+                MockSegment(text="Two.", start=4.2, end=5.0),
+            ],
+        )
+        mock_client = MockOpenAIClient(whisper_response=mock_response)
+        transcriber.client = mock_client
+
+        results = await transcriber.transcribe_batch([sample_audio_path, sample_audio_path])
+
+        assert mock_client.audio.transcriptions.create.call_count == 1
+        assert [r.full_text for r in results] == ["One.", "Two."]
+        assert results[0].words[0].start == pytest.approx(0.5)
+        assert results[1].words[0].start == pytest.approx(0.5, abs=0.1)
+        assert results[1].segments[0].words[0] is results[1].words[0]
+        assert results[0].duration == pytest.approx(3.0, abs=0.1)
+
+    def test_split_transcript_splits_segment_across_join(self):
+        """Test a segment running across the join is split between both inputs."""
+        words = [
+            WordTimestamp(word="One", start=2.0, end=2.5),
+            WordTimestamp(word="two.", start=2.5, end=2.9),
+            WordTimestamp(word="Three", start=4.1, end=4.6),
+            WordTimestamp(word="four.", start=4.6, end=5.0),
+        ]
+        # Whisper ran the end of the first input into the start of the second
+        transcript = TranscriptResult(
+            full_text="One two. Three four.",
+            language="en",
+            duration=6.0,
+            segments=[
+                TranscriptSegment(text="One two. Three four.", start=2.0, end=5.0, words=words),
+            ],
+            words=words,
+        )
+
+        first, second = split_transcript(transcript, [0.0, 4.0], [3.0, 2.0])
+
+        assert first.full_text == "One two."
+        assert [w.word for w in first.segments[0].words] == ["One", "two."]
+        assert first.segments[0].start == pytest.approx(2.0)
+        assert first.segments[0].end == pytest.approx(3.0)
+
+        assert second.full_text == "Three four."
+        assert [w.word for w in second.segments[0].words] == ["Three", "four."]
+        assert second.segments[0].start == pytest.approx(0.0)
+        assert second.segments[0].end == pytest.approx(1.0)
+        assert second.segments[0].words[0] is second.words[0]
+
+        # A segment starting in the silence goes with its words
+        transcript.segments = [
+            TranscriptSegment(text="Three four.", start=3.5, end=5.0, words=words[2:]),
+        ]
+        first, second = split_transcript(transcript, [0.0, 4.0], [3.0, 2.0])
+        assert first.segments == []
+        assert second.segments[0].text == "Three four."
+        assert second.segments[0].start == pytest.approx(0.0)
+
+    @pytest.mark.asyncio
+    async def test_transcribe_chunked_merges_chunks_in_order(self, sample_audio_path):
+        """Test that concurrent chunk results are merged with shifted timestamps."""
+        transcriber = Transcriber(api_key="test-key")
+
+        mock_response = MockWhisperResponse(
+            text="Hi.",
+            words=[MockWord(word="Hi.", start=0.1, end=0.5)],
+            segments=[MockSegment(text="Hi.", start=0.0, end=1.0)],
+        )
+        mock_client = MockOpenAIClient(whisper_response=mock_response)
+        transcriber.client = mock_client
+
+        # Force chunking of the 3-second sample into two chunks
+        with patch("src.transcribe.MAX_AUDIO_SIZE_MB", 0), patch(
+            "src.transcribe.CHUNK_DURATION_SECONDS", 2
+        ):
+            result = await transcriber.transcribe_chunked(sample_audio_path)
+
+        assert mock_client.audio.transcriptions.create.call_count == 2
+        # Offsets come from the muxer's cut points (MP3 frame boundaries)
+        assert [w.start for w in result.words] == pytest.approx([0.1, 2.1], abs=0.1)
+        assert [s.start for s in result.segments] == pytest.approx([0.0, 2.0], abs=0.1)
+        assert result.segments[1].words[0] is result.words[1]
+
     @pytest.mark.asyncio
     async def test_transcribe_video(self, sample_video_path, mock_whisper_response):
         """Test full video transcription."""
@@ -99,6 +250,40 @@ class TestTranscriber:
         assert isinstance(result, TranscriptResult)
         assert result.full_text == mock_whisper_response.text
 
+        # Audio is piped from FFmpeg and uploaded from memory
+        upload = mock_client.audio.transcriptions.create.call_args.kwargs["file"]
+        assert upload[0] == "audio.mp3"
+        assert isinstance(upload[1], bytes) and len(upload[1]) > 0
+
+    @pytest.mark.asyncio
+    async def test_transcribe_video_chunks_oversized_audio(
+        self, sample_video_path, mock_whisper_response
+    ):
+        """Test that audio over the Whisper limit falls back to chunking."""
+        transcriber = Transcriber(api_key="test-key")
+        mock_client = MockOpenAIClient(whisper_response=mock_whisper_response)
+        transcriber.client = mock_client
+
+        create_process = asyncio.create_subprocess_exec
+        with patch("src.transcribe.MAX_AUDIO_SIZE_MB", 0), patch(
+            "src.transcribe.CHUNK_DURATION_SECONDS", 2
+        ), patch(
+            "src.transcribe.asyncio.create_subprocess_exec",
+            side_effect=create_process,
+        ) as spawn:
+            result = await transcriber.transcribe_video(sample_video_path)
+
+        # The audio is encoded once; chunks are cut from that MP3
+        encodes = [c for c in spawn.call_args_list if "libmp3lame" in c.args]
+        assert len(encodes) == 1
+        uploads = [
+            call.kwargs["file"][0]
+            for call in mock_client.audio.transcriptions.create.call_args_list
+        ]
+        assert len(uploads) > 1
+        assert all(name.startswith("chunk_") for name in uploads)
+        assert result.duration == pytest.approx(5.0, abs=0.2)
+
 
 class TestTranscriptResult:
     """Tests for TranscriptResult model."""